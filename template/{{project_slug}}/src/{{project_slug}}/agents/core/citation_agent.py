@@ -31,6 +31,8 @@ class CitationAgent:
     Phase 3: Votes on whether the synthesis properly grades evidence.
     """
 
+    needs_strategy = False
+
     def __init__(self, llm_client=None):
         self._llm = llm_client
 
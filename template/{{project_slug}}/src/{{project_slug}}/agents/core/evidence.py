@@ -32,6 +32,8 @@ class EvidenceAgent:
     Phase 3 (Voting): Votes on evidence quality in the synthesis.
     """
 
+    needs_strategy = False
+
     def __init__(self, llm_client=None):
         self._llm = llm_client
 
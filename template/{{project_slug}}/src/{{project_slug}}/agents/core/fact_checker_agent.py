@@ -32,6 +32,8 @@ class FactCheckerAgent:
     Phase 3: Votes on whether the synthesis avoids speculation.
     """
 
+    needs_strategy = False
+
     def __init__(self, llm_client=None):
         self._llm = llm_client
 
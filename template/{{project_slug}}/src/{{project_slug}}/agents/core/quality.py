@@ -32,6 +32,8 @@ class QualityAgent:
     Phase 3 (Voting): Votes on whether the synthesis is complete.
     """
 
+    needs_strategy = False
+
     def __init__(self, llm_client=None):
         self._llm = llm_client
 
@@ -32,6 +32,8 @@ class SkepticAgent:
     Phase 3 (Voting): Votes based on reasoning soundness, not consensus.
     """
 
+    needs_strategy = False
+
     def __init__(self, llm_client=None):
         self._llm = llm_client
 
@@ -21,6 +21,7 @@ Usage:
 import json
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
@@ -30,6 +31,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_PERSIST_PATH = Path(".aiscaffold/agents.json")
 
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> frozenset[str]:
+    """Lowercased word set, for set-intersection matching against queries."""
+    return frozenset(_WORD.findall(text.lower()))
+
 
 @runtime_checkable
 class AgentLike(Protocol):
@@ -64,6 +72,9 @@ class AgentEntry:
         self.healthy = True
         self.visibility = visibility
         self.tenant_id = tenant_id
+        # Precomputed once so routing is set intersection, not substring scans
+        self.domain_tokens = tokenize(agent.domain)
+        self.capability_tokens = [(cap, tokenize(cap)) for cap in self.capabilities]
 
     def to_dict(self) -> dict:
         """Serialize for API responses."""
@@ -20,7 +20,6 @@ Reference: src/api/models/requests.py for the contract.
 """
 
 import logging
-from dataclasses import asdict
 from typing import Any
 
 import httpx
@@ -32,6 +31,7 @@ from ..orchestration.round_table import (
     RoundTableTask,
     SynthesisResult,
 )
+from ..llm.json_parser import to_json
 from ..security.prompt_guard import detect_injection_attempt, sanitize_for_prompt
 
 logger = logging.getLogger(__name__)
@@ -118,15 +118,21 @@ class RemoteAgent:
         return sanitized
 
     async def _post(self, endpoint: str, payload: dict) -> dict:
-        """Send POST request with retries, size limits, and structured error handling."""
+        """
+        Send POST request with retries, size limits, and structured error handling.
+
+        payload may hold dataclasses; the body is encoded once, in one
+        pass, and reused by every retry.
+        """
         url = f"{self._base_url}/{endpoint.lstrip('/')}"
+        body = to_json(payload).encode("utf-8")
         last_error: Exception | None = None
 
         for attempt in range(MAX_RETRIES + 1):
             try:
                 async with httpx.AsyncClient(timeout=self._timeout) as client:
                     response = await client.post(
-                        url, json=payload, headers=self._headers()
+                        url, content=body, headers=self._headers()
                     )
                     response.raise_for_status()
 
@@ -192,7 +198,7 @@ class RemoteAgent:
         payload = {
             "task_id": task.id,
             "content": task.content,
-            "other_analyses": [asdict(a) for a in other_analyses],
+            "other_analyses": other_analyses,
         }
         data = await self._post("challenge", payload)
         return AgentChallenge(
@@ -212,7 +218,7 @@ class RemoteAgent:
         payload = {
             "task_id": task.id,
             "content": task.content,
-            "synthesis": asdict(synthesis),
+            "synthesis": synthesis,
         }
         data = await self._post("vote", payload)
         dissent = data.get("dissent_reason")
@@ -30,6 +30,7 @@ from ..agents.registry import AgentRegistry
 from ..learning.agent_trust import AgentTrustManager
 from ..learning.checkin_manager import CheckInManager
 from ..learning.feedback_tracker import FeedbackTracker
+from ..learning.schema import close_all as close_learning_db
 from ..learning.schema import initialize_schema as init_learning_db
 from ..learning.user_profile import UserProfileManager
 from ..llm import create_client as create_llm_client
@@ -79,7 +80,7 @@ def create_app(
         round_table_config: Round table configuration (creates default if None).
     """
     global _start_time
-    _start_time = time.time()
+    _start_time = time.monotonic()
 
     check_production_auth()
 
@@ -112,12 +113,21 @@ def create_app(
         logger.warning(f"[Gateway] LLM client init failed (non-fatal): {e}")
         llm_client = None
 
+    async def close_llm_client() -> None:
+        # Routes may have created the client lazily, so look it up at shutdown
+        client = getattr(application.state, "llm_client", None)
+        if client is not None:
+            await client.aclose()
+
+    application.router.on_shutdown.append(close_llm_client)
+
     try:
         init_learning_db()
         application.state.feedback_tracker = FeedbackTracker()
         application.state.trust_manager = AgentTrustManager()
         application.state.checkin_manager = CheckInManager()
         application.state.profile_manager = UserProfileManager()
+        application.router.on_shutdown.append(close_learning_db)
         logger.info("[Gateway] Learning system initialized")
     except Exception as e:
         logger.warning(f"[Gateway] Learning system init failed (non-fatal): {e}")
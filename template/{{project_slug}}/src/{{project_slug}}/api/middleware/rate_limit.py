@@ -36,7 +36,7 @@ _last_global_cleanup: float = 0.0
 
 def _cleanup_old_entries(client_id: str, window_seconds: float = 60.0) -> None:
     """Remove request timestamps older than the window."""
-    cutoff = time.time() - window_seconds
+    cutoff = time.monotonic() - window_seconds
     _request_log[client_id] = [
         ts for ts in _request_log[client_id] if ts > cutoff
     ]
@@ -48,7 +48,7 @@ def _global_cleanup(window_seconds: float = 60.0) -> None:
     Runs at most once per GLOBAL_CLEANUP_INTERVAL seconds.
     """
     global _last_global_cleanup
-    now = time.time()
+    now = time.monotonic()
     if now - _last_global_cleanup < GLOBAL_CLEANUP_INTERVAL:
         return
 
@@ -104,4 +104,4 @@ async def check_rate_limit(request: Request) -> None:
             headers={"Retry-After": "60"},
         )
 
-    _request_log[client_ip].append(time.time())
+    _request_log[client_ip].append(time.monotonic())
@@ -96,7 +96,10 @@ def _get_or_create_orchestrator(
         _orchestrators.move_to_end(key)
         return _orchestrators[key]
 
-    llm = getattr(request.app.state, "llm_client", None) or create_client()
+    llm = getattr(request.app.state, "llm_client", None)
+    if llm is None:
+        # Created once and kept, so requests share its connection pool
+        llm = request.app.state.llm_client = create_client()
     registry = request.app.state.registry
     agent_router = AgentRouter(registry=registry)
     _orchestrators[key] = ChatOrchestrator(
@@ -108,7 +111,7 @@ def _get_or_create_orchestrator(
     while len(_orchestrators) > MAX_SESSIONS:
         _orchestrators.popitem(last=False)
 
-    logger.debug(f"[ChatAPI] Created orchestrator for session {key}")
+    logger.debug("[ChatAPI] Created orchestrator for session %s", key)
     return _orchestrators[key]
 
 
@@ -98,6 +98,10 @@ async def record_feedback(
     if trust_mgr and signal.agent_id:
         trust_mgr.update_from_signal(signal)
 
+    profile_mgr = getattr(request.app.state, "profile_manager", None)
+    if profile_mgr:
+        profile_mgr.invalidate()
+
     return FeedbackResponse(
         id=recorded.id,
         signal_type=recorded.signal_type,
@@ -22,7 +22,7 @@ router = APIRouter()
 async def liveness(request: Request) -> HealthResponse:
     """Liveness probe -- returns 200 if the process is running."""
     registry = request.app.state.registry
-    start_time = getattr(request.app.state, "start_time", time.time())
+    start_time = getattr(request.app.state, "start_time", time.monotonic())
     healthy_count = sum(
         1 for e in registry.get_all_entries() if e.healthy
     )
@@ -30,7 +30,7 @@ async def liveness(request: Request) -> HealthResponse:
         status="healthy",
         agents_registered=registry.count,
         agents_healthy=healthy_count,
-        uptime_seconds=round(time.time() - start_time, 1),
+        uptime_seconds=round(time.monotonic() - start_time, 1),
     )
 
 
@@ -118,7 +118,10 @@ async def submit_task(
     )
 
     try:
-        llm = getattr(request.app.state, "llm_client", None) or create_client()
+        llm = getattr(request.app.state, "llm_client", None)
+        if llm is None:
+            # Created once and kept, so requests share its connection pool
+            llm = request.app.state.llm_client = create_client()
         rt = RoundTable(agents=agents, config=config, llm_client=llm)
         result = await rt.run(task)
 
@@ -105,7 +105,7 @@ async def add_turn(
     ))
     thread.add_turn(turn)
 
-    logger.debug(f"[SessionsAPI] Added turn {turn_id} to {session_id}")
+    logger.debug("[SessionsAPI] Added turn %s to %s", turn_id, session_id)
     return SessionResponse(
         session_id=thread.id,
         status=thread.status,
@@ -34,7 +34,9 @@ MAX_PENDING_RESULTS = 500
 MAX_PAYLOAD_BYTES = 5_000_000
 RESULT_TTL_SECONDS = 3600
 
-_pending_results: OrderedDict[str, dict] = OrderedDict()
+# task key -> (time.monotonic() at receipt, result); the stamp is for the TTL
+# only and never reaches callers, whose payload carries wall-clock received_at
+_pending_results: OrderedDict[str, tuple[float, dict]] = OrderedDict()
 
 
 def _get_webhook_secret() -> str | None:
@@ -50,10 +52,10 @@ def _verify_signature(payload_bytes: bytes, signature: str, secret: str) -> bool
 
 def _evict_expired() -> None:
     """Remove expired entries from pending results."""
-    now = time.time()
+    now = time.monotonic()
     expired_keys = [
-        k for k, v in _pending_results.items()
-        if now - v.get("_received_at_ts", 0) > RESULT_TTL_SECONDS
+        k for k, (received, _) in _pending_results.items()
+        if now - received > RESULT_TTL_SECONDS
     ]
     for k in expired_keys:
         del _pending_results[k]
@@ -62,8 +64,7 @@ def _evict_expired() -> None:
 def _store_result(task_key: str, data: dict) -> None:
     """Store result with LRU eviction and TTL."""
     _evict_expired()
-    data["_received_at_ts"] = time.time()
-    _pending_results[task_key] = data
+    _pending_results[task_key] = (time.monotonic(), data)
     while len(_pending_results) > MAX_PENDING_RESULTS:
         _pending_results.popitem(last=False)
 
@@ -131,4 +132,5 @@ def get_pending_result(task_id: str, agent_id: str, phase: str) -> dict | None:
     """Retrieve a pending webhook result (used by the orchestrator)."""
     _evict_expired()
     task_key = f"{task_id}:{agent_id}:{phase}"
-    return _pending_results.pop(task_key, None)
+    entry = _pending_results.pop(task_key, None)
+    return entry[1] if entry is not None else None
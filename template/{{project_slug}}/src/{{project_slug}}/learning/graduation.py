@@ -11,17 +11,18 @@ Uses a pluggable GraduationRule protocol. Ships with one built-in rule:
 Projects add domain-specific rules by implementing the protocol.
 Graduation ALWAYS requires user confirmation via CheckInManager.
 
-Keep this file under 200 lines.
+Keep this file under 300 lines.
 """
 
 import logging
+import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
 from .checkin_manager import CheckInManager
 from .global_profile import GlobalProfileManager
-from .schema import DEFAULT_DB_PATH, get_connection
+from .schema import DEFAULT_DB_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,8 @@ class GraduationRule(Protocol):
     domain-specific graduation logic.
 
     A rule examines project data and returns candidates for graduation.
+    The engine opens one read-only connection per scan and shares it
+    across all rules, so rules should not close it.
     """
 
     @property
@@ -48,7 +51,7 @@ class GraduationRule(Protocol):
         ...
 
     def find_candidates(
-        self, project_id: str, db_path: Path
+        self, project_id: str, conn: sqlite3.Connection
     ) -> list["GraduationCandidate"]:
         """Find preferences that should be considered for graduation."""
         ...
@@ -95,50 +98,38 @@ class ConsistencyRule:
         return "consistency"
 
     def find_candidates(
-        self, project_id: str, db_path: Path
+        self, project_id: str, conn: sqlite3.Connection
     ) -> list[GraduationCandidate]:
         """Find preferences that have been stable across multiple sessions."""
-        conn = get_connection(db_path)
-        try:
-            rows = conn.execute(
-                """SELECT key, value, source, priority, created_at, updated_at
-                   FROM user_preferences
-                   WHERE project_id = ? AND active = 1 AND priority >= ?
-                   ORDER BY priority DESC""",
-                (project_id, self._min_priority),
-            ).fetchall()
-
-            signal_count_row = conn.execute(
-                """SELECT COUNT(DISTINCT session_id) as sessions
+        rows = conn.execute(
+            """WITH sessions AS (
+                   SELECT COUNT(DISTINCT session_id) AS n
                    FROM feedback_signals
-                   WHERE project_id = ? AND session_id != ''""",
-                (project_id,),
-            ).fetchone()
-            total_sessions = signal_count_row["sessions"] if signal_count_row else 0
-
-        finally:
-            conn.close()
-
-        if total_sessions < self._min_sessions:
-            return []
+                   WHERE project_id = ? AND session_id != ''
+               )
+               SELECT p.key, p.value, p.source, p.priority, sessions.n
+               FROM user_preferences p, sessions
+               WHERE p.project_id = ? AND p.active = 1 AND p.priority >= ?
+                 AND p.created_at = p.updated_at AND sessions.n >= ?
+               ORDER BY p.priority DESC""",
+            (project_id, project_id, self._min_priority, self._min_sessions),
+        ).fetchall()
 
         candidates = []
-        for row in rows:
-            data = dict(row)
-            if data.get("created_at") == data.get("updated_at"):
-                confidence = min(total_sessions / (self._min_sessions * 2), 1.0)
-                candidates.append(GraduationCandidate(
-                    key=data["key"],
-                    value=data["value"],
-                    source_project=project_id,
-                    rule_name=self.name,
-                    confidence=confidence,
-                    evidence=(
-                        f"Stable across {total_sessions} sessions, "
-                        f"priority {data.get('priority', 0)}, "
-                        f"source: {data.get('source', 'unknown')}"
-                    ),
-                ))
+        for key, value, source, priority, total_sessions in rows:
+            confidence = min(total_sessions / (self._min_sessions * 2), 1.0)
+            candidates.append(GraduationCandidate(
+                key=key,
+                value=value,
+                source_project=project_id,
+                rule_name=self.name,
+                confidence=confidence,
+                evidence=(
+                    f"Stable across {total_sessions} sessions, "
+                    f"priority {priority}, "
+                    f"source: {source}"
+                ),
+            ))
 
         return candidates
 
@@ -161,9 +152,13 @@ class GraduationEngine:
         # Find candidates
         candidates = engine.find_all_candidates()
 
-        # Apply (creates check-in for user confirmation)
-        for candidate in candidates:
-            engine.propose_graduation(candidate)
+        # Propose (creates check-in for user confirmation)
+        proposals = {engine.propose_graduation(c): c for c in candidates}
+
+        # approved_ids: the check-in IDs the user approved (CheckInManager.respond);
+        # write those candidates to the global profile in one batch
+        confirmed = [proposals[checkin_id] for checkin_id in approved_ids]
+        engine.apply_graduations(confirmed)
     """
 
     def __init__(
@@ -182,23 +177,32 @@ class GraduationEngine:
     def add_rule(self, rule: GraduationRule) -> None:
         """Add a custom graduation rule."""
         self._rules.append(rule)
-        logger.info(f"[Graduation] Added rule: {rule.name}")
+        logger.info("[Graduation] Added rule: %s", rule.name)
 
     def find_all_candidates(self) -> list[GraduationCandidate]:
         """Run all rules and collect candidates."""
         all_candidates = []
-        for rule in self._rules:
-            try:
-                candidates = rule.find_candidates(self._project_id, self._db_path)
-                all_candidates.extend(candidates)
-                logger.debug(
-                    f"[Graduation] Rule '{rule.name}' found "
-                    f"{len(candidates)} candidates"
-                )
-            except Exception as e:
-                logger.error(f"[Graduation] Rule '{rule.name}' failed: {e}")
+        conn = self._read_connection()
+        try:
+            for rule in self._rules:
+                try:
+                    candidates = rule.find_candidates(self._project_id, conn)
+                    all_candidates.extend(candidates)
+                    logger.debug(
+                        "[Graduation] Rule '%s' found %d candidates",
+                        rule.name, len(candidates),
+                    )
+                except Exception as e:
+                    logger.error("[Graduation] Rule '%s' failed: %s", rule.name, e)
+        finally:
+            conn.close()
         return all_candidates
 
+    def _read_connection(self) -> sqlite3.Connection:
+        """Open the project database read-only for a graduation scan."""
+        uri = f"{self._db_path.resolve().as_uri()}?mode=ro"
+        return sqlite3.connect(uri, uri=True)
+
     def propose_graduation(self, candidate: GraduationCandidate) -> str:
         """
         Create a check-in to ask the user about graduating a preference.
@@ -224,20 +228,33 @@ class GraduationEngine:
             },
         )
         logger.info(
-            f"[Graduation] Proposed: {candidate.key}={candidate.value} "
-            f"(check-in {checkin.id})"
+            "[Graduation] Proposed: %s=%s (check-in %s)",
+            candidate.key, candidate.value, checkin.id,
         )
         return checkin.id
 
     def apply_graduation(self, candidate: GraduationCandidate) -> None:
         """Apply a graduated preference to the global profile."""
-        self._global.add_global_preference(
-            key=candidate.key,
-            value=candidate.value,
-            source_project=candidate.source_project,
-            confidence=candidate.confidence,
-        )
-        logger.info(
-            f"[Graduation] Applied: {candidate.key}={candidate.value} "
-            f"to global profile"
+        self.apply_graduations([candidate])
+
+    def apply_graduations(self, candidates: list[GraduationCandidate]) -> int:
+        """
+        Apply several graduated preferences in a single transaction.
+
+        Returns the number of preferences written to the global profile.
+        """
+        applied = self._global.add_global_preferences(
+            {
+                "key": c.key,
+                "value": c.value,
+                "source_project": c.source_project,
+                "confidence": c.confidence,
+            }
+            for c in candidates
         )
+        if applied:
+            logger.info(
+                "[Graduation] Applied %d of %d candidates to global profile",
+                applied, len(candidates),
+            )
+        return applied
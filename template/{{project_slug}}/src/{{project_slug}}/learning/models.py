@@ -8,12 +8,36 @@ universal signal types that every project needs.
 Keep this file under 200 lines.
 """
 
-import uuid
+import secrets
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any
 
 
+# =============================================================================
+# TIMESTAMPS
+# =============================================================================
+
+_second_prefix: tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """
+    Current local time as ISO 8601 with microseconds.
+
+    Same format as datetime.now().isoformat(), without building a datetime.
+    The "YYYY-MM-DDTHH:MM:SS" prefix is formatted once per second and reused.
+    """
+    global _second_prefix
+    t = time.time()
+    second = int(t)
+    cached_second, prefix = _second_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _second_prefix = (second, prefix)
+    return f"{prefix}.{int((t - second) * 1_000_000):06d}"
+
+
 # =============================================================================
 # SIGNAL TYPES (universal across all domains)
 # =============================================================================
@@ -45,7 +69,7 @@ class CheckInStatus:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackSignal:
     """
     Atomic feedback unit -- records a user's reaction to an agent output.
@@ -66,8 +90,8 @@ class FeedbackSignal:
     confidence: float = 0.5
     metadata: dict[str, Any] = field(default_factory=dict)
     session_id: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:12])
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = field(default_factory=lambda: secrets.token_hex(6))
+    created_at: str = field(default_factory=now_iso)
 
 
 # =============================================================================
@@ -96,9 +120,9 @@ class UserPreference:
     priority: int = 50
     active: bool = True
     metadata: dict[str, Any] = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:12])
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = field(default_factory=lambda: secrets.token_hex(6))
+    created_at: str = field(default_factory=now_iso)
+    updated_at: str = field(default_factory=now_iso)
 
 
 # =============================================================================
@@ -106,7 +130,7 @@ class UserPreference:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTrustScore:
     """
     Trust score for an agent -- updated by feedback signals.
@@ -123,7 +147,7 @@ class AgentTrustScore:
     acceptance_rate: float = 0.5
     last_signal_type: str = ""
     metadata: dict[str, Any] = field(default_factory=dict)
-    last_updated: str = field(default_factory=lambda: datetime.now().isoformat())
+    last_updated: str = field(default_factory=now_iso)
 
 
 # =============================================================================
@@ -131,7 +155,7 @@ class AgentTrustScore:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckIn:
     """
     Permission prompt -- asks the user before adapting behavior.
@@ -152,7 +176,7 @@ class CheckIn:
     status: str = CheckInStatus.PENDING
     response: str = ""
     context: dict[str, Any] = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:12])
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = field(default_factory=lambda: secrets.token_hex(6))
+    created_at: str = field(default_factory=now_iso)
     expires_at: str = ""
     resolved_at: str = ""
@@ -0,0 +1,84 @@
+"""
+EmbeddingCache -- Persistent content-hash -> embedding cache.
+
+Backed by the embedding_cache table in the learning database. Vectors are
+keyed by (producing model, BLAKE2b hash of the embedded text), so
+re-indexing unchanged documents skips the model/API call entirely, and
+embedders sharing one database keep separate entries.
+Vectors are stored as float32 bytes (4 bytes per value).
+
+Keep this file under 100 lines.
+"""
+
+import hashlib
+import logging
+import sqlite3
+from array import array
+from pathlib import Path
+
+from ..models import now_iso
+from ..schema import DEFAULT_DB_PATH, get_connection
+
+logger = logging.getLogger(__name__)
+
+# Stay well under SQLite's bound-parameter limit for IN (...) lookups.
+LOOKUP_CHUNK_SIZE = 500
+
+
+def content_hash(text: str) -> str:
+    """Non-cryptographic 128-bit content hash used as the cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Look up and store embeddings by content hash.
+
+    Usage:
+        cache = EmbeddingCache(db_path)
+        found = cache.get_many("local", [content_hash(t) for t in texts])
+        cache.put_many("local", {content_hash(text): vector})
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH):
+        self._db_path = db_path
+
+    def get_many(self, model: str, hashes: list[str]) -> dict[str, list[float]]:
+        """Return cached vectors for the given hashes (misses are omitted)."""
+        found: dict[str, list[float]] = {}
+        conn = get_connection(self._db_path)
+        try:
+            for start in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+                chunk = hashes[start:start + LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""SELECT hash, vector FROM embedding_cache
+                        WHERE model = ? AND hash IN ({placeholders})""",
+                    (model, *chunk),
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        except sqlite3.OperationalError:
+            # Schema not initialized for this database; behave as all-miss.
+            return {}
+        return found
+
+    def put_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        """Store vectors for model keyed by content hash, replacing older entries."""
+        if not vectors:
+            return
+        now = now_iso()
+        try:
+            with get_connection(self._db_path) as conn:
+                conn.executemany(
+                    """INSERT OR REPLACE INTO embedding_cache
+                       (model, hash, dim, vector, created_at)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    [
+                        (model, key, len(vector), array("f", vector).tobytes(), now)
+                        for key, vector in vectors.items()
+                    ],
+                )
+        except sqlite3.OperationalError as e:
+            # A failed write only costs a re-embed next time
+            logger.warning("[EmbeddingCache] Write failed (%d vectors): %s", len(vectors), e)
@@ -6,15 +6,25 @@ Provider priority:
   2. OpenAI (text-embedding-3-small) -- high quality, ~1536 dimensions
   3. Deterministic fallback -- hash-based, works without any dependencies
 
+If the configured provider fails on a call, that call's vectors come
+from the hash fallback and are marked provider="fallback"; they are
+never cached, so the next call retries the real provider.
+
 Caching: embeddings are cached in-memory (LRU) to avoid recomputing.
+Cached vectors are packed into array("d") buffers (8 bytes per value
+instead of a boxed float per element) and unpacked to lists on return.
+Fallback vectors are cached as their raw hash bytes (1 byte per value);
+embed_int8() exposes that int8 form directly.
 All providers produce normalized vectors suitable for cosine similarity.
 
-Keep this file under 250 lines.
+Keep this file under 350 lines.
 """
 
 import hashlib
 import logging
+import math
 import os
+from array import array
 from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
@@ -23,6 +33,17 @@ logger = logging.getLogger(__name__)
 
 MAX_CACHE_SIZE = 5000
 MAX_TEXT_LENGTH = 8000
+LOCAL_BATCH_SIZE = 64
+MAX_RAW_KEY_LENGTH = 256
+LOCAL_MODEL = "all-MiniLM-L6-v2"
+OPENAI_MODEL = "text-embedding-3-small"
+FALLBACK_PROVIDER = "fallback"
+
+# Maps an unsigned hash byte b to the signed byte b - 128 (two's complement).
+_UNSIGNED_TO_SIGNED = bytes(b ^ 0x80 for b in range(256))
+
+# Fallback byte -> component in [-0.5, 0.5], precomputed for all 256 values.
+_BYTE_TO_UNIT = tuple(b / 255.0 - 0.5 for b in range(256))
 
 
 @dataclass
@@ -49,10 +70,11 @@ class EmbeddingService:
     """
 
     def __init__(self, preferred_provider: str | None = None):
-        self._provider: str = "fallback"
+        self._provider: str = FALLBACK_PROVIDER
+        self._model_name: str = FALLBACK_PROVIDER
         self._model: Any = None
         self._openai_client: Any = None
-        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._cache: OrderedDict[str | bytes, array | bytes] = OrderedDict()
         self._dimensions: int = 0
 
         self._init_provider(preferred_provider)
@@ -67,7 +89,8 @@ class EmbeddingService:
             if self._try_local():
                 return
 
-        self._provider = "fallback"
+        self._provider = FALLBACK_PROVIDER
+        self._model_name = FALLBACK_PROVIDER
         self._dimensions = 128
         logger.info(
             "[Embeddings] Using deterministic fallback (hash-based). "
@@ -79,8 +102,9 @@ class EmbeddingService:
         try:
             from sentence_transformers import SentenceTransformer
 
-            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+            self._model = SentenceTransformer(LOCAL_MODEL)
             self._provider = "local"
+            self._model_name = LOCAL_MODEL
             self._dimensions = 384
             logger.info("[Embeddings] Using local sentence-transformers (384d)")
             return True
@@ -97,6 +121,7 @@ class EmbeddingService:
                 return False
             self._openai_client = openai.OpenAI(api_key=api_key)
             self._provider = "openai"
+            self._model_name = OPENAI_MODEL
             self._dimensions = 1536
             logger.info("[Embeddings] Using OpenAI text-embedding-3-small (1536d)")
             return True
@@ -107,93 +132,182 @@ class EmbeddingService:
         """Generate an embedding for a single text."""
         text = text[:MAX_TEXT_LENGTH].strip()
         if not text:
-            return EmbeddingResult(
-                embedding=[0.0] * self._dimensions,
-                dimensions=self._dimensions,
-                provider=self._provider,
-            )
+            return self._result([0.0] * self._dimensions)
 
         cache_key = self._cache_key(text)
-        if cache_key in self._cache:
-            self._cache.move_to_end(cache_key)
-            return EmbeddingResult(
-                embedding=self._cache[cache_key],
-                dimensions=self._dimensions,
-                provider=self._provider,
-                cached=True,
-            )
-
-        if self._provider == "local":
-            vector = self._embed_local(text)
-        elif self._provider == "openai":
-            vector = self._embed_openai(text)
+        hit = self._cache_get(cache_key)
+        if hit is not None:
+            return self._result(hit, cached=True)
+
+        if self._provider == FALLBACK_PROVIDER:
+            packed: array | bytes = self._fallback_digest(text)
         else:
-            vector = self._embed_fallback(text)
+            embed = self._embed_local if self._provider == "local" else self._embed_openai
+            vector = self._call_provider(embed, text)
+            if vector is None:
+                return self._result(self._embed_fallback(text), provider=FALLBACK_PROVIDER)
+            packed = array("d", vector)
 
-        self._cache_put(cache_key, vector)
+        self._cache_put(cache_key, packed)
+        return self._result(self._unpack(packed))
 
+    def embed_batch(self, texts: list[str]) -> list[EmbeddingResult]:
+        """
+        Generate embeddings for multiple texts.
+
+        Cache misses are embedded with one provider call (a single
+        encode() batch or a single API request) and returned in input order.
+        """
+        results: list[EmbeddingResult | None] = [None] * len(texts)
+        misses: dict[str, list[int]] = {}
+        for i, raw in enumerate(texts):
+            text = raw[:MAX_TEXT_LENGTH].strip()
+            if not text:
+                results[i] = self._result([0.0] * self._dimensions)
+                continue
+            hit = self._cache_get(self._cache_key(text))
+            if hit is not None:
+                results[i] = self._result(hit, cached=True)
+                continue
+            misses.setdefault(text, []).append(i)
+
+        if misses:
+            pending = list(misses)
+            if self._provider == FALLBACK_PROVIDER:
+                packed_all: list[array | bytes] = [self._fallback_digest(t) for t in pending]
+            else:
+                embed_batch = (
+                    self._embed_local_batch if self._provider == "local" else self._embed_openai_batch
+                )
+                vectors = self._call_provider(embed_batch, pending)
+                if vectors is None:
+                    for text in pending:
+                        fallback = self._result(self._embed_fallback(text), provider=FALLBACK_PROVIDER)
+                        for i in misses[text]:
+                            results[i] = fallback
+                    return results  # type: ignore[return-value]
+                packed_all = [array("d", v) for v in vectors]
+            for text, packed in zip(pending, packed_all):
+                self._cache_put(self._cache_key(text), packed)
+                vector = self._unpack(packed)
+                for i in misses[text]:
+                    results[i] = self._result(vector)
+
+        return results  # type: ignore[return-value]
+
+    def embed_int8(self, text: str) -> array:
+        """
+        Int8 embedding (array("b")) for compact storage and integer dot products.
+
+        Fallback vectors are the raw hash bytes re-centred on zero, so no
+        precision is lost; other providers' unit vectors are scaled by 127.
+        """
+        text = text[:MAX_TEXT_LENGTH].strip()
+        if self._provider == FALLBACK_PROVIDER and text:
+            digest = self._fallback_digest(text)
+            return array("b", digest.translate(_UNSIGNED_TO_SIGNED))
+        return array("b", [round(v * 127) for v in self.embed(text).embedding])
+
+    def _result(
+        self, vector: list[float], cached: bool = False, provider: str | None = None
+    ) -> EmbeddingResult:
         return EmbeddingResult(
             embedding=vector,
             dimensions=self._dimensions,
-            provider=self._provider,
+            provider=provider or self._provider,
+            cached=cached,
         )
 
-    def embed_batch(self, texts: list[str]) -> list[EmbeddingResult]:
-        """Generate embeddings for multiple texts."""
-        return [self.embed(t) for t in texts]
+    def _call_provider(self, embed: Any, arg: Any) -> Any:
+        """embed(arg) with the configured provider; None (logged) if the call failed."""
+        try:
+            return embed(arg)
+        except Exception as e:
+            logger.warning("[Embeddings] %s embedding failed, using fallback: %s", self._provider, e)
+            return None
 
     def _embed_local(self, text: str) -> list[float]:
         """Generate embedding using local sentence-transformers."""
-        try:
-            vector = self._model.encode(text, normalize_embeddings=True)
-            return vector.tolist()
-        except Exception as e:
-            logger.warning(f"[Embeddings] Local embedding failed: {e}")
-            return self._embed_fallback(text)
+        return self._model.encode(text, normalize_embeddings=True).tolist()
+
+    def _embed_local_batch(self, texts: list[str]) -> list[list[float]]:
+        """Encode many texts in one sentence-transformers call."""
+        matrix = self._model.encode(
+            texts, normalize_embeddings=True, batch_size=LOCAL_BATCH_SIZE
+        )
+        return matrix.tolist()
 
     def _embed_openai(self, text: str) -> list[float]:
         """Generate embedding using OpenAI API."""
-        try:
-            response = self._openai_client.embeddings.create(
-                input=text,
-                model="text-embedding-3-small",
-            )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.warning(f"[Embeddings] OpenAI embedding failed: {e}")
-            return self._embed_fallback(text)
+        response = self._openai_client.embeddings.create(input=text, model=OPENAI_MODEL)
+        return response.data[0].embedding
+
+    def _embed_openai_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed many texts with one OpenAI request (data is in input order)."""
+        response = self._openai_client.embeddings.create(input=texts, model=OPENAI_MODEL)
+        return [d.embedding for d in response.data]
 
     def _embed_fallback(self, text: str) -> list[float]:
         """Deterministic hash-based embedding (always available)."""
-        h = hashlib.sha256(text.encode()).hexdigest()
-        vector = []
-        for i in range(0, min(len(h), self._dimensions * 2), 2):
-            val = int(h[i : i + 2], 16) / 255.0 - 0.5
-            vector.append(val)
-        while len(vector) < self._dimensions:
-            ext = hashlib.sha256(f"{text}_{len(vector)}".encode()).hexdigest()
-            for i in range(0, min(len(ext), (self._dimensions - len(vector)) * 2), 2):
-                vector.append(int(ext[i : i + 2], 16) / 255.0 - 0.5)
-
-        norm = sum(v * v for v in vector) ** 0.5
+        return self._dequantize(self._fallback_digest(text))
+
+    def _fallback_digest(self, text: str) -> bytes:
+        """One hash byte per dimension; the quantized form of the fallback vector."""
+        return hashlib.shake_128(text.encode()).digest(self._dimensions)
+
+    def _unpack(self, packed: array | bytes) -> list[float]:
+        """Turn a cache entry back into the list[float] returned to callers."""
+        if isinstance(packed, bytes):
+            return self._dequantize(packed)
+        return packed.tolist()
+
+    @staticmethod
+    def _dequantize(digest: bytes) -> list[float]:
+        """Map hash bytes into [-0.5, 0.5] and normalize to a unit vector."""
+        vector = list(map(_BYTE_TO_UNIT.__getitem__, digest))
+        norm = math.hypot(*vector)
         if norm > 0:
-            vector = [v / norm for v in vector[: self._dimensions]]
+            vector = [v / norm for v in vector]
         return vector
 
-    def _cache_key(self, text: str) -> str:
-        """Generate cache key from text content (not used for security)."""
-        return hashlib.md5(text.encode(), usedforsecurity=False).hexdigest()
-
-    def _cache_put(self, key: str, vector: list[float]) -> None:
-        """Store in LRU cache with eviction."""
-        self._cache[key] = vector
+    def _cache_key(self, text: str) -> str | bytes:
+        """
+        Cache key for text content (not used for security).
+
+        Short texts are their own key; longer ones use a 16-byte BLAKE2b
+        digest so the cache doesn't pin large strings in memory.
+        """
+        if len(text) <= MAX_RAW_KEY_LENGTH:
+            return text
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def _cache_get(self, key: str | bytes) -> list[float] | None:
+        """Return the cached vector (marking it recently used), or None."""
+        packed = self._cache.get(key)
+        if packed is None:
+            return None
+        self._cache.move_to_end(key)
+        return self._unpack(packed)
+
+    def _cache_put(self, key: str | bytes, packed: array | bytes) -> None:
+        """Store a packed vector in the LRU cache with eviction."""
+        self._cache[key] = packed
         while len(self._cache) > MAX_CACHE_SIZE:
             self._cache.popitem(last=False)
 
+    def cache_clear(self) -> None:
+        """Drop all cached embeddings."""
+        self._cache.clear()
+
     @property
     def provider(self) -> str:
         return self._provider
 
+    @property
+    def model_name(self) -> str:
+        """Model that produced this service's vectors (persistent cache key)."""
+        return self._model_name
+
     @property
     def dimensions(self) -> int:
         return self._dimensions
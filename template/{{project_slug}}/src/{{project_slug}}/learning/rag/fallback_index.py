@@ -0,0 +1,350 @@
+"""
+FallbackIndex -- Column-oriented in-memory document store for VectorStore.
+
+Used when ChromaDB is not installed. Documents are kept as parallel lists
+(ids, contents, metadatas, embeddings) plus an id -> position map, so
+upserts and deletes are O(1) and scoring is a single pass over one column
+instead of a walk over per-document dicts. Embeddings are L2-normalized
+on the way in, so scoring a row is a single dot product.
+
+Embeddings are stored as compact arrays whose element type is chosen by
+`quantization`: "f64" (exact, default), "f32" (half the memory) or "i8"
+(an eighth, plus one float scale per row; ~0.5% score error).
+
+If hnswlib is installed and the store holds HNSW_MIN_DOCUMENTS embedded
+documents, an HNSW graph is built alongside the columns and vector queries
+use it instead of the linear scan (approximate, ~O(log N) per query).
+
+Keep this file under 400 lines.
+"""
+
+import logging
+import math
+import operator
+import re
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from .metadata_filter import metadata_matches
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+HNSW_MIN_DOCUMENTS = 1000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 100
+HNSW_EF_SEARCH = 64
+
+# quantization option -> array typecode used for stored embeddings
+QUANTIZATIONS = {"f64": "d", "f32": "f", "i8": "b"}
+
+_WORD = re.compile(r"\w+")
+
+
+def _sum_of_products(a: Any, b: Any) -> float:
+    return sum(map(operator.mul, a, b))
+
+
+# Dot product kernel: math.sumprod (3.12+) runs the whole loop in C with
+# extended-precision accumulation; older interpreters use map(operator.mul).
+_dot = getattr(math, "sumprod", _sum_of_products)
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    """Compute cosine similarity between two vectors."""
+    if len(a) != len(b):
+        return 0.0
+    norm_a = math.hypot(*a)
+    norm_b = math.hypot(*b)
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return _dot(a, b) / (norm_a * norm_b)
+
+
+def tokenize(text: str) -> frozenset[str]:
+    """Lowercased word set used for keyword scoring."""
+    return frozenset(_WORD.findall(text.lower()))
+
+
+def normalized(vector: list[float]) -> list[float]:
+    """Scale a vector to unit length (zero vectors are returned unchanged)."""
+    norm = math.hypot(*vector)
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+class FallbackIndex:
+    """Parallel-list document store with O(1) upsert and delete by id."""
+
+    def __init__(self, quantization: str = "f64") -> None:
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(
+                f"Unsupported quantization: {quantization!r} "
+                f"(expected one of {', '.join(QUANTIZATIONS)})"
+            )
+        self._typecode = QUANTIZATIONS[quantization]
+        self.ids: list[str] = []
+        self.contents: list[str] = []
+        self.metadatas: list[dict[str, Any]] = []
+        # Word sets of each content, precomputed for keyword scoring
+        self.tokens: list[frozenset[str]] = []
+        # array rows, or memoryview slices of a mapped file after load_rows()
+        self.embeddings: list[array | memoryview | None] = []
+        # Per-row dequantization factor (1.0 unless quantization="i8")
+        self.scales: list[float] = []
+        self._positions: dict[str, int] = {}
+        self._embedded = 0
+        self._hnsw: _HnswGraph | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def typecode(self) -> str:
+        """array typecode of stored embeddings ("d", "f" or "b")."""
+        return self._typecode
+
+    def load_rows(
+        self,
+        rows: Iterable[tuple[str, str, dict[str, Any], Sequence[float] | None, float]],
+    ) -> None:
+        """
+        Append already-normalized, already-quantized rows into an empty index.
+
+        Each row is (id, content, metadata, stored_embedding, scale), as
+        written by fallback_persistence.save_index. Vectors are kept as
+        given (e.g. memoryviews over a mapped file) rather than copied.
+        """
+        if self.ids:
+            raise ValueError("load_rows() requires an empty index")
+        for doc_id, content, metadata, stored, scale in rows:
+            self._positions[doc_id] = len(self.ids)
+            self.ids.append(doc_id)
+            self.contents.append(content)
+            self.tokens.append(tokenize(content))
+            self.metadatas.append(metadata)
+            self.embeddings.append(stored)
+            self.scales.append(scale)
+            self._embedded += stored is not None
+
+    def position(self, doc_id: str) -> int | None:
+        """Row index of a document, or None if it isn't stored."""
+        return self._positions.get(doc_id)
+
+    def upsert(
+        self,
+        doc_id: str,
+        content: str,
+        metadata: dict[str, Any],
+        embedding: list[float] | None,
+    ) -> None:
+        """Insert a document, or overwrite it in place if the id exists."""
+        unit = normalized(embedding) if embedding is not None else None
+        stored, scale = self._quantize(unit) if unit is not None else (None, 1.0)
+        pos = self._positions.get(doc_id)
+        if pos is None:
+            self._positions[doc_id] = len(self.ids)
+            self.ids.append(doc_id)
+            self.contents.append(content)
+            self.tokens.append(tokenize(content))
+            self.metadatas.append(metadata)
+            self.embeddings.append(stored)
+            self.scales.append(scale)
+        else:
+            self._embedded -= self.embeddings[pos] is not None
+            self.contents[pos] = content
+            self.tokens[pos] = tokenize(content)
+            self.metadatas[pos] = metadata
+            self.embeddings[pos] = stored
+            self.scales[pos] = scale
+        self._embedded += unit is not None
+
+        if self._hnsw is not None:
+            self._hnsw.remove(doc_id)
+            if unit is not None:
+                self._hnsw.add(doc_id, unit)
+        elif unit is not None and self._wants_graph():
+            self._hnsw = _HnswGraph.build(
+                self.ids, [self._vector(pos) for pos in range(len(self.ids))]
+            )
+
+    def delete(self, doc_id: str) -> None:
+        """Remove a document by moving the last row into its slot."""
+        pos = self._positions.pop(doc_id, None)
+        if pos is None:
+            return
+        self._embedded -= self.embeddings[pos] is not None
+        if self._hnsw is not None:
+            self._hnsw.remove(doc_id)
+        last = len(self.ids) - 1
+        if pos != last:
+            for column in self._columns():
+                column[pos] = column[last]
+            self._positions[self.ids[pos]] = pos
+        for column in self._columns():
+            column.pop()
+
+    def clear(self) -> None:
+        for column in self._columns():
+            column.clear()
+        self._positions.clear()
+        self._embedded = 0
+        self._hnsw = None
+
+    def nearest(
+        self, query_embedding: list[float], k: int
+    ) -> list[tuple[float, int]] | None:
+        """
+        Approximate top-k as (cosine score, row) pairs via the HNSW graph.
+
+        Returns None when the graph isn't in use (hnswlib missing, store
+        below HNSW_MIN_DOCUMENTS, or some rows lack embeddings), in which
+        case callers should fall back to scores().
+        """
+        if self._hnsw is None and self._wants_graph():
+            # Built on first query after load_rows(), not during load.
+            self._hnsw = _HnswGraph.build(
+                self.ids, [self._vector(pos) for pos in range(len(self.ids))]
+            )
+        if self._hnsw is None or self._embedded != len(self.ids):
+            return None
+        return [
+            (score, self._positions[doc_id])
+            for score, doc_id in self._hnsw.query(normalized(query_embedding), k)
+        ]
+
+    def scores(
+        self,
+        query: str,
+        query_embedding: list[float] | None,
+        where: dict[str, Any] | None = None,
+    ) -> list[float]:
+        """
+        Score every document against the query, in row order.
+
+        Rows with an embedding use cosine similarity when a query embedding
+        is given; all others fall back to the share of query words found
+        among the row's words (one set intersection per row).
+        Rows rejected by the `where` filter score 0.0 without being scored.
+        """
+        keep = (
+            [metadata_matches(m, where) for m in self.metadatas]
+            if where else [True] * len(self.ids)
+        )
+        query_words = tokenize(query)
+        n_words = max(len(query_words), 1)
+
+        def keyword(tokens: frozenset[str]) -> float:
+            return len(query_words & tokens) / n_words
+
+        if not query_embedding:
+            return [keyword(t) if k else 0.0 for t, k in zip(self.tokens, keep)]
+        # Stored rows are unit length, so cosine reduces to one dot product
+        # against the query normalized once here.
+        unit_query = normalized(query_embedding)
+        dimensions = len(unit_query)
+        def row_score(embedding: Sequence[float] | None, scale: float, tokens: frozenset[str]) -> float:
+            if not embedding:
+                return keyword(tokens)
+            if len(embedding) != dimensions:
+                return 0.0
+            return _dot(unit_query, embedding) * scale
+
+        return [
+            row_score(e, s, t) if k else 0.0
+            for e, s, t, k in zip(self.embeddings, self.scales, self.tokens, keep)
+        ]
+
+    def _columns(self) -> tuple[list, ...]:
+        return (self.ids, self.contents, self.tokens, self.metadatas, self.embeddings, self.scales)
+
+    def _quantize(self, unit: list[float]) -> tuple[array, float]:
+        """Pack a unit vector into the configured array type, with its scale."""
+        if self._typecode != "b":
+            return array(self._typecode, unit), 1.0
+        # Symmetric per-row int8: the largest component maps to +/-127.
+        peak = max(map(abs, unit), default=0.0)
+        if peak == 0:
+            return array("b", bytes(len(unit))), 0.0
+        scale = peak / 127
+        return array("b", [round(x / scale) for x in unit]), scale
+
+    def _wants_graph(self) -> bool:
+        return hnswlib is not None and self._embedded >= HNSW_MIN_DOCUMENTS
+
+    def _vector(self, pos: int) -> list[float] | None:
+        """Dequantized embedding for one row (None if the row has none)."""
+        stored = self.embeddings[pos]
+        if stored is None:
+            return None
+        scale = self.scales[pos]
+        return [x * scale for x in stored] if self._typecode == "b" else list(stored)
+
+
+class _HnswGraph:
+    """hnswlib inner-product index over unit vectors, keyed by document id.
+
+    Labels are never reused. Inputs are already normalized, so the "ip"
+    space gives cosine distance without hnswlib normalizing again.
+    """
+
+    def __init__(self, index: Any, dimensions: int):
+        self._index = index
+        self._dimensions = dimensions
+        self._labels: dict[str, int] = {}
+        self._doc_ids: dict[int, str] = {}
+        self._next_label = 0
+
+    @classmethod
+    def build(
+        cls, ids: list[str], embeddings: list[list[float] | None]
+    ) -> "_HnswGraph | None":
+        if hnswlib is None:
+            return None
+        dimensions = len(next(e for e in embeddings if e is not None))
+        index = hnswlib.Index(space="ip", dim=dimensions)
+        index.init_index(
+            max_elements=max(len(ids) * 2, HNSW_MIN_DOCUMENTS),
+            ef_construction=HNSW_EF_CONSTRUCTION,
+            M=HNSW_M,
+        )
+        index.set_ef(HNSW_EF_SEARCH)
+        graph = cls(index, dimensions)
+        for doc_id, embedding in zip(ids, embeddings):
+            if embedding is not None:
+                graph.add(doc_id, embedding)
+        logger.info("[FallbackIndex] Built HNSW graph over %d documents", len(graph._labels))
+        return graph
+
+    def add(self, doc_id: str, embedding: list[float]) -> None:
+        if len(embedding) != self._dimensions:
+            return
+        if self._next_label >= self._index.get_max_elements():
+            self._index.resize_index(self._index.get_max_elements() * 2)
+        label = self._next_label
+        self._next_label += 1
+        self._index.add_items([embedding], [label])
+        self._labels[doc_id] = label
+        self._doc_ids[label] = doc_id
+
+    def remove(self, doc_id: str) -> None:
+        label = self._labels.pop(doc_id, None)
+        if label is not None:
+            self._index.mark_deleted(label)
+            del self._doc_ids[label]
+
+    def query(self, embedding: list[float], k: int) -> list[tuple[float, str]]:
+        k = min(k, len(self._labels))
+        if k == 0 or len(embedding) != self._dimensions:
+            return []
+        labels, distances = self._index.knn_query([embedding], k=k)
+        return [
+            (1.0 - float(d), self._doc_ids[int(label)])
+            for label, d in zip(labels[0], distances[0])
+        ]
@@ -0,0 +1,115 @@
+"""
+Fallback persistence -- Save a FallbackIndex to disk and map it back in.
+
+Used by VectorStore(persist_fallback=True) so the in-memory fallback
+survives restarts without ChromaDB. For a base path P:
+
+  P.json -- ids, contents, metadata, and per-row vector length and scale
+  P.bin  -- every stored embedding back to back, in the index's array type
+
+load_index() memory-maps P.bin read-only and hands the index memoryview
+slices of it, so a cold start does not parse or copy vectors; the OS pages
+rows in on first touch and can share them between processes.
+
+Keep this file under 150 lines.
+"""
+
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+
+from .fallback_index import FallbackIndex
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+
+def _paths(path: Path) -> tuple[Path, Path]:
+    return Path(f"{path}.json"), Path(f"{path}.bin")
+
+
+def save_index(index: FallbackIndex, path: Path) -> None:
+    """Write the index to P.json / P.bin, replacing any previous snapshot."""
+    json_path, bin_path = _paths(path)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_bin = bin_path.with_name(bin_path.name + ".tmp")
+    tmp_json = json_path.with_name(json_path.name + ".tmp")
+
+    rows = []
+    with open(tmp_bin, "wb") as f:
+        for doc_id, content, metadata, stored, scale in zip(
+            index.ids, index.contents, index.metadatas, index.embeddings, index.scales
+        ):
+            rows.append({
+                "id": doc_id,
+                "content": content,
+                "metadata": metadata,
+                "dims": -1 if stored is None else len(stored),
+                "scale": scale,
+            })
+            if stored is not None:
+                f.write(stored)
+        size = f.tell()
+
+    with open(tmp_json, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": FORMAT_VERSION,
+                "typecode": index.typecode,
+                "bin_size": size,
+                "rows": rows,
+            },
+            f,
+        )
+    os.replace(tmp_bin, bin_path)
+    os.replace(tmp_json, json_path)
+
+
+def load_index(index: FallbackIndex, path: Path) -> int:
+    """
+    Fill an empty index from a snapshot written by save_index().
+
+    Returns the number of rows loaded; 0 if there is no snapshot or it
+    can't be used (other array type, or .json and .bin out of sync).
+    """
+    json_path, bin_path = _paths(path)
+    if not json_path.exists() or not bin_path.exists():
+        return 0
+    with open(json_path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != FORMAT_VERSION or snapshot.get("typecode") != index.typecode:
+        logger.warning("[FallbackPersistence] Ignoring incompatible snapshot at %s", json_path)
+        return 0
+    if bin_path.stat().st_size != snapshot["bin_size"]:
+        logger.warning("[FallbackPersistence] Snapshot files out of sync at %s", json_path)
+        return 0
+
+    vectors = _map_vectors(bin_path, index.typecode)
+    offset = 0
+    loaded = []
+    for row in snapshot["rows"]:
+        dims = row["dims"]
+        stored = None
+        if dims >= 0:
+            stored = vectors[offset:offset + dims]
+            offset += dims
+        loaded.append((row["id"], row["content"], row["metadata"], stored, row["scale"]))
+    index.load_rows(loaded)
+    logger.info("[FallbackPersistence] Loaded %d documents from %s", len(loaded), json_path)
+    return len(loaded)
+
+
+def _map_vectors(bin_path: Path, typecode: str) -> memoryview:
+    """Map the vector file read-only as a flat memoryview of `typecode`."""
+    if bin_path.stat().st_size == 0:
+        return memoryview(b"").cast(typecode)
+    with open(bin_path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+        # Queries touch scattered rows; skip the kernel's sequential read-ahead.
+        mapped.madvise(mmap.MADV_RANDOM)
+    # The memoryview (and every slice of it) keeps the mapping alive.
+    return memoryview(mapped).cast(typecode)
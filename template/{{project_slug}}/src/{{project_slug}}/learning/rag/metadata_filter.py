@@ -0,0 +1,56 @@
+"""
+Metadata filters -- ChromaDB-compatible `where` evaluation for the fallback.
+
+Lets VectorStore apply the same filter dicts to the in-memory fallback
+that it passes to ChromaDB, so filtered searches behave the same with or
+without ChromaDB installed.
+
+Keep this file under 100 lines.
+"""
+
+import operator
+from typing import Any
+
+# ChromaDB-style metadata comparison operators supported by metadata_matches
+_OPERATORS = {
+    "$eq": operator.eq,
+    "$ne": operator.ne,
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+    "$in": lambda value, options: value in options,
+    "$nin": lambda value, options: value not in options,
+}
+
+
+def metadata_matches(metadata: dict[str, Any], where: dict[str, Any]) -> bool:
+    """
+    Evaluate a ChromaDB `where` filter against one metadata dict.
+
+    Supports field equality ({"type": "style"}), operator dicts
+    ({"priority": {"$gte": 30}}) and "$and" / "$or" lists.
+    """
+    for field_name, condition in where.items():
+        if field_name == "$and":
+            if not all(metadata_matches(metadata, c) for c in condition):
+                return False
+        elif field_name == "$or":
+            if not any(metadata_matches(metadata, c) for c in condition):
+                return False
+        elif isinstance(condition, dict):
+            if field_name not in metadata:
+                return False
+            value = metadata[field_name]
+            for op, arg in condition.items():
+                compare = _OPERATORS.get(op)
+                if compare is None:
+                    raise ValueError(f"Unsupported where operator: {op}")
+                try:
+                    if not compare(value, arg):
+                        return False
+                except TypeError:
+                    return False
+        elif metadata.get(field_name) != condition:
+            return False
+    return True
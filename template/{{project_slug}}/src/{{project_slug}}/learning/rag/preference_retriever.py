@@ -8,7 +8,7 @@ UserProfileManager to build context bundles for LLM prompts.
 Document categories are configurable strings -- projects register
 their own category names (e.g., "style", "behavior", "output_format").
 
-Keep this file under 200 lines.
+Keep this file under 250 lines.
 """
 
 import logging
@@ -16,11 +16,18 @@ from pathlib import Path
 
 from ..models import UserPreference
 from ..schema import DEFAULT_DB_PATH, dict_from_row, get_connection
-from .embedding_service import EmbeddingService
+from .embedding_cache import EmbeddingCache, content_hash
+from .embedding_service import FALLBACK_PROVIDER, EmbeddingService
 from .vector_store import SearchResults, VectorStore
 
 logger = logging.getLogger(__name__)
 
+ACTIVE_PREFERENCES_SQL = """
+SELECT * FROM user_preferences
+WHERE project_id = ? AND active = 1
+ORDER BY priority DESC
+"""
+
 
 class PreferenceRetriever:
     """
@@ -36,6 +43,11 @@ class PreferenceRetriever:
         results = retriever.search("How verbose should I be?", limit=5)
         for r in results.results:
             print(f"{r.metadata['key']}: {r.content} (score={r.score:.2f})")
+
+    With use_server_embedding=True and a ChromaDB-backed store, documents
+    and queries are embedded by the collection's own embedding function
+    instead of the EmbeddingService (no local encoder pass per query).
+    The in-memory fallback still needs local embeddings and ignores it.
     """
 
     def __init__(
@@ -44,53 +56,102 @@ class PreferenceRetriever:
         vector_store: VectorStore | None = None,
         embedding_service: EmbeddingService | None = None,
         db_path: Path = DEFAULT_DB_PATH,
+        use_server_embedding: bool = False,
     ):
         self._project_id = project_id
         self._db_path = db_path
         self._store = vector_store or VectorStore(project_id=f"prefs_{project_id}")
         self._embedder = embedding_service or EmbeddingService()
+        self._embedding_cache = EmbeddingCache(db_path)
+        self._use_server_embedding = use_server_embedding
 
     def index_preference(self, pref: UserPreference) -> None:
         """Index a single preference into the vector store."""
-        doc_text = f"{pref.preference_type}: {pref.key} = {pref.value}"
-
-        embedding_result = self._embedder.embed(doc_text)
-
-        self._store.add(
-            doc_id=pref.id,
-            content=doc_text,
-            metadata={
-                "preference_type": pref.preference_type,
-                "key": pref.key,
-                "value": pref.value,
-                "source": pref.source,
-                "priority": pref.priority,
-                "active": pref.active,
-            },
-            embedding=embedding_result.embedding,
+        self.index_preferences([pref])
+
+    def index_preferences(
+        self, prefs: list[UserPreference], pre_sanitized: bool = False
+    ) -> None:
+        """
+        Index many preferences with one embedding batch and one store write.
+
+        Preferences already indexed with identical text and metadata are
+        skipped (no embedding, no upsert). pre_sanitized=True means type,
+        key and value were already sanitized (as save_preferences does).
+        """
+        docs = {
+            pref.id: (
+                f"{pref.preference_type}: {pref.key} = {pref.value}",
+                {
+                    "preference_type": pref.preference_type,
+                    "key": pref.key,
+                    "value": pref.value,
+                    "source": pref.source,
+                    "priority": pref.priority,
+                    "active": pref.active,
+                },
+            )
+            for pref in prefs
+        }
+        unchanged = self._store.find_unchanged(
+            list(docs), [text for text, _ in docs.values()], [meta for _, meta in docs.values()]
+        )
+        for doc_id in unchanged:
+            del docs[doc_id]
+        if not docs:
+            return
+
+        doc_texts = [text for text, _ in docs.values()]
+        self._store.add_many(
+            ids=list(docs),
+            contents=doc_texts,
+            metadatas=[meta for _, meta in docs.values()],
+            embeddings=None if self._server_embeds else self._embed_with_cache(doc_texts),
+            pre_sanitized=pre_sanitized,
         )
 
+    @property
+    def _server_embeds(self) -> bool:
+        """True when ChromaDB should embed documents and queries itself."""
+        return self._use_server_embedding and self._store.is_chroma
+
+    def _embed_with_cache(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts, reusing vectors from the persistent embedding cache.
+
+        The hash-based fallback provider is cheaper than a cache lookup,
+        so it bypasses the cache. Rows are keyed by the embedder's model
+        name, and vectors the embedder had to fall back for (provider
+        "fallback" after a failed call) are used but never stored.
+        """
+        if self._embedder.provider == FALLBACK_PROVIDER:
+            return [r.embedding for r in self._embedder.embed_batch(texts)]
+
+        model = self._embedder.model_name
+        hashes = [content_hash(text) for text in texts]
+        cached = self._embedding_cache.get_many(model, hashes)
+        missing = {h: text for h, text in zip(hashes, texts) if h not in cached}
+        if missing:
+            results = dict(zip(missing, self._embedder.embed_batch(list(missing.values()))))
+            self._embedding_cache.put_many(model, {
+                h: r.embedding for h, r in results.items() if r.provider != FALLBACK_PROVIDER
+            })
+            cached.update((h, r.embedding) for h, r in results.items())
+        return [cached[h] for h in hashes]
+
     def index_from_db(self) -> int:
         """
         Index all active preferences from the database.
 
         Returns the number of preferences indexed.
         """
-        conn = get_connection(self._db_path)
-        try:
-            rows = conn.execute(
-                """SELECT * FROM user_preferences
-                   WHERE project_id = ? AND active = 1
-                   ORDER BY priority DESC""",
-                (self._project_id,),
-            ).fetchall()
-        finally:
-            conn.close()
-
-        count = 0
+        with get_connection(self._db_path) as conn:
+            rows = conn.execute(ACTIVE_PREFERENCES_SQL, (self._project_id,)).fetchall()
+
+        prefs = []
         for row in rows:
             data = dict_from_row(row)
-            pref = UserPreference(
+            prefs.append(UserPreference(
                 id=data["id"],
                 project_id=data.get("project_id", self._project_id),
                 preference_type=data["preference_type"],
@@ -102,15 +163,14 @@ class PreferenceRetriever:
                 metadata=data.get("metadata", {}),
                 created_at=data.get("created_at", ""),
                 updated_at=data.get("updated_at", ""),
-            )
-            self.index_preference(pref)
-            count += 1
+            ))
+        self.index_preferences(prefs)
 
         logger.info(
-            f"[PreferenceRetriever] Indexed {count} preferences "
+            f"[PreferenceRetriever] Indexed {len(prefs)} preferences "
             f"for project {self._project_id}"
         )
-        return count
+        return len(prefs)
 
     def search(
         self,
@@ -131,28 +191,24 @@ class PreferenceRetriever:
         Returns:
             SearchResults with scored matches.
         """
-        embedding_result = self._embedder.embed(query)
-
-        where = None
+        # Filters run inside the store so `limit` counts only matching rows.
+        conditions: list[dict] = []
         if preference_type:
-            where = {"preference_type": preference_type}
+            conditions.append({"preference_type": preference_type})
+        if min_priority > 0:
+            conditions.append({"priority": {"$gte": min_priority}})
+        where = (
+            {"$and": conditions} if len(conditions) > 1
+            else conditions[0] if conditions else None
+        )
 
-        results = self._store.search(
+        return self._store.search(
             query=query,
             limit=limit,
             where=where,
-            query_embedding=embedding_result.embedding,
+            query_embedding=None if self._server_embeds else self._embedder.embed(query).embedding,
         )
 
-        if min_priority > 0:
-            results.results = [
-                r for r in results.results
-                if r.metadata.get("priority", 0) >= min_priority
-            ]
-            results.total = len(results.results)
-
-        return results
-
     def clear_index(self) -> None:
         """Clear the vector store index for this project."""
         self._store.clear()
@@ -104,7 +104,7 @@ class TranscriptIndexer:
             },
             embedding=embedding_result.embedding,
         )
-        logger.debug(f"[TranscriptIndexer] Indexed transcript for task {task_id}")
+        logger.debug("[TranscriptIndexer] Indexed transcript for task %s", task_id)
 
     def search(
         self,
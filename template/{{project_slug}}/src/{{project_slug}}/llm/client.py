@@ -5,14 +5,34 @@ Supports Anthropic (Claude), OpenAI (GPT), Google (Gemini).
 Uses CacheablePrompt(system, context, user_message) for automatic caching.
 """
 
+import array
 import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
 import os
+import random
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from pathlib import Path
 from typing import Any
 
 from ..security.prompt_guard import sanitize_for_prompt
+from .batch_api import BATCH_COST_FACTOR, AnthropicBatcher
+from .models import COST_RATES, CacheablePrompt, LLMResponse, TokenUsage  # noqa: F401
+from .providers import (
+    anthropic_request,
+    anthropic_usage,
+    openai_messages,
+    openai_usage,
+    per_token_rates,
+    stream_anthropic,
+    stream_openai,
+)
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,74 +41,30 @@ DEFAULT_MAX_RETRIES = 2
 DEFAULT_MAX_PROMPT_LENGTH = 200_000
 RETRY_BASE_DELAY = 1.0
 RETRY_MAX_DELAY = 30.0
-
-# Cost per 1K tokens (approximate, varies by model -- override via config)
-COST_RATES = {
-    "anthropic": {"input": 0.003, "cached": 0.0003, "output": 0.015},
-    "openai": {"input": 0.005, "cached": 0.0025, "output": 0.015},
-    "google": {"input": 0.0, "cached": 0.0, "output": 0.0},
-}
-
-
-@dataclass
-class CacheablePrompt:
-    """
-    Separates prompt into cacheable (stable) and dynamic parts.
-
-    The LLM client marks stable parts for provider-level caching:
-      - system: System instructions (cached -- never changes)
-      - context: Agent descriptions, user preferences (cached -- changes per session)
-      - user_message: The actual request (never cached -- changes every call)
-
-    This structure enables 85-90% token savings on the stable prefix.
-    """
-
-    system: str = ""
-    context: str = ""
-    user_message: str = ""
-
-    def to_flat_prompt(self) -> str:
-        """Flatten to a single string (for providers that don't support caching)."""
-        parts = []
-        if self.system:
-            parts.append(self.system)
-        if self.context:
-            parts.append(self.context)
-        if self.user_message:
-            parts.append(self.user_message)
-        return "\n\n".join(parts)
-
-    @property
-    def total_length(self) -> int:
-        return len(self.system) + len(self.context) + len(self.user_message)
-
-
-@dataclass
-class TokenUsage:
-    """Token usage tracking for a single LLM call."""
-
-    input_tokens: int = 0
-    output_tokens: int = 0
-    cached_input_tokens: int = 0
-    total_tokens: int = 0
-    estimated_cost_usd: float = 0.0
-    cache_hit: bool = False
-
-    def __post_init__(self):
-        self.total_tokens = self.input_tokens + self.output_tokens
-
-
-@dataclass
-class LLMResponse:
-    """Response from an LLM call -- drop-in compatible with existing code."""
-
-    content: str
-    usage: TokenUsage = field(default_factory=TokenUsage)
-    model: str = ""
-    provider: str = ""
-    latency_ms: float = 0.0
-    cached: bool = False
-
+DEFAULT_DEDUP_CACHE_SIZE = 512
+# Shorter prefixes are below the providers' minimum cacheable size
+# (~1024 tokens), so there is nothing to warm.
+MIN_CACHEABLE_PREFIX_CHARS = 4096
+# Prompts longer than this are sanitized on a worker thread so the scan
+# doesn't stall other coroutines (e.g. concurrent specialist calls).
+SANITIZE_IN_THREAD_CHARS = 8192
+SANITIZED_FRAGMENT_CACHE_SIZE = 128
+# Running totals: integer slots, cost kept in micro-dollars so it doesn't drift
+_INPUT, _OUTPUT, _CACHED, _COST_MICRO_USD = range(4)
+MICRO_USD = 1_000_000
+# Shared keep-alive pool for the Anthropic/OpenAI SDKs (per client)
+HTTP_MAX_CONNECTIONS = 64
+
+# HTTP statuses worth retrying: timeout, rate limit, transient server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504, 529})
+# Transport errors from outside the SDKs (e.g. httpx), matched by class name
+RETRYABLE_ERROR_NAMES = frozenset({
+    "APITimeoutError", "APIConnectionError", "Timeout", "ConnectError",
+    "ServiceUnavailableError",
+})
+_SDK_RETRYABLE_CLASSES = (
+    "RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError",
+)
 
 # =============================================================================
 # LLM CLIENT
@@ -110,6 +86,24 @@ class LLMClient:
             user_message="Analyze: ...",
         )
         response = await client.call(prompt=prompt, role="analyst", temperature=0.3)
+
+    Identical calls (same sanitized prompt, model, temperature and
+    max_tokens) are answered from an in-process LRU of the last
+    dedup_cache_size successful responses, without a network round trip.
+    Hits carry zero usage and usage.cache_hit=True. Pass
+    dedup_cache_size=0 to disable (e.g. when sampling for variety).
+    With response_cache_path set, misses fall through to a SQLite store
+    shared by every process using that path, and successes are written
+    to both layers.
+
+    With warm_prefix_cache=True, concurrent calls that share a long cached
+    prefix (system, plus context when cache_context is set) are grouped:
+    the first is sent right away and the rest wait for it to finish, so
+    they read the provider's prompt cache instead of each writing it.
+
+    With use_batch_api=True (Anthropic only), concurrent calls are sent
+    as one Message Batch at half the price -- see llm/batch_api.py. Each
+    call then takes as long as the batch, so leave it off for chat.
     """
 
     def __init__(
@@ -121,6 +115,10 @@ class LLMClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         max_prompt_length: int = DEFAULT_MAX_PROMPT_LENGTH,
         max_cost_usd: float | None = None,
+        dedup_cache_size: int = DEFAULT_DEDUP_CACHE_SIZE,
+        warm_prefix_cache: bool = False,
+        response_cache_path: str | Path | None = None,
+        use_batch_api: bool = False,
     ):
         self._provider = provider.lower()
         self._model = model or self._default_model()
@@ -129,8 +127,27 @@ class LLMClient:
         self._max_retries = max_retries
         self._max_prompt_length = max_prompt_length
         self._max_cost_usd = max_cost_usd
+        self._cost_rates = per_token_rates(self._provider)
         self._client: Any = None
-        self._total_usage = TokenUsage()
+        self._retryable_errors: tuple[type[BaseException], ...] = (TimeoutError, ConnectionError)
+        self._totals = array.array("q", [0, 0, 0, 0])
+        self._dedup_cache_size = dedup_cache_size
+        self._dedup_cache: OrderedDict[bytes, LLMResponse] = OrderedDict()
+        self._response_cache = (
+            ResponseCache(Path(response_cache_path)) if response_cache_path else None
+        )
+        self._warm_prefix_cache = warm_prefix_cache
+        # prefix key -> future resolved when the first call with it finishes
+        self._warming_prefixes: dict[bytes, asyncio.Future] = {}
+        self._batcher: AnthropicBatcher | None = None
+        if use_batch_api:
+            if self._provider == "anthropic":
+                self._batcher = AnthropicBatcher()
+            else:
+                logger.warning(
+                    "[LLM] use_batch_api is only supported for anthropic; "
+                    "%s calls stay real-time", self._provider,
+                )
 
         self._init_client()
         logger.info(
@@ -165,14 +182,20 @@ class LLMClient:
                 import anthropic
 
                 self._client = anthropic.AsyncAnthropic(
-                    api_key=self._api_key, timeout=self._timeout
+                    api_key=self._api_key,
+                    timeout=self._timeout,
+                    http_client=self._make_http_client(),
                 )
+                self._retryable_errors += _sdk_error_classes(anthropic)
             elif self._provider == "openai":
                 import openai
 
                 self._client = openai.AsyncOpenAI(
-                    api_key=self._api_key, timeout=self._timeout
+                    api_key=self._api_key,
+                    timeout=self._timeout,
+                    http_client=self._make_http_client(),
                 )
+                self._retryable_errors += _sdk_error_classes(openai)
             elif self._provider == "google":
                 import google.generativeai as genai
 
@@ -187,6 +210,43 @@ class LLMClient:
             )
             self._client = None
 
+    def _make_http_client(self) -> Any:
+        """
+        One pooled httpx client for all of this LLMClient's requests.
+
+        Keep-alive connections are reused across concurrent agent calls
+        (one TLS handshake per connection, not per call), and HTTP/2
+        multiplexes them over a single socket when `h2` is installed.
+        Returns None (SDK default client) if httpx can't be imported.
+        """
+        try:
+            import httpx
+        except ImportError:
+            return None
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the provider client, its connection pool, and the response cache."""
+        if self._response_cache is not None:
+            self._response_cache.close()
+            self._response_cache = None
+        close = getattr(self._client, "close", None)
+        if close is not None and asyncio.iscoroutinefunction(close):
+            await close()
+
     async def call(
         self,
         prompt: str | CacheablePrompt,
@@ -195,14 +255,88 @@ class LLMClient:
         max_tokens: int = 4096,
     ) -> LLMResponse:
         """Make an LLM call with prompt caching, retries, and budget enforcement."""
-        if isinstance(prompt, str):
-            prompt = CacheablePrompt(user_message=prompt)
+        prompt = await self._prepare_prompt(prompt)
+
+        dedup_key = self._dedup_key(prompt, temperature, max_tokens)
+        duplicate = self._dedup_lookup(dedup_key)
+        if duplicate is not None:
+            logger.debug("[LLM] %s/%s: served from dedup cache", self._provider, role)
+            return duplicate
+
+        blocked = self._blocked_response()
+        if blocked is not None:
+            return blocked
+
+        leader_key = await self._wait_for_prefix_warmup(prompt)
+        try:
+            return await self._call_with_retries(
+                prompt, role, temperature, max_tokens, dedup_key
+            )
+        finally:
+            self._finish_prefix_warmup(leader_key)
+
+    async def stream(
+        self,
+        prompt: str | CacheablePrompt,
+        role: str = "assistant",
+        temperature: float = 0.5,
+        max_tokens: int = 4096,
+    ) -> AsyncIterator[str]:
+        """
+        Yield response text as it is decoded.
+
+        Lets a consumer start parsing (or showing) output before the full
+        completion exists, and stop early: breaking out of the loop closes
+        the provider stream so no further tokens are generated. Usage is
+        tracked when the stream runs to completion.
+
+        Not retried or deduplicated -- a half-delivered answer can't be
+        replayed. Google has no streaming path here and yields the whole
+        call() result as one chunk.
+        """
+        prompt = await self._prepare_prompt(prompt)
+
+        blocked = self._blocked_response()
+        if blocked is not None:
+            yield blocked.content
+            return
 
-        prompt = self._sanitize_prompt(prompt)
+        if self._provider == "anthropic":
+            streamer = stream_anthropic
+        elif self._provider == "openai":
+            streamer = stream_openai
+        else:
+            response = await self._call_with_retries(prompt, role, temperature, max_tokens, None)
+            yield response.content
+            return
+
+        start_ns = time.perf_counter_ns()
+        async with contextlib.aclosing(
+            streamer(
+                self._client, self._model, prompt, temperature, max_tokens,
+                self._cost_rates, self._track_usage,
+            )
+        ) as chunks:
+            async for text in chunks:
+                yield text
+        logger.debug(
+            "[LLM] %s/%s: streamed (%.0fms)",
+            self._provider, role, (time.perf_counter_ns() - start_ns) / 1_000_000,
+        )
 
-        if self._max_cost_usd and self._total_usage.estimated_cost_usd >= self._max_cost_usd:
+    async def _prepare_prompt(self, prompt: str | CacheablePrompt) -> CacheablePrompt:
+        """Sanitize into a CacheablePrompt, off the event loop for large prompts."""
+        length = len(prompt) if isinstance(prompt, str) else prompt.total_length
+        if length > SANITIZE_IN_THREAD_CHARS:
+            return await asyncio.to_thread(self._sanitize_prompt, prompt)
+        return self._sanitize_prompt(prompt)
+
+    def _blocked_response(self) -> LLMResponse | None:
+        """Placeholder response when the budget is spent or there is no client."""
+        spent_usd = self._totals[_COST_MICRO_USD] / MICRO_USD
+        if self._max_cost_usd and spent_usd >= self._max_cost_usd:
             logger.error(
-                f"[LLM] Budget exhausted: ${self._total_usage.estimated_cost_usd:.4f} "
+                f"[LLM] Budget exhausted: ${spent_usd:.4f} "
                 f">= ${self._max_cost_usd:.4f}. Call blocked."
             )
             return LLMResponse(
@@ -217,8 +351,18 @@ class LLMClient:
                 provider=self._provider,
                 model=self._model,
             )
+        return None
 
-        start = time.time()
+    async def _call_with_retries(
+        self,
+        prompt: CacheablePrompt,
+        role: str,
+        temperature: float,
+        max_tokens: int,
+        dedup_key: bytes | None,
+    ) -> LLMResponse:
+        """Call the provider, retrying transient errors with backoff."""
+        start_ns = time.perf_counter_ns()
         last_error: Exception | None = None
 
         for attempt in range(self._max_retries + 1):
@@ -226,27 +370,24 @@ class LLMClient:
                 response = await self._call_provider(
                     prompt, temperature, max_tokens
                 )
-                response.latency_ms = (time.time() - start) * 1000
+                response.latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
                 self._track_usage(response.usage)
+                self._dedup_store(dedup_key, response)
 
+                usage = response.usage
                 logger.debug(
-                    f"[LLM] {self._provider}/{role}: "
-                    f"{response.usage.input_tokens}in "
-                    f"({response.usage.cached_input_tokens} cached) + "
-                    f"{response.usage.output_tokens}out = "
-                    f"{response.usage.total_tokens}tok "
-                    f"${response.usage.estimated_cost_usd:.4f} "
-                    f"({response.latency_ms:.0f}ms)"
+                    "[LLM] %s/%s: %din (%d cached) + %dout = %dtok $%.4f (%.0fms)",
+                    self._provider, role, usage.input_tokens, usage.cached_input_tokens,
+                    usage.output_tokens, usage.total_tokens, usage.estimated_cost_usd,
+                    response.latency_ms,
                 )
                 return response
 
             except Exception as e:
                 last_error = e
                 if self._is_retryable(e) and attempt < self._max_retries:
-                    delay = min(
-                        RETRY_BASE_DELAY * (2**attempt), RETRY_MAX_DELAY
-                    )
+                    delay = _retry_delay(attempt, e)
                     logger.warning(
                         f"[LLM] Retryable error (attempt {attempt + 1}): "
                         f"{type(e).__name__}. Retrying in {delay:.1f}s"
@@ -262,18 +403,107 @@ class LLMClient:
             model=self._model,
         )
 
-    def _sanitize_prompt(self, prompt: CacheablePrompt) -> CacheablePrompt:
-        """Enforce size limits and sanitize prompt content."""
+    async def _wait_for_prefix_warmup(self, prompt: CacheablePrompt) -> bytes | None:
+        """
+        With warm_prefix_cache, hold calls whose cacheable prefix is already
+        being sent by an in-flight call until that call finishes.
+
+        Concurrent requests with the same prefix would each miss the
+        provider's cache and pay to write it; letting one go first turns
+        the rest into cache reads. Returns the prefix key when this call is
+        the one that goes first (pass it to _finish_prefix_warmup).
+        """
+        if not self._warm_prefix_cache:
+            return None
+        context = prompt.context if prompt.cache_context else ""
+        if len(prompt.system) + len(context) < MIN_CACHEABLE_PREFIX_CHARS:
+            return None
+        key = hashlib.sha256(
+            f"{self._model}\0{context}".encode() + _stable_digest(prompt.system)
+        ).digest()
+        leader = self._warming_prefixes.get(key)
+        if leader is not None:
+            await asyncio.shield(leader)
+            return None
+        self._warming_prefixes[key] = asyncio.get_running_loop().create_future()
+        return key
+
+    def _finish_prefix_warmup(self, key: bytes | None) -> None:
+        if key is None:
+            return
+        leader = self._warming_prefixes.pop(key, None)
+        if leader is not None and not leader.done():
+            leader.set_result(None)
+
+    def _dedup_key(
+        self, prompt: CacheablePrompt, temperature: float, max_tokens: int
+    ) -> bytes | None:
+        if self._dedup_cache_size <= 0:
+            return None
+        return hashlib.sha256(repr((
+            self._model, temperature, max_tokens,
+            _stable_digest(prompt.system), prompt.context, prompt.user_message,
+        )).encode()).digest()
+
+    def _dedup_lookup(self, key: bytes | None) -> LLMResponse | None:
+        """Return a zero-usage copy of a cached response, or None on a miss."""
+        if key is None:
+            return None
+        if key in self._dedup_cache:
+            self._dedup_cache.move_to_end(key)
+            cached = self._dedup_cache[key]
+        elif self._response_cache is not None:
+            cached = self._response_cache.get(key)
+            if cached is None:
+                return None
+            self._remember(key, cached)
+        else:
+            return None
+        return replace(
+            cached,
+            usage=TokenUsage(cache_hit=True),
+            latency_ms=0.0,
+            cached=True,
+        )
+
+    def _dedup_store(self, key: bytes | None, response: LLMResponse) -> None:
+        if key is None:
+            return
+        self._remember(key, response)
+        if self._response_cache is not None:
+            self._response_cache.put(key, response)
+
+    def _remember(self, key: bytes, response: LLMResponse) -> None:
+        self._dedup_cache[key] = response
+        self._dedup_cache.move_to_end(key)
+        if len(self._dedup_cache) > self._dedup_cache_size:
+            self._dedup_cache.popitem(last=False)
+
+    def _sanitize_prompt(self, prompt: str | CacheablePrompt) -> CacheablePrompt:
+        """
+        Enforce size limits and sanitize prompt content.
+
+        system and context may each use up to a third of max_prompt_length;
+        user_message gets whatever they leave, so a short system prompt
+        doesn't force a long message to be truncated. A plain string is
+        the whole user_message and is built straight into the result.
+        """
+        if isinstance(prompt, str):
+            return CacheablePrompt(
+                user_message=sanitize_for_prompt(prompt, max_length=self._max_prompt_length)
+            )
+        third = self._max_prompt_length // 3
+        system_cap = min(len(prompt.system), third)
+        context_cap = min(len(prompt.context), third)
         return CacheablePrompt(
-            system=sanitize_for_prompt(
-                prompt.system, max_length=self._max_prompt_length // 3
-            ),
-            context=sanitize_for_prompt(
-                prompt.context, max_length=self._max_prompt_length // 3
-            ),
+            system=_sanitize_stable(prompt.system, third),
+            context=_sanitize_stable(prompt.context, third),
             user_message=sanitize_for_prompt(
-                prompt.user_message, max_length=self._max_prompt_length // 3
+                prompt.user_message,
+                max_length=self._max_prompt_length - system_cap - context_cap,
             ),
+            cache_context=prompt.cache_context,
+            system_cache_ttl=prompt.system_cache_ttl,
         )
 
     async def _call_provider(
@@ -296,99 +526,44 @@ class LLMClient:
         self, prompt: CacheablePrompt, temperature: float, max_tokens: int
     ) -> LLMResponse:
         """Anthropic Claude with explicit prompt caching (cache_control)."""
-        system_blocks = []
-        if prompt.system:
-            system_blocks.append({
-                "type": "text",
-                "text": prompt.system,
-                "cache_control": {"type": "ephemeral"},
-            })
-        if prompt.context:
-            system_blocks.append({
-                "type": "text",
-                "text": prompt.context,
-                "cache_control": {"type": "ephemeral"},
-            })
-
-        messages = [{"role": "user", "content": prompt.user_message}]
-
-        response = await self._client.messages.create(
+        params = dict(
             model=self._model,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=system_blocks if system_blocks else None,
-            messages=messages,
-        )
-
-        usage_data = response.usage
-        cached = getattr(usage_data, "cache_read_input_tokens", 0)
-        input_tok = getattr(usage_data, "input_tokens", 0)
-        output_tok = getattr(usage_data, "output_tokens", 0)
-
-        rates = COST_RATES.get("anthropic", {})
-        cost = (
-            (input_tok - cached) * rates.get("input", 0) / 1000
-            + cached * rates.get("cached", 0) / 1000
-            + output_tok * rates.get("output", 0) / 1000
+            **anthropic_request(prompt),
         )
-
+        if self._batcher is None:
+            response = await self._client.messages.create(**params)
+        else:
+            response = await self._batcher.create(self._client, params)
+        usage = anthropic_usage(response.usage, self._cost_rates)
+        if self._batcher is not None:
+            usage = replace(usage, estimated_cost_usd=usage.estimated_cost_usd * BATCH_COST_FACTOR)
         return LLMResponse(
             content=response.content[0].text,
-            usage=TokenUsage(
-                input_tokens=input_tok,
-                output_tokens=output_tok,
-                cached_input_tokens=cached,
-                estimated_cost_usd=round(cost, 6),
-                cache_hit=cached > 0,
-            ),
+            usage=usage,
             model=self._model,
             provider="anthropic",
-            cached=cached > 0,
+            cached=usage.cache_hit,
         )
 
     async def _call_openai(
         self, prompt: CacheablePrompt, temperature: float, max_tokens: int
     ) -> LLMResponse:
         """OpenAI with automatic prefix caching."""
-        messages = []
-        if prompt.system:
-            messages.append({"role": "system", "content": prompt.system})
-        if prompt.context:
-            messages.append({"role": "system", "content": prompt.context})
-        messages.append({"role": "user", "content": prompt.user_message})
-
         response = await self._client.chat.completions.create(
             model=self._model,
-            messages=messages,
+            messages=openai_messages(prompt),
             temperature=temperature,
             max_tokens=max_tokens,
         )
-
-        usage_data = response.usage
-        input_tok = usage_data.prompt_tokens if usage_data else 0
-        output_tok = usage_data.completion_tokens if usage_data else 0
-        cached = getattr(usage_data, "prompt_tokens_details", None)
-        cached_tok = getattr(cached, "cached_tokens", 0) if cached else 0
-
-        rates = COST_RATES.get("openai", {})
-        cost = (
-            (input_tok - cached_tok) * rates.get("input", 0) / 1000
-            + cached_tok * rates.get("cached", 0) / 1000
-            + output_tok * rates.get("output", 0) / 1000
-        )
-
+        usage = openai_usage(response.usage, self._cost_rates)
         return LLMResponse(
             content=response.choices[0].message.content or "",
-            usage=TokenUsage(
-                input_tokens=input_tok,
-                output_tokens=output_tok,
-                cached_input_tokens=cached_tok,
-                estimated_cost_usd=round(cost, 6),
-                cache_hit=cached_tok > 0,
-            ),
+            usage=usage,
             model=self._model,
             provider="openai",
-            cached=cached_tok > 0,
+            cached=usage.cache_hit,
         )
 
     async def _call_google(
@@ -397,14 +572,20 @@ class LLMClient:
         """Google Gemini (no explicit caching API in current SDK)."""
         full_prompt = prompt.to_flat_prompt()
 
-        response = await asyncio.to_thread(
-            self._client.generate_content,
-            full_prompt,
-            generation_config={
-                "temperature": temperature,
-                "max_output_tokens": max_tokens,
-            },
-        )
+        generation_config = {
+            "temperature": temperature,
+            "max_output_tokens": max_tokens,
+        }
+        # Native async where the SDK has it; older versions block, so use a thread
+        generate_async = getattr(self._client, "generate_content_async", None)
+        if generate_async is not None:
+            response = await generate_async(full_prompt, generation_config=generation_config)
+        else:
+            response = await asyncio.to_thread(
+                self._client.generate_content,
+                full_prompt,
+                generation_config=generation_config,
+            )
 
         input_tok = 0
         output_tok = 0
@@ -423,31 +604,37 @@ class LLMClient:
         )
 
     def _is_retryable(self, error: Exception) -> bool:
-        """Check if an error is transient and worth retrying."""
-        error_type = type(error).__name__
-        retryable_types = {
-            "RateLimitError",
-            "APITimeoutError",
-            "InternalServerError",
-            "ServiceUnavailableError",
-            "APIConnectionError",
-            "Timeout",
-            "ConnectError",
-        }
-        return error_type in retryable_types
+        """
+        Check if an error is transient and worth retrying.
+
+        Matches the provider SDK's own exception classes (subclasses
+        included), then any error carrying a retryable HTTP status, then
+        transport errors by name.
+        """
+        if isinstance(error, self._retryable_errors):
+            return True
+        if getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES:
+            return True
+        return type(error).__name__ in RETRYABLE_ERROR_NAMES
 
     def _track_usage(self, usage: TokenUsage) -> None:
         """Accumulate usage stats across calls."""
-        self._total_usage.input_tokens += usage.input_tokens
-        self._total_usage.output_tokens += usage.output_tokens
-        self._total_usage.cached_input_tokens += usage.cached_input_tokens
-        self._total_usage.total_tokens += usage.total_tokens
-        self._total_usage.estimated_cost_usd += usage.estimated_cost_usd
+        totals = self._totals
+        totals[_INPUT] += usage.input_tokens
+        totals[_OUTPUT] += usage.output_tokens
+        totals[_CACHED] += usage.cached_input_tokens
+        totals[_COST_MICRO_USD] += round(usage.estimated_cost_usd * MICRO_USD)
 
     @property
     def total_usage(self) -> TokenUsage:
-        """Cumulative token usage across all calls in this client's lifetime."""
-        return self._total_usage
+        """Cumulative token usage across all calls in this client's lifetime (a snapshot)."""
+        totals = self._totals
+        return TokenUsage(
+            input_tokens=totals[_INPUT],
+            output_tokens=totals[_OUTPUT],
+            cached_input_tokens=totals[_CACHED],
+            estimated_cost_usd=totals[_COST_MICRO_USD] / MICRO_USD,
+        )
 
     @property
     def provider(self) -> str:
@@ -458,6 +645,65 @@ class LLMClient:
         return self._model
 
 
+@functools.lru_cache(maxsize=SANITIZED_FRAGMENT_CACHE_SIZE)
+def _sanitize_stable(text: str, max_length: int) -> str:
+    """
+    sanitize_for_prompt for system/context blocks, memoized.
+
+    Those blocks repeat verbatim across the turns of a session, and a str
+    caches its own hash, so a hit costs one dict probe instead of a rescan.
+    """
+    return sanitize_for_prompt(text, max_length=max_length)
+
+
+@functools.lru_cache(maxsize=SANITIZED_FRAGMENT_CACHE_SIZE)
+def _stable_digest(text: str) -> bytes:
+    """
+    sha256 of a system prompt, memoized for the dedup and warmup keys.
+
+    The same system prompt is shared by every call of a session or round
+    table, so it is encoded and hashed once rather than on every call.
+    """
+    return hashlib.sha256(text.encode()).digest()
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """
+    Full-jitter exponential backoff, raised to the server's Retry-After.
+
+    Jitter spreads out retries from agents that hit the same rate limit
+    together, so they don't all come back at once and collide again.
+    """
+    delay = random.uniform(0, min(RETRY_BASE_DELAY * (1 << attempt), RETRY_MAX_DELAY))
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_MAX_DELAY))
+    return delay
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Seconds from the retry-after-ms / retry-after headers of an SDK error's response."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass  # HTTP-date form; fall back to our own backoff
+    return None
+
+
+def _sdk_error_classes(sdk: Any) -> tuple[type[BaseException], ...]:
+    """The transient-error classes an SDK module exports (missing ones skipped)."""
+    return tuple(
+        cls for name in _SDK_RETRYABLE_CLASSES
+        if isinstance(cls := getattr(sdk, name, None), type)
+    )
+
+
 # =============================================================================
 # FACTORY
 # =============================================================================
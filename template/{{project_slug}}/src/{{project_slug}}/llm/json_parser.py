@@ -11,44 +11,83 @@ Usage:
     data = extract_json(response.content)
     if data is None:
         # Handle parse failure
+
+The other direction -- putting records into a prompt -- goes through
+records_to_json(), which keeps the encoding compact; to_json() is the
+same encoder for a single value.
 """
 
 import json
 import logging
 import re
+from collections.abc import Iterable
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+_loads = orjson.loads if orjson is not None else json.loads
+_JSON_OPENERS = ("{", "[")
+_FENCE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+
+
+def _encode_default(o: Any) -> Any:
+    """Dataclasses as shallow field dicts (the encoder recurses into them), else str."""
+    if is_dataclass(o) and not isinstance(o, type):
+        return {f.name: getattr(o, f.name) for f in fields(o)}
+    return str(o)
+
+
+# encode() without indent runs on the C accelerator; dump()/indent fall back to pure Python
+_ENCODER = json.JSONEncoder(default=_encode_default, ensure_ascii=False)
+
 
 def extract_json(text: str) -> dict | list | None:
     """
     Extract JSON from LLM output, handling common formatting issues.
 
     Tries in order:
-      1. Direct json.loads (clean output)
+      1. Direct parse (clean output that opens with { or [)
       2. Strip markdown code fences (```json ... ```)
       3. Find first { or [ and parse from there
       4. Return None if all fail
 
+    Text with no { or [ anywhere (a refusal, plain prose) is rejected
+    without attempting any parse. Uses orjson when installed.
+
     Returns parsed JSON (dict or list) or None.
     """
     if not text or not text.strip():
         return None
 
     text = text.strip()
+    result = _extract(text) if ("{" in text or "[" in text) else None
+    if result is None:
+        logger.warning(
+            f"[JSONParser] Failed to extract JSON from LLM output ({len(text)} chars)"
+        )
+    return result
+
 
+def _extract(text: str) -> dict | list | None:
     # Try 1: Direct parse
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    if text.startswith(_JSON_OPENERS):
+        try:
+            return _loads(text)
+        except json.JSONDecodeError:
+            pass
 
     # Try 2: Strip markdown code fences
-    fence_pattern = r"```(?:json)?\s*\n?(.*?)\n?\s*```"
-    fence_match = re.search(fence_pattern, text, re.DOTALL)
+    fence_match = _FENCE.search(text)
     if fence_match:
         try:
-            return json.loads(fence_match.group(1).strip())
+            return _loads(fence_match.group(1).strip())
         except json.JSONDecodeError:
             pass
 
@@ -62,13 +101,10 @@ def extract_json(text: str) -> dict | list | None:
             continue
         candidate = text[start_idx : end_idx + 1]
         try:
-            return json.loads(candidate)
+            return _loads(candidate)
         except json.JSONDecodeError:
             pass
 
-    logger.warning(
-        f"[JSONParser] Failed to extract JSON from LLM output ({len(text)} chars)"
-    )
     return None
 
 
@@ -81,3 +117,29 @@ def extract_json_or_raise(text: str, context: str = "LLM response") -> dict | li
             f"Raw output ({len(text)} chars): {text[:200]}..."
         )
     return result
+
+
+def to_json(value: Any) -> str:
+    """
+    Compact JSON text, with orjson when installed.
+
+    Dataclasses are encoded field by field without an asdict() copy;
+    any other value JSON cannot represent is encoded as its str().
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_encode_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. an int beyond 64 bits -- the stdlib encoder takes it
+    return _ENCODER.encode(value)
+
+
+def records_to_json(records: Iterable[Any]) -> str:
+    """
+    JSON array with one compact record per line, for embedding in prompts.
+
+    Cheaper than json.dumps(indent=2): each record goes through orjson or
+    the stdlib C encoder (indent forces the pure-Python one), and no
+    input tokens are spent on indentation.
+    """
+    return "[\n" + ",\n".join(map(to_json, records)) + "\n]"
@@ -0,0 +1,89 @@
+"""
+LLM data models -- prompts, responses, and token usage.
+
+Shared by the client and the provider adapters; re-exported from
+client.py so existing imports keep working.
+"""
+
+from dataclasses import dataclass, field
+
+
+# Cost per 1K tokens (approximate, varies by model -- override via config)
+COST_RATES = {
+    "anthropic": {"input": 0.003, "cached": 0.0003, "output": 0.015},
+    "openai": {"input": 0.005, "cached": 0.0025, "output": 0.015},
+    "google": {"input": 0.0, "cached": 0.0, "output": 0.0},
+}
+
+
+@dataclass
+class CacheablePrompt:
+    """
+    Separates prompt into cacheable (stable) and dynamic parts.
+
+    The LLM client marks stable parts for provider-level caching:
+      - system: System instructions (cached -- never changes)
+      - context: Agent descriptions, user preferences, retrieved data
+        (cached only with cache_context=True -- set it when the same
+        context is reused across calls, e.g. a fixed per-session bundle)
+      - user_message: The actual request (never cached -- changes every call)
+
+    Writing a cache entry costs more than a plain input token, so context
+    that changes on every call (history, specialist output) should not get
+    a breakpoint of its own; the system prefix is still cached either way.
+
+    system_cache_ttl="1h" keeps the system entry for an hour instead of the
+    provider's 5-minute default (Anthropic; the write costs more). Worth it
+    for a prompt shared by many sessions that may each go quiet for a while.
+
+    This structure enables 85-90% token savings on the stable prefix.
+    """
+
+    system: str = ""
+    context: str = ""
+    user_message: str = ""
+    cache_context: bool = False
+    system_cache_ttl: str = ""
+
+    def to_flat_prompt(self) -> str:
+        """Flatten to a single string (for providers that don't support caching)."""
+        parts = []
+        if self.system:
+            parts.append(self.system)
+        if self.context:
+            parts.append(self.context)
+        if self.user_message:
+            parts.append(self.user_message)
+        return "\n\n".join(parts)
+
+    @property
+    def total_length(self) -> int:
+        return len(self.system) + len(self.context) + len(self.user_message)
+
+
+@dataclass(slots=True)
+class TokenUsage:
+    """Token usage tracking for a single LLM call."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    total_tokens: int = 0
+    estimated_cost_usd: float = 0.0
+    cache_hit: bool = False
+
+    def __post_init__(self):
+        self.total_tokens = self.input_tokens + self.output_tokens
+
+
+@dataclass(slots=True)
+class LLMResponse:
+    """Response from an LLM call -- drop-in compatible with existing code."""
+
+    content: str
+    usage: TokenUsage = field(default_factory=TokenUsage)
+    model: str = ""
+    provider: str = ""
+    latency_ms: float = 0.0
+    cached: bool = False
@@ -0,0 +1,168 @@
+"""
+Provider request/usage adapters shared by LLMClient.call() and .stream().
+
+Each provider gets a request builder (CacheablePrompt -> SDK kwargs), a
+usage parser (SDK usage -> TokenUsage with cost), and a streaming
+generator that yields text deltas as they are decoded.
+
+Keep this file under 200 lines.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from .models import COST_RATES, CacheablePrompt, TokenUsage
+
+
+# (input, cached input, output) USD per token
+CostRates = tuple[float, float, float]
+
+
+def per_token_rates(provider: str) -> CostRates:
+    """Resolve COST_RATES (per 1K tokens) to per-token rates, once per client."""
+    rates = COST_RATES.get(provider, {})
+    return (
+        rates.get("input", 0) / 1000,
+        rates.get("cached", 0) / 1000,
+        rates.get("output", 0) / 1000,
+    )
+
+
+def _cost(rates: CostRates, input_tok: int, cached_tok: int, output_tok: int) -> float:
+    cost_in, cost_cached, cost_out = rates
+    return round(
+        (input_tok - cached_tok) * cost_in + cached_tok * cost_cached + output_tok * cost_out,
+        6,
+    )
+
+
+# =============================================================================
+# ANTHROPIC
+# =============================================================================
+
+
+def anthropic_request(prompt: CacheablePrompt) -> dict[str, Any]:
+    """
+    Build messages.create/messages.stream kwargs with cache_control.
+
+    Blocks go most-stable first. system always ends in a breakpoint;
+    context gets a second one only when prompt.cache_context is set.
+    The system kwarg is omitted entirely when there is nothing to send.
+    """
+    kwargs: dict[str, Any] = {
+        "messages": [{"role": "user", "content": prompt.user_message}],
+    }
+    if prompt.system or prompt.context:
+        system_blocks = []
+        if prompt.system:
+            cache_control = {"type": "ephemeral"}
+            if prompt.system_cache_ttl:
+                cache_control["ttl"] = prompt.system_cache_ttl
+            system_blocks.append({
+                "type": "text",
+                "text": prompt.system,
+                "cache_control": cache_control,
+            })
+        if prompt.context:
+            context_block: dict[str, Any] = {"type": "text", "text": prompt.context}
+            if prompt.cache_context:
+                context_block["cache_control"] = {"type": "ephemeral"}
+            system_blocks.append(context_block)
+        kwargs["system"] = system_blocks
+    return kwargs
+
+
+def anthropic_usage(usage_data: Any, rates: CostRates) -> TokenUsage:
+    cached = getattr(usage_data, "cache_read_input_tokens", 0) or 0
+    written = getattr(usage_data, "cache_creation_input_tokens", 0) or 0
+    input_tok = getattr(usage_data, "input_tokens", 0) or 0
+    output_tok = getattr(usage_data, "output_tokens", 0) or 0
+    return TokenUsage(
+        input_tokens=input_tok,
+        output_tokens=output_tok,
+        cached_input_tokens=cached,
+        cache_creation_input_tokens=written,
+        estimated_cost_usd=_cost(rates, input_tok, cached, output_tok),
+        cache_hit=cached > 0,
+    )
+
+
+async def stream_anthropic(
+    client: Any,
+    model: str,
+    prompt: CacheablePrompt,
+    temperature: float,
+    max_tokens: int,
+    rates: CostRates,
+    on_usage: Callable[[TokenUsage], None],
+) -> AsyncIterator[str]:
+    """Yield text deltas; report usage once the message completes."""
+    async with client.messages.stream(
+        model=model,
+        max_tokens=max_tokens,
+        temperature=temperature,
+        **anthropic_request(prompt),
+    ) as stream:
+        async for text in stream.text_stream:
+            yield text
+        message = await stream.get_final_message()
+    on_usage(anthropic_usage(message.usage, rates))
+
+
+# =============================================================================
+# OPENAI
+# =============================================================================
+
+
+def openai_messages(prompt: CacheablePrompt) -> list[dict[str, str]]:
+    """Chat messages, stable parts first so automatic prefix caching applies."""
+    messages = []
+    if prompt.system:
+        messages.append({"role": "system", "content": prompt.system})
+    if prompt.context:
+        messages.append({"role": "system", "content": prompt.context})
+    messages.append({"role": "user", "content": prompt.user_message})
+    return messages
+
+
+def openai_usage(usage_data: Any, rates: CostRates) -> TokenUsage:
+    input_tok = usage_data.prompt_tokens if usage_data else 0
+    output_tok = usage_data.completion_tokens if usage_data else 0
+    details = getattr(usage_data, "prompt_tokens_details", None)
+    cached_tok = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+    return TokenUsage(
+        input_tokens=input_tok,
+        output_tokens=output_tok,
+        cached_input_tokens=cached_tok,
+        estimated_cost_usd=_cost(rates, input_tok, cached_tok, output_tok),
+        cache_hit=cached_tok > 0,
+    )
+
+
+async def stream_openai(
+    client: Any,
+    model: str,
+    prompt: CacheablePrompt,
+    temperature: float,
+    max_tokens: int,
+    rates: CostRates,
+    on_usage: Callable[[TokenUsage], None],
+) -> AsyncIterator[str]:
+    """Yield text deltas; usage arrives on the final (choice-less) chunk."""
+    chunks = await client.chat.completions.create(
+        model=model,
+        messages=openai_messages(prompt),
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    try:
+        async for chunk in chunks:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if getattr(chunk, "usage", None):
+                on_usage(openai_usage(chunk.usage, rates))
+    finally:
+        # Closes the HTTP response when the consumer stops early
+        await chunks.close()
@@ -0,0 +1,99 @@
+"""
+Persistent exact-match response cache -- the disk layer under LLMClient's
+in-process dedup LRU.
+
+Keys are the same SHA-256 digests the dedup cache uses; values are the
+response text plus model/provider. SQLite in WAL mode lets several worker
+processes (and restarts) share hits without blocking each other's reads.
+
+Usage:
+    client = LLMClient(response_cache_path=Path(".aiscaffold/llm_cache.db"))
+
+Keep this file under 150 lines.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key BLOB PRIMARY KEY,
+    content TEXT NOT NULL,
+    model TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+class ResponseCache:
+    """
+    SQLite-backed response store shared across processes.
+
+    Entries older than max_age_seconds are treated as misses (and dropped
+    by prune()). Failures are logged and degrade to a miss -- the cache
+    must never break an LLM call.
+    """
+
+    def __init__(self, path: Path, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS):
+        self._path = Path(path)
+        self._max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def get(self, key: bytes) -> LLMResponse | None:
+        """The stored response for key, or None if absent or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT content, model, provider, created_at FROM llm_responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("[ResponseCache] Read failed: %s", e)
+            return None
+        if row is None or time.time() - row[3] > self._max_age_seconds:
+            return None
+        return LLMResponse(content=row[0], model=row[1], provider=row[2])
+
+    def put(self, key: bytes, response: LLMResponse) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?)",
+                    (key, response.content, response.model, response.provider, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning("[ResponseCache] Write failed: %s", e)
+
+    def prune(self) -> int:
+        """Delete expired entries. Returns how many were removed."""
+        cutoff = time.time() - self._max_age_seconds
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?", (cutoff,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -8,6 +8,7 @@ Two interaction modes:
 from .round_table import RoundTable, RoundTableConfig, AgentProtocol  # noqa: F401
 from .chat_orchestrator import ChatOrchestrator, ChatConfig  # noqa: F401
 from .agent_router import AgentRouter  # noqa: F401
+from .semantic_cache import SemanticCache  # noqa: F401
 
 __all__ = [
     "RoundTable",
@@ -16,4 +17,5 @@ __all__ = [
     "ChatOrchestrator",
     "ChatConfig",
     "AgentRouter",
+    "SemanticCache",
 ]
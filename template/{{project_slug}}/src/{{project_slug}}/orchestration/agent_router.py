@@ -5,9 +5,9 @@ Used by the ChatOrchestrator to pick 1-3 relevant agents instead of
 involving all agents (which is the RoundTable's job).
 
 Routing strategies:
-  1. Domain matching: match query keywords against agent domains
+  1. Domain matching: match query words against agent domain words
   2. Trust-weighted: prefer agents with higher trust scores (when learning system is active)
-  3. Capability matching: match against agent capability tags
+  3. Capability matching: match against agent capability tags (all words present)
 
 The router is intentionally simple -- a lead agent (LLM) makes the final
 decision. This module provides candidate selection; the orchestrator decides.
@@ -15,17 +15,21 @@ decision. This module provides candidate selection; the orchestrator decides.
 Keep this file under 200 lines.
 """
 
+import heapq
 import logging
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import Any
 
+from ..agents.registry import tokenize
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_AGENTS = 3
 DEFAULT_MIN_AGENTS = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingDecision:
     """Result of agent routing -- which agents to consult and why."""
 
@@ -80,7 +84,7 @@ class AgentRouter:
         all_entries = self._registry.get_all_entries()
         scored: list[tuple[float, Any, str]] = []
 
-        query_lower = query.lower()
+        query_tokens = tokenize(query)
 
         for entry in all_entries:
             if not entry.healthy:
@@ -89,14 +93,13 @@ class AgentRouter:
             score = 0.0
             reason_parts = []
 
-            domain_words = entry.agent.domain.lower().split()
-            domain_matches = sum(1 for w in domain_words if w in query_lower)
+            domain_matches = len(query_tokens & entry.domain_tokens)
             if domain_matches > 0:
                 score += domain_matches * 0.3
                 reason_parts.append(f"domain match ({domain_matches} words)")
 
-            for cap in entry.capabilities:
-                if cap.lower() in query_lower:
+            for cap, cap_tokens in entry.capability_tokens:
+                if cap_tokens and cap_tokens <= query_tokens:
                     score += 0.2
                     reason_parts.append(f"capability: {cap}")
 
@@ -110,9 +113,7 @@ class AgentRouter:
             reason = ", ".join(reason_parts) if reason_parts else "baseline"
             scored.append((score, entry.agent, reason))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-
-        selected = scored[: self._max_agents]
+        selected = heapq.nlargest(self._max_agents, scored, key=itemgetter(0))
 
         if len(selected) < self._min_agents:
             return RoutingDecision(
@@ -138,11 +139,12 @@ class AgentRouter:
                 "Low routing confidence -- consider full round table"
             )
 
-        logger.debug(
-            f"[AgentRouter] Selected {len(decision.selected_agents)} agents "
-            f"(confidence={confidence:.2f}): "
-            f"{[a.name for a in decision.selected_agents]}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[AgentRouter] Selected %d agents (confidence=%.2f): %s",
+                len(decision.selected_agents), confidence,
+                [a.name for a in decision.selected_agents],
+            )
         return decision
 
     def route_with_llm_hint(
@@ -164,7 +166,9 @@ class AgentRouter:
         validated = []
         reasons = {}
 
-        for name in llm_suggested_agents[: self._max_agents]:
+        # dict.fromkeys drops repeated suggestions (keeping order) so an
+        # agent the LLM named twice isn't consulted twice
+        for name in dict.fromkeys(llm_suggested_agents[: self._max_agents]):
             agent = self._registry.get(name)
             if agent is not None:
                 validated.append(agent)
@@ -173,13 +177,13 @@ class AgentRouter:
         if len(validated) < self._min_agents:
             fallback = self.route(query, trust_scores)
             for agent in fallback.selected_agents:
+                if len(validated) >= self._max_agents:
+                    break
                 if agent.name not in reasons:
                     validated.append(agent)
                     reasons[agent.name] = fallback.reasons.get(
                         agent.name, "fallback"
                     )
-                if len(validated) >= self._max_agents:
-                    break
 
         confidence = 0.8 if len(validated) >= self._min_agents else 0.3
 
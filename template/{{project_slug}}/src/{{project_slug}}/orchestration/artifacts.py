@@ -0,0 +1,88 @@
+"""
+ArtifactWriter -- Round table results on disk, written off the event loop.
+
+Each run gets {artifacts_dir}/{task_id}/trace.ndjson: one line per phase
+result, {"phase": ..., "ts": ..., "data": ...}, appended in phase order
+through a single open file. legacy=True keeps the older layout of one
+file per phase ({phase}.json, or {phase}.jsonl for lists).
+
+Writes run on worker threads so they overlap the next phase's LLM calls.
+A failed write is logged, never raised -- artifacts are for auditing and
+must not fail a round table that otherwise finished.
+
+Keep this file under 120 lines.
+"""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import IO, Any
+
+from ..llm.json_parser import to_json
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILENAME = "trace.ndjson"
+
+
+class ArtifactWriter:
+    """Writes one run's phase results; call write() per phase, then aclose()."""
+
+    def __init__(self, artifacts_dir: Path, task_id: str, legacy: bool = False):
+        self._dir = artifacts_dir / task_id
+        self._legacy = legacy
+        self._file: IO[str] | None = None
+        self._dir_ready = False
+        # Each write waits for the previous one, so trace lines stay in phase order
+        self._last: asyncio.Task | None = None
+
+    def write(self, phase: str, data: Any) -> None:
+        """Queue data (dataclasses, lists of them, or plain JSON values)."""
+        self._last = asyncio.create_task(self._write_after(self._last, phase, data))
+
+    async def aclose(self) -> None:
+        """Wait for queued writes and close the trace file."""
+        if self._last is not None:
+            await self._last
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+    async def _write_after(self, previous: asyncio.Task | None, phase: str, data: Any) -> None:
+        if previous is not None:
+            await previous
+        await asyncio.to_thread(self._write, phase, data)
+
+    def _write(self, phase: str, data: Any) -> None:
+        try:
+            if self._legacy:
+                self._write_phase_file(phase, data)
+                return
+            if self._file is None:
+                self._ensure_dir()
+                self._file = open(self._dir / TRACE_FILENAME, "a", encoding="utf-8")
+            self._file.write(to_json({"phase": phase, "ts": time.time(), "data": data}) + "\n")
+            self._file.flush()  # one write per event, readable while the run continues
+        except Exception as e:
+            logger.warning("[RoundTable] Artifact write failed (%s): %s", phase, e)
+
+    def _ensure_dir(self) -> None:
+        """Create the run's directory on the first write only."""
+        if not self._dir_ready:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+    def _write_phase_file(self, phase: str, data: Any) -> None:
+        """Lists go to {phase}.jsonl, one record per line; anything else to {phase}.json."""
+        self._ensure_dir()
+        is_records = isinstance(data, list)
+        path = self._dir / (f"{phase}.jsonl" if is_records else f"{phase}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            if is_records:
+                for record in data:
+                    f.write(to_json(record))
+                    f.write("\n")
+            else:
+                f.write(to_json(data))
+        logger.debug("[RoundTable] Artifact: %s", path)
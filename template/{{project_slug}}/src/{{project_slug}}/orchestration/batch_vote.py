@@ -0,0 +1,93 @@
+"""
+Batched Phase 3 voting -- one LLM call casts every agent's vote.
+
+When every agent is backed by the round table's own LLM client, N
+separate vote calls are N round trips to the same model. This asks it
+once, for one vote per agent, each judged from that agent's domain.
+
+Agents lose their individual vote prompts this way, so it is opt-in
+(RoundTableConfig.batch_votes) and RoundTable falls back to per-agent
+voting if the batched answer is unusable.
+
+Keep this file under 120 lines.
+"""
+
+import logging
+from typing import Any
+
+from ..llm import CacheablePrompt
+from ..llm.json_parser import extract_json, to_json
+from .round_table_models import AgentVote, RoundTableTask, SynthesisResult
+
+logger = logging.getLogger(__name__)
+
+MAX_FINDINGS_IN_PROMPT = 5
+
+
+def shares_llm(agents: list, llm: Any) -> bool:
+    """True if every agent calls the given LLM client (remote agents never do)."""
+    return llm is not None and all(getattr(a, "_llm", None) is llm for a in agents)
+
+
+async def batch_vote(
+    llm: Any,
+    system: str,
+    agents: list,
+    task: RoundTableTask,
+    synthesis: SynthesisResult,
+    system_cache_ttl: str = "",
+) -> list[AgentVote] | None:
+    """
+    One vote per agent, in agent order, from a single call.
+
+    Returns None if the call fails or any agent's vote is missing, so
+    the caller can fall back to asking each agent.
+    """
+    panel = "\n".join(f"- {a.name}: {a.domain}" for a in agents)
+    prompt = CacheablePrompt(
+        system=system,
+        system_cache_ttl=system_cache_ttl,
+        user_message=(
+            f"Task: {task.content}\n\n"
+            f"Recommendation: {synthesis.recommended_direction}\n"
+            f"Key findings: {to_json(synthesis.key_findings[:MAX_FINDINGS_IN_PROMPT])}\n\n"
+            f"Cast one independent vote for EACH agent below, judging only from "
+            f"that agent's domain. Dissent is valuable -- do not vote for consensus.\n"
+            f"{panel}\n\n"
+            'Return JSON: {"votes": [{"agent_name": "...", "approve": true/false, '
+            '"conditions": [...], "dissent_reason": "..."}]}'
+        ),
+    )
+    try:
+        response = await llm.call(prompt=prompt, role="vote", temperature=0.2)
+    except Exception as e:
+        logger.warning("[RoundTable] Batched vote failed: %s", e)
+        return None
+
+    data = extract_json(response.content)
+    entries = data.get("votes") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        logger.warning("[RoundTable] Batched vote returned no vote list")
+        return None
+
+    by_agent = {
+        v["agent_name"]: v
+        for v in entries
+        if isinstance(v, dict) and isinstance(v.get("agent_name"), str)
+    }
+    missing = [a.name for a in agents if a.name not in by_agent]
+    if missing:
+        logger.warning("[RoundTable] Batched vote missing agents: %s", ", ".join(missing))
+        return None
+
+    votes = []
+    for agent in agents:
+        v = by_agent[agent.name]
+        conditions = v.get("conditions")
+        votes.append(AgentVote(
+            agent_name=agent.name,
+            approve=v.get("approve") is True,
+            conditions=[str(c) for c in conditions] if isinstance(conditions, list) else [],
+            dissent_reason=v.get("dissent_reason") or None,
+        ))
+    return votes
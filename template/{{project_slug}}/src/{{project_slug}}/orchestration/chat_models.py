@@ -0,0 +1,88 @@
+"""
+Data models and configuration for the ChatOrchestrator.
+
+Re-exported from chat_orchestrator, so existing imports keep working.
+
+Keep this file under 100 lines.
+"""
+
+from dataclasses import dataclass, field
+
+from .agent_router import RoutingDecision
+
+ESCALATION_CONFLICT_THRESHOLD = 0.4
+MAX_CONSULTATION_AGENTS = 3
+MAX_HISTORY_MESSAGES = 64
+CROSS_CHECK_EXCERPT_CHARS = 2000
+SYNTHESIS_EXCERPT_CHARS = 3000
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+
+@dataclass(slots=True)
+class ConsultationResult:
+    """A single specialist's response to a consultation."""
+
+    agent_name: str
+    domain: str
+    response: str
+    evidence: list[str] = field(default_factory=list)
+    confidence: float = 0.0
+    # Prompt-sized cuts of response, taken once instead of on every prompt build
+    cross_check_excerpt: str = field(init=False, repr=False)
+    synthesis_excerpt: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.cross_check_excerpt = self.response[:CROSS_CHECK_EXCERPT_CHARS]
+        self.synthesis_excerpt = self.response[:SYNTHESIS_EXCERPT_CHARS]
+
+
+@dataclass(slots=True)
+class CrossCheckResult:
+    """Result of cross-checking specialist responses."""
+
+    agreement_level: float = 1.0
+    conflicts: list[dict] = field(default_factory=list)
+    consensus_points: list[str] = field(default_factory=list)
+    should_escalate: bool = False
+    escalation_reason: str = ""
+
+
+@dataclass(slots=True)
+class ChatResponse:
+    """Complete response from the chat orchestrator."""
+
+    content: str
+    consultations: list[ConsultationResult] = field(default_factory=list)
+    cross_check: CrossCheckResult | None = None
+    escalation_suggested: bool = False
+    escalation_reason: str = ""
+    routing_decision: RoutingDecision | None = None
+    duration_seconds: float = 0.0
+    agents_consulted: list[str] = field(default_factory=list)
+    cached: bool = False
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+
+@dataclass
+class ChatConfig:
+    """Configuration for the chat orchestrator."""
+
+    max_agents: int = MAX_CONSULTATION_AGENTS
+    enable_cross_check: bool = True
+    auto_escalate_on_conflict: bool = False
+    escalation_threshold: float = ESCALATION_CONFLICT_THRESHOLD
+    max_message_length: int = 100_000
+    # Older messages are dropped; synthesis only reads the last few anyway
+    max_history: int = MAX_HISTORY_MESSAGES
+    # The roster prompt is shared by every session on this registry
+    system_cache_ttl: str = "1h"
+    # Answer a greeting/thank-you that opens a chat without routing or the LLM
+    small_talk_fast_path: bool = True
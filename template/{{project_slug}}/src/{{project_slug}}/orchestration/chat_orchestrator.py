@@ -12,87 +12,46 @@ Token efficiency:
   - Uses CacheablePrompt so system instructions are cached across messages
   - Only consults relevant specialists (not all agents)
   - Single synthesis pass (vs round table's 4 phases)
+  - Optional SemanticCache skips synthesis for paraphrased repeat questions
+  - A bare greeting/thank-you opening a chat gets a canned reply (no LLM call)
 
 Security:
   - All specialist responses sanitized before synthesis
   - Input validated and size-limited
   - Same prompt injection defense as round table
 
-Keep this file under 400 lines.
+Keep this file under 550 lines.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime
+import time
+from collections import deque
 from typing import Any
 
-from ..llm import CacheablePrompt, LLMClient
+from ..llm import CacheablePrompt, LLMClient, LLMResponse
+from ..llm.json_parser import records_to_json, to_json
 from ..security.prompt_guard import sanitize_for_prompt
 from .agent_router import AgentRouter, RoutingDecision
+from .chat_models import (  # noqa: F401 -- re-exported
+    ESCALATION_CONFLICT_THRESHOLD,
+    MAX_CONSULTATION_AGENTS,
+    ChatConfig,
+    ChatResponse,
+    ConsultationResult,
+    CrossCheckResult,
+)
+from .semantic_cache import SemanticCache
+from .small_talk import small_talk_reply
 
 logger = logging.getLogger(__name__)
 
-ESCALATION_CONFLICT_THRESHOLD = 0.4
-MAX_CONSULTATION_AGENTS = 3
-
-
-# =============================================================================
-# DATA MODELS
-# =============================================================================
-
-
-@dataclass
-class ConsultationResult:
-    """A single specialist's response to a consultation."""
-
-    agent_name: str
-    domain: str
-    response: str
-    evidence: list[str] = field(default_factory=list)
-    confidence: float = 0.0
-
-
-@dataclass
-class CrossCheckResult:
-    """Result of cross-checking specialist responses."""
-
-    agreement_level: float = 1.0
-    conflicts: list[dict] = field(default_factory=list)
-    consensus_points: list[str] = field(default_factory=list)
-    should_escalate: bool = False
-    escalation_reason: str = ""
-
-
-@dataclass
-class ChatResponse:
-    """Complete response from the chat orchestrator."""
-
-    content: str
-    consultations: list[ConsultationResult] = field(default_factory=list)
-    cross_check: CrossCheckResult | None = None
-    escalation_suggested: bool = False
-    escalation_reason: str = ""
-    routing_decision: RoutingDecision | None = None
-    duration_seconds: float = 0.0
-    agents_consulted: list[str] = field(default_factory=list)
-
-
-# =============================================================================
-# CONFIGURATION
-# =============================================================================
-
-
-@dataclass
-class ChatConfig:
-    """Configuration for the chat orchestrator."""
-
-    max_agents: int = MAX_CONSULTATION_AGENTS
-    enable_cross_check: bool = True
-    auto_escalate_on_conflict: bool = False
-    escalation_threshold: float = ESCALATION_CONFLICT_THRESHOLD
-    max_message_length: int = 100_000
+SYNTHESIS_HISTORY_MESSAGES = 6
+HISTORY_LINE_CHARS = 500
+ROUTE_CACHE_SIZE = 256
+CROSS_CHECK_CACHE_SIZE = 256
 
 
 # =============================================================================
@@ -114,6 +73,11 @@ class ChatOrchestrator:
 
         if response.escalation_suggested:
             print(f"Consider round table: {response.escalation_reason}")
+
+    With a semantic_cache, a paraphrase of an earlier question routed to
+    the same specialists (with the same user context) reuses the earlier
+    answer without consulting anyone; a cross-check of specialist
+    responses identical to an earlier one is reused too.
     """
 
     def __init__(
@@ -122,25 +86,50 @@ class ChatOrchestrator:
         registry: Any = None,
         router: AgentRouter | None = None,
         config: ChatConfig | None = None,
+        semantic_cache: SemanticCache | None = None,
     ):
         self._llm = llm
+        self._semantic_cache = semantic_cache
         self._registry = registry
         self._router = router or AgentRouter(registry=registry)
         self._config = config or ChatConfig()
-        self._conversation_history: list[dict] = []
+        self._conversation_history: deque[dict] = deque(maxlen=self._config.max_history)
+        # Pre-rendered "role: content" lines for the synthesis prompt
+        self._history_lines: deque[str] = deque(maxlen=SYNTHESIS_HISTORY_MESSAGES)
+        # Caps in-flight specialist calls across concurrent chat() turns.
+        self._consult_slots = asyncio.Semaphore(self._config.max_agents)
+        # (roster fingerprint, prompt) -- rebuilt only when the roster changes
+        self._system_prompt_cache: tuple[tuple, str] | None = None
+        # Routing decisions by (healthy entries, normalized message, trust), FIFO-evicted
+        self._route_cache: dict[tuple, RoutingDecision] = {}
+        # Cross-checks by hash of the specialists' responses (semantic_cache only)
+        self._cross_check_cache: dict[bytes, CrossCheckResult] = {}
 
     def _system_prompt(self) -> str:
-        """Stable orchestrator system prompt (cached for token savings)."""
-        agent_info = ""
+        """
+        Stable orchestrator system prompt (cached for token savings).
+
+        Memoized on the healthy roster, so the text is rebuilt only when
+        an agent registers, leaves, or changes health.
+        """
+        roster: tuple = ()
         if self._registry and self._registry.count > 0:
-            agents = self._registry.get_all_entries()
-            agent_info = "Available specialists:\n" + "\n".join(
-                f"  - {e.agent.name}: {e.agent.domain}"
-                for e in agents
+            roster = tuple(
+                (e.agent.name, e.agent.domain)
+                for e in self._registry.get_all_entries()
                 if e.healthy
             )
+        cached = self._system_prompt_cache
+        if cached is not None and cached[0] == roster:
+            return cached[1]
 
-        return (
+        agent_info = ""
+        if roster:
+            agent_info = "Available specialists:\n" + "\n".join(
+                f"  - {name}: {domain}" for name, domain in roster
+            )
+
+        prompt = (
             "You are a chat orchestrator that helps users by consulting "
             "specialist agents when needed.\n\n"
             "Rules:\n"
@@ -152,6 +141,8 @@ class ChatOrchestrator:
             "- If a question is too complex for chat, suggest the round table\n\n"
             f"{agent_info}"
         )
+        self._system_prompt_cache = (roster, prompt)
+        return prompt
 
     async def chat(
         self,
@@ -170,9 +161,16 @@ class ChatOrchestrator:
         Returns:
             ChatResponse with content, consultations, and cross-check results.
         """
-        start = datetime.now()
+        start = time.perf_counter()
+
+        # A bare "hi"/"thanks" opening a chat needs neither specialists nor the LLM
+        if self._config.small_talk_fast_path and not self._conversation_history:
+            canned = small_talk_reply(message)
+            if canned is not None:
+                self._record_turn(message, canned, [])
+                return ChatResponse(content=canned, duration_seconds=time.perf_counter() - start)
 
-        routing = self._router.route(message, trust_scores=trust_scores)
+        routing = self._route(message, trust_scores)
 
         if routing.should_escalate and not routing.selected_agents:
             return ChatResponse(
@@ -185,18 +183,8 @@ class ChatOrchestrator:
                 routing_decision=routing,
             )
 
-        consultations = []
-        if routing.selected_agents:
-            consultations = await self._consult_specialists(
-                message, routing.selected_agents
-            )
-
-        cross_check = None
-        if self._config.enable_cross_check and len(consultations) > 1:
-            cross_check = await self._cross_check(consultations)
-
-        response_content = await self._synthesize(
-            message, consultations, cross_check, context
+        response_content, consultations, cross_check, cached = await self._answer_cached(
+            message, routing.selected_agents, context,
         )
 
         escalation_suggested = False
@@ -210,17 +198,8 @@ class ChatOrchestrator:
             escalation_suggested = True
             escalation_reason = escalation_reason or routing.escalation_reason
 
-        duration = (datetime.now() - start).total_seconds()
-
-        self._conversation_history.append({
-            "role": "user",
-            "content": message,
-        })
-        self._conversation_history.append({
-            "role": "assistant",
-            "content": response_content,
-            "agents_consulted": [c.agent_name for c in consultations],
-        })
+        duration = time.perf_counter() - start
+        self._record_turn(message, response_content, [c.agent_name for c in consultations])
 
         return ChatResponse(
             content=response_content,
@@ -231,70 +210,207 @@ class ChatOrchestrator:
             routing_decision=routing,
             duration_seconds=duration,
             agents_consulted=[c.agent_name for c in consultations],
+            cached=cached,
         )
 
+    def _record_turn(self, message: str, response_content: str, agents_consulted: list[str]) -> None:
+        self._conversation_history.append({
+            "role": "user",
+            "content": message,
+        })
+        self._conversation_history.append({
+            "role": "assistant",
+            "content": response_content,
+            "agents_consulted": agents_consulted,
+        })
+        self._history_lines.append(f"user: {message[:HISTORY_LINE_CHARS]}")
+        self._history_lines.append(f"assistant: {response_content[:HISTORY_LINE_CHARS]}")
+
+    def _route(
+        self, message: str, trust_scores: dict[str, float] | None
+    ) -> RoutingDecision:
+        """
+        self._router.route(), memoized for repeated messages.
+
+        The key includes the healthy registry entries, so registering,
+        unregistering, or a health change routes afresh. Cached decisions
+        are shared between responses; treat them as read-only.
+        """
+        entries: tuple = ()
+        if self._registry is not None:
+            entries = tuple(e for e in self._registry.get_all_entries() if e.healthy)
+        key = (
+            entries,
+            " ".join(message.lower().split()),
+            frozenset(trust_scores.items()) if trust_scores else None,
+        )
+        routing = self._route_cache.get(key)
+        if routing is None:
+            routing = self._router.route(message, trust_scores=trust_scores)
+            if len(self._route_cache) >= ROUTE_CACHE_SIZE:
+                del self._route_cache[next(iter(self._route_cache))]
+            self._route_cache[key] = routing
+        return routing
+
+    async def _respond(
+        self,
+        message: str,
+        consultations: list[ConsultationResult],
+        context: str,
+        check_task: asyncio.Task | None,
+    ) -> LLMResponse:
+        """
+        Synthesize speculatively while the cross-check is in flight.
+
+        The draft assumes the specialists agree (the common case), so a
+        turn costs one LLM round trip of latency rather than two. Only if
+        the cross-check finds conflicts is the answer redone with the
+        present-both-views instruction.
+        """
+        draft = await self._synthesize(message, consultations, None, context)
+        if check_task is None:
+            return draft
+        cross_check = await check_task
+        if not cross_check.conflicts:
+            return draft
+        return await self._synthesize(message, consultations, cross_check, context)
+
+    async def _answer(
+        self,
+        message: str,
+        consultations: list[ConsultationResult],
+        context: str,
+    ) -> tuple[LLMResponse, CrossCheckResult | None]:
+        """Synthesis, with the cross-check running alongside it instead of before it."""
+        check_task = None
+        if self._config.enable_cross_check and len(consultations) > 1:
+            check_task = asyncio.create_task(self._cross_check_cached(consultations))
+        try:
+            response = await self._respond(message, consultations, context, check_task)
+            cross_check = await check_task if check_task is not None else None
+        finally:
+            if check_task is not None and not check_task.done():
+                check_task.cancel()
+        return response, cross_check
+
+    async def _answer_cached(
+        self, message: str, agents: list, context: str,
+    ) -> tuple[str, list[ConsultationResult], CrossCheckResult | None, bool]:
+        """
+        Consult, cross-check and synthesize, behind the semantic cache.
+
+        Returns (content, consultations, cross_check, from_cache). The scope
+        is the routed agents plus the user context, so the lookup runs
+        before any specialist is consulted and a hit makes no LLM call.
+        Cached results are shared between responses; treat them as read-only.
+        """
+        cache = self._semantic_cache
+        vector = None
+        scope = (tuple(sorted(a.name for a in agents)), context)
+        if cache is not None:
+            try:
+                vector = await asyncio.to_thread(cache.vector, message)
+            except Exception as e:
+                logger.warning("[ChatOrchestrator] Semantic cache embed failed: %s", e)
+        if vector is not None:
+            hit = cache.lookup(scope, vector)
+            if hit is not None:
+                content, consultations, cross_check = hit
+                return content, consultations, cross_check, True
+
+        consultations = await self._consult_specialists(message, agents) if agents else []
+        response, cross_check = await self._answer(message, consultations, context)
+        # Failed/blocked calls come back as zero-usage placeholders; don't keep them
+        if vector is not None and (response.cached or response.usage.total_tokens > 0):
+            cache.store(scope, vector, (response.content, consultations, cross_check))
+        return response.content, consultations, cross_check, False
+
+    async def _cross_check_cached(self, consultations: list[ConsultationResult]) -> CrossCheckResult:
+        """
+        _cross_check(), reused for byte-identical specialist responses.
+
+        Only with a semantic_cache configured: keyed on a hash of each
+        agent's response, FIFO-evicted like the route cache.
+        """
+        if self._semantic_cache is None:
+            return await self._cross_check(consultations)
+        key = hashlib.sha256()
+        for c in sorted(consultations, key=lambda c: c.agent_name):
+            key.update(hashlib.sha256(f"{c.agent_name}\0{c.response}".encode()).digest())
+        digest = key.digest()
+        cross_check = self._cross_check_cache.get(digest)
+        if cross_check is None:
+            cross_check = await self._cross_check(consultations)
+            if len(self._cross_check_cache) >= CROSS_CHECK_CACHE_SIZE:
+                del self._cross_check_cache[next(iter(self._cross_check_cache))]
+            self._cross_check_cache[digest] = cross_check
+        return cross_check
+
     async def _consult_specialists(
         self,
         message: str,
         agents: list,
     ) -> list[ConsultationResult]:
-        """Consult selected specialists in parallel."""
+        """
+        Consult selected specialists in parallel.
+
+        Each _consult sanitizes its own result as soon as that agent
+        answers, so the post-processing for fast agents overlaps the wait
+        on slow ones. Results keep routing order.
+        """
         from ..orchestration.round_table import RoundTableTask
 
         task = RoundTableTask(
-            id=f"chat_{datetime.now().strftime('%H%M%S')}",
+            id=f"chat_{time.strftime('%H%M%S')}",
             content=message,
         )
 
-        results = await asyncio.gather(
-            *[agent.analyze(task) for agent in agents],
-            return_exceptions=True,
-        )
+        async with asyncio.TaskGroup() as group:
+            consults = [group.create_task(self._consult(agent, task)) for agent in agents]
+        return [result for c in consults if (result := c.result()) is not None]
 
-        consultations = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
+    async def _consult(self, agent: Any, task: Any) -> ConsultationResult | None:
+        """Run one specialist; None if it fails (the others still count)."""
+        async with self._consult_slots:
+            try:
+                result = await agent.analyze(task)
+            except Exception as e:
                 logger.error(
-                    f"[ChatOrchestrator] {agents[i].name} consultation failed: {result}"
+                    "[ChatOrchestrator] %s consultation failed: %s", agent.name, e
                 )
-                continue
-
-            evidence = []
-            for obs in result.observations:
-                if isinstance(obs, dict) and obs.get("evidence"):
-                    evidence.append(
-                        sanitize_for_prompt(str(obs["evidence"]), max_length=2000)
-                    )
-
-            consultations.append(ConsultationResult(
-                agent_name=result.agent_name,
-                domain=result.domain,
-                response=sanitize_for_prompt(
-                    json.dumps(result.observations, default=str),
-                    max_length=10_000,
-                ),
-                evidence=evidence,
-                confidence=result.confidence,
-            ))
+                return None
 
-        return consultations
+        evidence = []
+        for obs in result.observations:
+            if isinstance(obs, dict) and obs.get("evidence"):
+                evidence.append(
+                    sanitize_for_prompt(str(obs["evidence"]), max_length=2000)
+                )
+
+        return ConsultationResult(
+            agent_name=result.agent_name,
+            domain=result.domain,
+            response=sanitize_for_prompt(
+                to_json(result.observations),
+                max_length=10_000,
+            ),
+            evidence=evidence,
+            confidence=result.confidence,
+        )
 
     async def _cross_check(
         self,
         consultations: list[ConsultationResult],
     ) -> CrossCheckResult:
         """Cross-check specialist responses for agreement/disagreement."""
-        consultation_summary = json.dumps(
-            [
-                {
-                    "agent": c.agent_name,
-                    "domain": c.domain,
-                    "response": c.response[:2000],
-                    "confidence": c.confidence,
-                }
-                for c in consultations
-            ],
-            indent=2,
+        consultation_summary = records_to_json(
+            {
+                "agent": c.agent_name,
+                "domain": c.domain,
+                "response": c.cross_check_excerpt,
+                "confidence": c.confidence,
+            }
+            for c in consultations
         )
 
         prompt = CacheablePrompt(
@@ -342,7 +458,7 @@ class ChatOrchestrator:
         consultations: list[ConsultationResult],
         cross_check: CrossCheckResult | None,
         context: str,
-    ) -> str:
+    ) -> LLMResponse:
         """Synthesize specialist consultations into a user-facing response."""
         consultation_text = ""
         if consultations:
@@ -350,7 +466,7 @@ class ChatOrchestrator:
             for c in consultations:
                 parts.append(
                     f"[{c.agent_name} ({c.domain}, confidence: {c.confidence:.0%})]:\n"
-                    f"{c.response[:3000]}"
+                    f"{c.synthesis_excerpt}"
                 )
             consultation_text = "\n\n".join(parts)
 
@@ -362,15 +478,11 @@ class ChatOrchestrator:
                 "Do NOT pick a side without evidence."
             )
 
-        history_text = ""
-        recent = self._conversation_history[-6:]
-        if recent:
-            history_text = "\n".join(
-                f"{h['role']}: {str(h['content'])[:500]}" for h in recent
-            )
+        history_text = "\n".join(self._history_lines)
 
         prompt = CacheablePrompt(
             system=self._system_prompt(),
+            system_cache_ttl=self._config.system_cache_ttl,
             context=(
                 f"{f'User context: {context}' if context else ''}\n\n"
                 f"{f'Conversation history:{chr(10)}{history_text}' if history_text else ''}\n\n"
@@ -383,11 +495,12 @@ class ChatOrchestrator:
         response = await self._llm.call(
             prompt=prompt, role="chat_synthesis", temperature=0.4
         )
-        return response.content
+        return response
 
     def clear_history(self) -> None:
         """Clear conversation history (start fresh)."""
         self._conversation_history.clear()
+        self._history_lines.clear()
 
     @property
     def history_length(self) -> int:
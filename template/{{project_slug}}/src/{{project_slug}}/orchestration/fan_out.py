@@ -0,0 +1,34 @@
+"""
+Concurrency helpers for fanning one phase out across agents.
+
+Keep this file under 60 lines.
+"""
+
+import asyncio
+from collections.abc import Coroutine, Iterable
+from typing import Any
+
+
+async def fan_out(coros: Iterable[Coroutine[Any, Any, Any]]) -> list[Any]:
+    """
+    Run coroutines concurrently; results (or exceptions) in input order.
+
+    Same contract as gather(..., return_exceptions=True) without gather's
+    per-argument ensure_future dispatch and result-collecting callbacks.
+    If the caller is cancelled, every outstanding task is cancelled too.
+    """
+    tasks = tuple(map(asyncio.create_task, coros))
+    if not tasks:
+        return []
+    try:
+        await asyncio.wait(tasks)
+    except asyncio.CancelledError:
+        for t in tasks:
+            t.cancel()
+        raise
+    return [task_error(t) or t.result() for t in tasks]
+
+
+def task_error(task: asyncio.Task) -> BaseException | None:
+    """A finished task's exception (CancelledError if cancelled), else None."""
+    return asyncio.CancelledError() if task.cancelled() else task.exception()
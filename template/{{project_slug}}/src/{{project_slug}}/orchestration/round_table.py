@@ -15,167 +15,50 @@ Key design principles from 2026 research:
 
 Reference: docs/REFERENCES.md
 
-Keep this file under 400 lines.
+Keep this file under 550 lines.
 """
 
 import asyncio
 import logging
-import json
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+import time
+from typing import Any
+
+from ..enforcement import EvidenceEnforcementPipeline
+from ..llm import CacheablePrompt
+from ..llm.json_parser import extract_json, records_to_json, to_json
+from .artifacts import ArtifactWriter
+from .batch_vote import batch_vote, shares_llm
+from .fan_out import fan_out, task_error
+from .round_table_models import (  # noqa: F401 -- re-exported
+    AgentAnalysis,
+    AgentProtocol,
+    AgentChallenge,
+    AgentVote,
+    Observation,
+    Recommendation,
+    RoundTableConfig,
+    RoundTableResult,
+    RoundTableTask,
+    StrategyPlan,
+    SynthesisResult,
+)
 
 logger = logging.getLogger(__name__)
 
 
-# =============================================================================
-# AGENT PROTOCOL
-# =============================================================================
-
-
-@runtime_checkable
-class AgentProtocol(Protocol):
-    """Interface any agent must implement to participate in a round table.
-
-    Example:
-        class MyAgent:
-            name = "analyst"
-            domain = "data analysis"
-
-            async def analyze(self, task): ...
-            async def challenge(self, task, other_analyses): ...
-            async def vote(self, task, synthesis): ...
-    """
-
-    @property
-    def name(self) -> str: ...
-
-    @property
-    def domain(self) -> str: ...
-
-    async def analyze(self, task: "RoundTableTask") -> "AgentAnalysis": ...
-
-    async def challenge(
-        self, task: "RoundTableTask", other_analyses: list["AgentAnalysis"]
-    ) -> "AgentChallenge": ...
-
-    async def vote(
-        self, task: "RoundTableTask", synthesis: "SynthesisResult"
-    ) -> "AgentVote": ...
-
-
-# =============================================================================
-# DATA MODELS
-# =============================================================================
-
-
-@dataclass
-class RoundTableTask:
-    """Input to a round table session."""
-
-    id: str
-    content: str
-    context: dict[str, Any] = field(default_factory=dict)
-    constraints: list[str] = field(default_factory=list)
-
-
-@dataclass
-class AgentAnalysis:
-    """Phase 1: An agent's independent analysis with evidence."""
-
-    agent_name: str
-    domain: str
-    observations: list[dict] = field(default_factory=list)
-    # Each: {"finding": str, "evidence": str, "severity": str, "confidence": float}
-    recommendations: list[dict] = field(default_factory=list)
-    # Each: {"action": str, "rationale": str, "priority": str}
-    confidence: float = 0.0
-    raw_response: str = ""  # Full LLM output preserved for audit
-
-
-@dataclass
-class AgentChallenge:
-    """Phase 2: An agent's challenges to other analyses."""
-
-    agent_name: str
-    challenges: list[dict] = field(default_factory=list)
-    # Each: {"target_agent": str, "finding_challenged": str, "counter_evidence": str}
-    concessions: list[dict] = field(default_factory=list)
-    # Each: {"target_agent": str, "finding_accepted": str, "reason": str}
-
-
-@dataclass
-class StrategyPlan:
-    """Phase 0: Orchestrator's plan before dispatching agents."""
-
-    task_decomposition: list[str] = field(default_factory=list)
-    agent_focus_areas: dict[str, str] = field(default_factory=dict)  # agent -> focus
-    anticipated_tensions: list[str] = field(default_factory=list)
-    success_criteria: list[str] = field(default_factory=list)
-    reasoning: str = ""
-
-
-@dataclass
-class SynthesisResult:
-    """Phase 3: Orchestrator's synthesis preserving ALL evidence."""
-
-    recommended_direction: str = ""
-    key_findings: list[dict] = field(default_factory=list)
-    # Each PRESERVES: agent_name, finding, evidence, confidence
-    trade_offs: list[str] = field(default_factory=list)
-    minority_views: list[dict] = field(default_factory=list)
-    # Each: {"agent_name": str, "view": str, "evidence": str}
-
-
-@dataclass
-class AgentVote:
-    """Phase 3: An agent's vote on the synthesis."""
-
-    agent_name: str
-    approve: bool = False
-    conditions: list[str] = field(default_factory=list)
-    dissent_reason: str | None = None
-
-
-@dataclass
-class RoundTableResult:
-    """Complete round table output."""
-
-    task_id: str
-    strategy: StrategyPlan | None = None
-    analyses: list[AgentAnalysis] = field(default_factory=list)
-    challenges: list[AgentChallenge] = field(default_factory=list)
-    synthesis: SynthesisResult | None = None
-    votes: list[AgentVote] = field(default_factory=list)
-    consensus_reached: bool = False
-    duration_seconds: float = 0.0
-
-    @property
-    def approval_rate(self) -> float:
-        if not self.votes:
-            return 0.0
-        return sum(1 for v in self.votes if v.approve) / len(self.votes)
-
-
-# =============================================================================
-# CONFIGURATION
-# =============================================================================
-
-
-@dataclass
-class RoundTableConfig:
-    """Configuration for a round table session."""
-
-    enable_strategy_phase: bool = True
-    enable_challenge_phase: bool = True
-    max_challenge_rounds: int = 1
-    consensus_threshold: float = 0.7  # % of agents that must approve
-    require_human_approval: bool = False  # Human gate after synthesis
-    artifacts_dir: Path = Path(".aiscaffold/artifacts")
-    write_artifacts: bool = True
-    include_core_agents: bool = True  # Auto-inject Skeptic, Quality, Evidence agents
-    enforce_evidence: bool = True  # Run evidence enforcement pipeline on Phase 1 responses
+def _obvious_consensus(analyses: list[AgentAnalysis], min_confidence: float) -> bool:
+    """Two or more confident analyses with identical, non-empty finding sets."""
+    if len(analyses) < 2 or min(a.confidence for a in analyses) < min_confidence:
+        return False
+    finding_sets = {
+        frozenset(
+            " ".join(str(obs.get("finding", "")).lower().split())
+            for obs in a.observations
+            if isinstance(obs, dict)
+        )
+        for a in analyses
+    }
+    return len(finding_sets) == 1 and bool(next(iter(finding_sets)))
 
 
 # =============================================================================
@@ -202,68 +85,117 @@ class RoundTable:
     def __init__(self, agents: list, config: RoundTableConfig, llm_client: Any = None):
         self.config = config
         self.llm = llm_client
-
+        # (agents, prompt) -- rebuilt only if the agent list changes
+        self._system_prompt_cache: tuple[tuple, str] | None = None
+        # Caps in-flight agent LLM calls so a large table stays under provider rate limits
+        self._agent_slots = asyncio.Semaphore(max(1, config.max_concurrent_agents))
+        # Built on first use; its validators hold no per-call state
+        self._evidence_pipeline: EvidenceEnforcementPipeline | None = None
+
+        core: list = []
         if config.include_core_agents:
             try:
-                from ..agents.core import get_core_agents
+                from ..agents.core import get_core_agents  # lazy: core agents import this module
                 core = get_core_agents(llm_client=llm_client)
-                core_names = {a.name for a in core}
-                user_agents = [a for a in agents if a.name not in core_names]
-                self.agents = core + user_agents
-                logger.info(
-                    f"[RoundTable] Initialized with {len(core)} core + "
-                    f"{len(user_agents)} user agents"
-                )
             except Exception as e:
                 logger.warning(f"[RoundTable] Core agents failed to load: {e}")
-                self.agents = agents
-                logger.info(f"[RoundTable] Initialized with {len(agents)} agents")
+
+        # Names key votes and focus areas: core agents win, then the first user agent
+        by_name: dict[str, Any] = {}
+        for a in (*core, *agents):
+            by_name.setdefault(a.name, a)
+        self.agents = list(by_name.values())
+        if len(self.agents) < len(core) + len(agents):
+            kept = set(map(id, self.agents))
+            logger.warning(
+                "[RoundTable] Dropped agents with duplicate or core names: %s",
+                ", ".join(a.name for a in agents if id(a) not in kept),
+            )
+        if config.include_core_agents:
+            logger.info(
+                f"[RoundTable] Initialized with {len(core)} core + "
+                f"{len(self.agents) - len(core)} user agents"
+            )
         else:
-            self.agents = agents
-            logger.info(f"[RoundTable] Initialized with {len(agents)} agents (core agents disabled)")
+            logger.info(f"[RoundTable] Initialized with {len(self.agents)} agents (core agents disabled)")
 
     async def run(self, task: RoundTableTask) -> RoundTableResult:
         """Execute the full 4-phase round table protocol."""
-        start = datetime.now()
+        start = time.perf_counter()
         result = RoundTableResult(task_id=task.id)
 
-        # Phase 0: Strategy
-        if self.config.enable_strategy_phase and self.llm:
-            logger.info("[RoundTable] Phase 0: Strategy planning")
-            result.strategy = await self._phase_strategy(task)
-            self._write_artifact(task.id, "phase0_strategy", asdict(result.strategy))
-
-        # Phase 1: Independent Analysis (PARALLEL -- separate context windows)
-        # Wire strategy focus areas into the task context so agents specialize
-        if result.strategy and result.strategy.agent_focus_areas:
-            task.context["agent_focus_areas"] = result.strategy.agent_focus_areas
-
-        logger.info(f"[RoundTable] Phase 1: Independent analysis ({len(self.agents)} agents)")
-        result.analyses = await self._phase_independent(task)
-        self._write_artifact(task.id, "phase1_analyses", [asdict(a) for a in result.analyses])
-
-        # Phase 2: Challenge
-        if self.config.enable_challenge_phase:
-            logger.info("[RoundTable] Phase 2: Cross-agent challenge")
-            result.challenges = await self._phase_challenge(task, result.analyses)
-            self._write_artifact(task.id, "phase2_challenges", [asdict(c) for c in result.challenges])
-
-        # Phase 3: Synthesis + Voting
-        logger.info("[RoundTable] Phase 3: Synthesis + voting")
-        result.synthesis = await self._phase_synthesis(task, result)
-        self._write_artifact(task.id, "phase3_synthesis", asdict(result.synthesis))
-
-        result.votes = await self._phase_voting(task, result.synthesis)
-        self._write_artifact(task.id, "phase3_votes", [asdict(v) for v in result.votes])
+        # Artifact writes run on worker threads and overlap the next phase
+        artifacts = (
+            ArtifactWriter(self.config.artifacts_dir, task.id, legacy=self.config.legacy_artifacts)
+            if self.config.write_artifacts else None
+        )
 
-        result.consensus_reached = result.approval_rate >= self.config.consensus_threshold
-        result.duration_seconds = (datetime.now() - start).total_seconds()
+        def write_artifact(phase: str, data: Any) -> None:
+            if artifacts is not None:
+                artifacts.write(phase, data)
 
-        self._write_artifact(task.id, "result_final", {
-            "consensus": result.consensus_reached,
-            "approval_rate": result.approval_rate,
-            "duration": result.duration_seconds,
-        })
+        # try/finally so a failing phase still flushes queued writes and closes the trace
+        try:
+            # Phase 0: Strategy, overlapped with Phase 1 -- only agents with
+            # needs_strategy wait for it before analyzing
+            strategy: asyncio.Task | None = None
+            if self.config.enable_strategy_phase and self.llm:
+                logger.info("[RoundTable] Phase 0: Strategy planning")
+                strategy = asyncio.create_task(self._plan_strategy(task))
+
+            # Phase 1: Independent Analysis (PARALLEL -- separate context windows)
+            pipelined = self.config.enable_challenge_phase and self.config.incremental_challenge
+            try:
+                if pipelined:
+                    logger.info(f"[RoundTable] Phase 1+2: Pipelined analysis + challenge ({len(self.agents)} agents)")
+                    result.analyses, result.challenges = await self._phase_independent_with_challenges(task, strategy)
+                else:
+                    logger.info(f"[RoundTable] Phase 1: Independent analysis ({len(self.agents)} agents)")
+                    result.analyses = await self._phase_independent(task, strategy)
+                if strategy is not None:
+                    result.strategy = await strategy
+                    write_artifact("phase0_strategy", result.strategy)
+            finally:
+                if strategy is not None:
+                    strategy.cancel()  # no-op once done
+            write_artifact("phase1_analyses", result.analyses)
+
+            # Phase 2: Challenge (skipped when Phase 1 already agrees outright)
+            min_confidence = self.config.skip_challenge_confidence
+            if (
+                self.config.enable_challenge_phase and not pipelined and min_confidence is not None
+                and _obvious_consensus(result.analyses, min_confidence)
+            ):
+                result.skipped_phase2_reason = (
+                    f"All {len(result.analyses)} analyses report the same findings "
+                    f"with confidence >= {min_confidence:.0%}"
+                )
+                logger.info(f"[RoundTable] Phase 2 skipped: {result.skipped_phase2_reason}")
+            elif self.config.enable_challenge_phase:
+                if not pipelined:
+                    logger.info("[RoundTable] Phase 2: Cross-agent challenge")
+                    result.challenges = await self._phase_challenge(task, result.analyses)
+                write_artifact("phase2_challenges", result.challenges)
+
+            # Phase 3: Synthesis + Voting
+            logger.info("[RoundTable] Phase 3: Synthesis + voting")
+            result.synthesis = await self._phase_synthesis(task, result)
+            write_artifact("phase3_synthesis", result.synthesis)
+
+            result.votes = await self._phase_voting(task, result.synthesis)
+            write_artifact("phase3_votes", result.votes)
+
+            result.consensus_reached = result.approval_rate >= self.config.consensus_threshold
+            result.duration_seconds = time.perf_counter() - start
+
+            write_artifact("result_final", {
+                "consensus": result.consensus_reached,
+                "approval_rate": result.approval_rate,
+                "duration": result.duration_seconds,
+            })
+        finally:
+            if artifacts is not None:
+                await artifacts.aclose()
 
         logger.info(
             f"[RoundTable] Complete: consensus={'YES' if result.consensus_reached else 'NO'} "
@@ -272,10 +204,19 @@ class RoundTable:
         return result
 
     def _build_system_prompt(self) -> str:
-        """Build the stable system prompt (cached across calls)."""
-        agent_info = ", ".join(f"{a.name} ({a.domain})" for a in self.agents)
-        return (
-            f"You are an orchestrator coordinating {len(self.agents)} specialist agents: "
+        """
+        Build the stable system prompt (cached across calls).
+
+        Memoized on the agent list, so strategy, synthesis and every run
+        of this table reuse one string.
+        """
+        roster = tuple(self.agents)
+        cached = self._system_prompt_cache
+        if cached is not None and cached[0] == roster:
+            return cached[1]
+        agent_info = ", ".join(f"{a.name} ({a.domain})" for a in roster)
+        prompt = (
+            f"You are an orchestrator coordinating {len(roster)} specialist agents: "
             f"{agent_info}.\n\n"
             f"Rules:\n"
             f"- Preserve ALL evidence fields from agent outputs\n"
@@ -283,13 +224,14 @@ class RoundTable:
             f"- Surface disagreements -- minority views are valuable\n"
             f"- Return valid JSON"
         )
+        self._system_prompt_cache = (roster, prompt)
+        return prompt
 
     async def _phase_strategy(self, task: RoundTableTask) -> StrategyPlan:
         """Phase 0: Orchestrator plans before dispatching."""
-        from ..llm import CacheablePrompt
-
         prompt = CacheablePrompt(
             system=self._build_system_prompt(),
+            system_cache_ttl=self.config.system_cache_ttl,
             user_message=(
                 f"Task: {task.content}\n\n"
                 f"Before dispatching the team, plan your strategy:\n"
@@ -302,8 +244,6 @@ class RoundTable:
             ),
         )
         try:
-            from ..llm.json_parser import extract_json
-
             response = await self.llm.call(prompt=prompt, role="synthesis", temperature=0.3)
             data = extract_json(response.content)
             if data is None:
@@ -324,12 +264,24 @@ class RoundTable:
                 success_criteria=["Actionable recommendations with evidence"],
             )
 
-    async def _phase_independent(self, task: RoundTableTask) -> list[AgentAnalysis]:
+    async def _plan_strategy(self, task: RoundTableTask) -> StrategyPlan:
+        """Phase 0, then wire focus areas into the task context so agents specialize."""
+        strategy = await self._phase_strategy(task)
+        if strategy.agent_focus_areas:
+            task.context["agent_focus_areas"] = strategy.agent_focus_areas
+        return strategy
+
+    async def _analyze(self, agent: Any, task: RoundTableTask, strategy: asyncio.Task | None) -> AgentAnalysis:
+        """agent.analyze, after Phase 0 unless the agent sets needs_strategy = False."""
+        if strategy is not None and getattr(agent, "needs_strategy", True):
+            await asyncio.shield(strategy)
+        return await self._gated(agent.analyze(task))
+
+    async def _phase_independent(
+        self, task: RoundTableTask, strategy: asyncio.Task | None = None
+    ) -> list[AgentAnalysis]:
         """Phase 1: All agents analyze independently and in PARALLEL."""
-        results = await asyncio.gather(
-            *[agent.analyze(task) for agent in self.agents],
-            return_exceptions=True,
-        )
+        results = await fan_out(self._analyze(agent, task, strategy) for agent in self.agents)
         analyses = []
         for i, r in enumerate(results):
             if isinstance(r, Exception):
@@ -342,51 +294,121 @@ class RoundTable:
 
         return analyses
 
+    async def _phase_independent_with_challenges(
+        self, task: RoundTableTask, strategy: asyncio.Task | None = None
+    ) -> tuple[list[AgentAnalysis], list[AgentChallenge]]:
+        """
+        Phases 1+2 pipelined (config.incremental_challenge): an agent starts
+        its challenge once its own analysis is done and at least two are in,
+        so Phase 2 no longer waits for the slowest analyst. A challenger
+        only sees the analyses available when it starts.
+        """
+        analyze_tasks = [
+            asyncio.create_task(self._analyze_one(agent, task, strategy)) for agent in self.agents
+        ]
+        position = {t: i for i, t in enumerate(analyze_tasks)}
+        analyses: dict[int, AgentAnalysis] = {}
+        challenge_tasks: dict[int, asyncio.Task] = {}
+        pending = set(analyze_tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    i = position[t]
+                    if (error := task_error(t)) is not None:
+                        logger.error(f"[RoundTable] {self.agents[i].name} failed: {error}")
+                    else:
+                        analyses[i] = t.result()
+                if len(analyses) < 2 and pending:
+                    continue
+                available = [analyses[i] for i in sorted(analyses)]
+                for i, t in enumerate(analyze_tasks):
+                    if t.done() and i not in challenge_tasks:
+                        challenge_tasks[i] = asyncio.create_task(
+                            self._gated(self.agents[i].challenge(task, available))
+                        )
+            if challenge_tasks:
+                await asyncio.wait(challenge_tasks.values())
+        except BaseException:
+            for t in (*analyze_tasks, *challenge_tasks.values()):
+                t.cancel()
+            raise
+
+        challenges = []
+        for i in sorted(challenge_tasks):
+            if (error := task_error(challenge_tasks[i])) is not None:
+                logger.error(f"[RoundTable] {self.agents[i].name} challenge failed: {error}")
+                continue
+            challenges.append(challenge_tasks[i].result())
+        return [analyses[i] for i in sorted(analyses)], challenges
+
+    async def _analyze_one(
+        self, agent: Any, task: RoundTableTask, strategy: asyncio.Task | None = None
+    ) -> AgentAnalysis:
+        analysis = await self._analyze(agent, task, strategy)
+        if self.config.enforce_evidence:
+            analysis = (await self._enforce_evidence([analysis], task))[0]
+        return analysis
+
+    async def _gated(self, coro: Any) -> Any:
+        """Await an agent call once one of config.max_concurrent_agents slots is free."""
+        try:
+            async with self._agent_slots:
+                return await coro
+        finally:
+            coro.close()  # no-op once awaited; avoids a never-awaited warning if cancelled
+
     async def _enforce_evidence(
         self, analyses: list[AgentAnalysis], task: RoundTableTask
     ) -> list[AgentAnalysis]:
-        """Run evidence enforcement pipeline on each analysis."""
+        """Run evidence enforcement pipeline on each analysis, in PARALLEL."""
         try:
-            from ..enforcement import EvidenceEnforcementPipeline
-
-            pipeline = EvidenceEnforcementPipeline(llm_client=self.llm)
-            enforced = []
-            for analysis in analyses:
-                text = json.dumps(analysis.observations, default=str)
-                result = await pipeline.validate(analysis.agent_name, text, task)
-                if result.violations:
-                    logger.info(
-                        f"[RoundTable] {analysis.agent_name}: "
-                        f"{len(result.violations)} enforcement violations "
-                        f"({result.outcome})"
-                    )
-                if result.corrected_content and result.outcome != "accepted":
-                    try:
-                        from ..llm.json_parser import extract_json
-                        corrected_data = extract_json(result.corrected_content)
-                        if corrected_data and isinstance(corrected_data, list):
-                            analysis = AgentAnalysis(
-                                agent_name=analysis.agent_name,
-                                domain=analysis.domain,
-                                observations=corrected_data,
-                                recommendations=analysis.recommendations,
-                            )
-                    except Exception:
-                        pass
-                enforced.append(analysis)
-            return enforced
+            if self._evidence_pipeline is None:
+                self._evidence_pipeline = EvidenceEnforcementPipeline(llm_client=self.llm)
+            pipeline = self._evidence_pipeline
+            texts = [to_json(a.observations) for a in analyses]
+            # Rewrites are LLM calls, so they share the agent concurrency cap
+            results = await fan_out(
+                self._gated(pipeline.validate(a.agent_name, text, task))
+                for a, text in zip(analyses, texts)
+            )
         except Exception as e:
             logger.warning(f"[RoundTable] Evidence enforcement failed: {e}")
             return analyses
 
+        enforced = []
+        for analysis, text, result in zip(analyses, texts, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"[RoundTable] Evidence enforcement failed for {analysis.agent_name}: {result}")
+                enforced.append(analysis)
+                continue
+            if result.violations:
+                logger.info(
+                    f"[RoundTable] {analysis.agent_name}: "
+                    f"{len(result.violations)} enforcement violations "
+                    f"({result.outcome})"
+                )
+            # When no rewrite sticks the pipeline returns our own text -- nothing to re-parse
+            if result.corrected_content and result.outcome != "accepted" and result.corrected_content != text:
+                try:
+                    corrected_data = extract_json(result.corrected_content)
+                    if corrected_data and isinstance(corrected_data, list):
+                        analysis = AgentAnalysis(
+                            agent_name=analysis.agent_name,
+                            domain=analysis.domain,
+                            observations=corrected_data,
+                            recommendations=analysis.recommendations,
+                        )
+                except Exception:
+                    pass
+            enforced.append(analysis)
+        return enforced
+
     async def _phase_challenge(
         self, task: RoundTableTask, analyses: list[AgentAnalysis]
     ) -> list[AgentChallenge]:
         """Phase 2: Agents challenge each other (mediated hub-and-spoke)."""
-        results = await asyncio.gather(
-            *[agent.challenge(task, analyses) for agent in self.agents],
-            return_exceptions=True,
-        )
+        results = await fan_out(self._gated(agent.challenge(task, analyses)) for agent in self.agents)
         challenges = []
         for i, r in enumerate(results):
             if isinstance(r, Exception):
@@ -395,31 +417,26 @@ class RoundTable:
             challenges.append(r)
         return challenges
 
-    async def _phase_synthesis(
-        self, task: RoundTableTask, partial: RoundTableResult
-    ) -> SynthesisResult:
+    async def _phase_synthesis(self, task: RoundTableTask, partial: RoundTableResult) -> SynthesisResult:
         """Phase 3a: Synthesize analyses. CRITICAL: preserve ALL evidence fields."""
-        from ..llm import CacheablePrompt
-
         if not self.llm:
             return SynthesisResult(recommended_direction="No LLM available for synthesis")
 
         try:
-            analyses_json = json.dumps(
-                [{"agent": a.agent_name, "domain": a.domain,
-                  "observations": a.observations, "recommendations": a.recommendations,
-                  "confidence": a.confidence} for a in partial.analyses],
-                indent=2, default=str,
+            analyses_json = records_to_json(
+                {"agent": a.agent_name, "domain": a.domain,
+                 "observations": a.observations, "recommendations": a.recommendations,
+                 "confidence": a.confidence} for a in partial.analyses
             )
         except Exception as e:
             logger.warning(f"[RoundTable] Analysis serialization failed: {e}")
-            analyses_json = json.dumps(
-                [{"agent": a.agent_name, "domain": a.domain}
-                 for a in partial.analyses], indent=2,
+            analyses_json = records_to_json(
+                {"agent": a.agent_name, "domain": a.domain} for a in partial.analyses
             )
 
         prompt = CacheablePrompt(
             system=self._build_system_prompt(),
+            system_cache_ttl=self.config.system_cache_ttl,
             context=(
                 f"Analyses from {len(partial.analyses)} agents:\n{analyses_json}"
             ),
@@ -431,8 +448,6 @@ class RoundTable:
             ),
         )
         try:
-            from ..llm.json_parser import extract_json
-
             response = await self.llm.call(prompt=prompt, role="synthesis", temperature=0.2)
 
             if not response or not response.content:
@@ -462,10 +477,14 @@ class RoundTable:
         self, task: RoundTableTask, synthesis: SynthesisResult
     ) -> list[AgentVote]:
         """Phase 3b: Agents vote on synthesis. Dissent is valuable."""
-        results = await asyncio.gather(
-            *[agent.vote(task, synthesis) for agent in self.agents],
-            return_exceptions=True,
-        )
+        if self.config.batch_votes and shares_llm(self.agents, self.llm):
+            votes = await batch_vote(
+                self.llm, self._build_system_prompt(), self.agents, task, synthesis,
+                system_cache_ttl=self.config.system_cache_ttl,
+            )
+            if votes is not None:
+                return votes
+        results = await fan_out(self._gated(agent.vote(task, synthesis)) for agent in self.agents)
         votes = []
         for i, r in enumerate(results):
             if isinstance(r, Exception):
@@ -474,17 +493,3 @@ class RoundTable:
                 continue
             votes.append(r)
         return votes
-
-    def _write_artifact(self, task_id: str, phase: str, data: Any) -> None:
-        """Write intermediate results to filesystem for auditability."""
-        if not self.config.write_artifacts:
-            return
-        artifact_dir = self.config.artifacts_dir / task_id
-        artifact_dir.mkdir(parents=True, exist_ok=True)
-        path = artifact_dir / f"{phase}.json"
-        try:
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
-            logger.debug(f"[RoundTable] Artifact: {path}")
-        except Exception as e:
-            logger.warning(f"[RoundTable] Artifact write failed: {e}")
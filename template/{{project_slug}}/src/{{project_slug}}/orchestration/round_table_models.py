@@ -0,0 +1,204 @@
+"""
+Agent protocol, data models and configuration for the RoundTable.
+
+Re-exported from round_table, so existing imports keep working.
+
+Keep this file under 200 lines.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol, TypedDict, runtime_checkable
+
+
+# =============================================================================
+# AGENT PROTOCOL
+# =============================================================================
+
+
+@runtime_checkable
+class AgentProtocol(Protocol):
+    """Interface any agent must implement to participate in a round table.
+
+    Example:
+        class MyAgent:
+            name = "analyst"
+            domain = "data analysis"
+
+            async def analyze(self, task): ...
+            async def challenge(self, task, other_analyses): ...
+            async def vote(self, task, synthesis): ...
+
+    Optional attribute needs_strategy (default True when absent): while
+    True, the round table awaits Phase 0 before calling analyze(), so
+    task.context carries the strategy's agent_focus_areas. Set it to
+    False on agents whose analyze() never reads task.context; their
+    Phase 1 call then overlaps strategy planning. It is not a protocol
+    member, so agents without it still pass isinstance() checks.
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def domain(self) -> str: ...
+
+    async def analyze(self, task: "RoundTableTask") -> "AgentAnalysis": ...
+
+    async def challenge(
+        self, task: "RoundTableTask", other_analyses: list["AgentAnalysis"]
+    ) -> "AgentChallenge": ...
+
+    async def vote(
+        self, task: "RoundTableTask", synthesis: "SynthesisResult"
+    ) -> "AgentVote": ...
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+# frozen=True below only stops field reassignment after construction. The
+# dict/list fields stay mutable (run() adds to task.context), and hashing
+# an instance raises TypeError, so don't use these as dict keys or set members.
+
+
+@dataclass(slots=True, frozen=True)
+class RoundTableTask:
+    """Input to a round table session."""
+
+    id: str
+    content: str
+    context: dict[str, Any] = field(default_factory=dict)
+    constraints: list[str] = field(default_factory=list)
+
+
+class Observation(TypedDict, total=False):
+    """Usual keys of an AgentAnalysis observation; agents may add more (kept as-is)."""
+
+    finding: str
+    evidence: str
+    severity: str
+    confidence: float
+
+
+class Recommendation(TypedDict, total=False):
+    """Usual keys of an AgentAnalysis recommendation; agents may add more."""
+
+    action: str
+    rationale: str
+    priority: str
+
+
+@dataclass(slots=True)
+class AgentAnalysis:
+    """Phase 1: An agent's independent analysis with evidence."""
+
+    agent_name: str
+    domain: str
+    # Plain dicts: extra evidence fields survive to synthesis, and they are
+    # JSON-ready for prompts and artifacts with no conversion either way
+    observations: list[Observation] = field(default_factory=list)
+    recommendations: list[Recommendation] = field(default_factory=list)
+    confidence: float = 0.0
+    raw_response: str = ""  # Full LLM output preserved for audit
+
+
+@dataclass(slots=True, frozen=True)
+class AgentChallenge:
+    """Phase 2: An agent's challenges to other analyses."""
+
+    agent_name: str
+    challenges: list[dict] = field(default_factory=list)
+    # Each: {"target_agent": str, "finding_challenged": str, "counter_evidence": str}
+    concessions: list[dict] = field(default_factory=list)
+    # Each: {"target_agent": str, "finding_accepted": str, "reason": str}
+
+
+@dataclass(slots=True)
+class StrategyPlan:
+    """Phase 0: Orchestrator's plan before dispatching agents."""
+
+    task_decomposition: list[str] = field(default_factory=list)
+    agent_focus_areas: dict[str, str] = field(default_factory=dict)  # agent -> focus
+    anticipated_tensions: list[str] = field(default_factory=list)
+    success_criteria: list[str] = field(default_factory=list)
+    reasoning: str = ""
+
+
+@dataclass(slots=True)
+class SynthesisResult:
+    """Phase 3: Orchestrator's synthesis preserving ALL evidence."""
+
+    recommended_direction: str = ""
+    key_findings: list[dict] = field(default_factory=list)
+    # Each PRESERVES: agent_name, finding, evidence, confidence
+    trade_offs: list[str] = field(default_factory=list)
+    minority_views: list[dict] = field(default_factory=list)
+    # Each: {"agent_name": str, "view": str, "evidence": str}
+
+
+@dataclass(slots=True, frozen=True)
+class AgentVote:
+    """Phase 3: An agent's vote on the synthesis."""
+
+    agent_name: str
+    approve: bool = False
+    conditions: list[str] = field(default_factory=list)
+    dissent_reason: str | None = None
+
+
+@dataclass(slots=True)
+class RoundTableResult:
+    """Complete round table output."""
+
+    task_id: str
+    strategy: StrategyPlan | None = None
+    analyses: list[AgentAnalysis] = field(default_factory=list)
+    challenges: list[AgentChallenge] = field(default_factory=list)
+    synthesis: SynthesisResult | None = None
+    votes: list[AgentVote] = field(default_factory=list)
+    consensus_reached: bool = False
+    duration_seconds: float = 0.0
+    skipped_phase2_reason: str = ""
+
+    @property
+    def approval_rate(self) -> float:
+        if not self.votes:
+            return 0.0
+        return sum(1 for v in self.votes if v.approve) / len(self.votes)
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+
+@dataclass(slots=True)
+class RoundTableConfig:
+    """Configuration for a round table session."""
+
+    enable_strategy_phase: bool = True
+    enable_challenge_phase: bool = True
+    max_challenge_rounds: int = 1
+    consensus_threshold: float = 0.7  # % of agents that must approve
+    require_human_approval: bool = False  # Human gate after synthesis
+    artifacts_dir: Path = Path(".aiscaffold/artifacts")
+    write_artifacts: bool = True
+    # One {phase}.json/.jsonl file per phase instead of a single trace.ndjson
+    legacy_artifacts: bool = False
+    include_core_agents: bool = True  # Auto-inject Skeptic, Quality, Evidence agents
+    enforce_evidence: bool = True  # Run evidence enforcement pipeline on Phase 1 responses
+    # Start each Phase 2 challenge before the slowest Phase 1 analysis lands;
+    # early challengers then see only the analyses finished so far
+    incremental_challenge: bool = False
+    # One LLM call casts every vote when all agents share the table's LLM client
+    batch_votes: bool = False
+    # Skip Phase 2 when every analysis reports the same findings at this
+    # confidence or above (None always challenges)
+    skip_challenge_confidence: float | None = 0.85
+    # Most agent LLM calls in flight at once within a phase
+    max_concurrent_agents: int = 8
+    # Phase 3 can land more than the provider's default 5 minutes after
+    # Phase 0; "1h" keeps the shared system prefix cached for the whole run
+    system_cache_ttl: str = ""
@@ -0,0 +1,113 @@
+"""
+SemanticCache -- Reuse a synthesized chat answer for a paraphrased question.
+
+The LLM client's dedup cache only catches byte-identical prompts. This
+catches "how do I speed up this query?" after "how can I make this query
+faster?": messages are embedded, and a stored answer is returned when a
+new message in the same scope is within the similarity threshold.
+
+A scope is any hashable the caller uses to keep answers apart -- the
+ChatOrchestrator uses the routed agents plus the user context, so an
+answer is only reused for the same specialists and the same user setup.
+Stored answers can be any value (the orchestrator keeps the text with
+its consultations and cross-check).
+Share one cache only among sessions allowed to see each other's answers.
+
+Usage:
+    cache = SemanticCache(embedder=EmbeddingService())
+    orchestrator = ChatOrchestrator(llm=llm, registry=registry, semantic_cache=cache)
+
+Keep this file under 150 lines.
+"""
+
+import logging
+import math
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from operator import mul
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.93
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+@dataclass(slots=True)
+class _Entry:
+    scope: Hashable
+    vector: array
+    content: Any
+    created_at: float
+
+
+class SemanticCache:
+    """
+    In-memory embedding-similarity cache with LRU eviction and a TTL.
+
+    vector() may call an embedding API or model, so callers on the event
+    loop should run it in a thread; lookup() and store() are pure Python.
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        self._embedder = embedder
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    def vector(self, text: str) -> array:
+        """Unit-length embedding of text (dot product == cosine similarity)."""
+        raw = self._embedder.embed(" ".join(text.lower().split())).embedding
+        norm = math.sqrt(sum(map(mul, raw, raw))) or 1.0
+        return array("d", (x / norm for x in raw))
+
+    def lookup(self, scope: Hashable, vector: array) -> Any | None:
+        """Best stored answer in scope at or above the threshold, else None."""
+        now = time.monotonic()
+        best_id, best_score = None, self._threshold
+        expired = []
+        for entry_id, entry in self._entries.items():
+            if now - entry.created_at > self._ttl_seconds:
+                expired.append(entry_id)
+                continue
+            if entry.scope != scope or len(entry.vector) != len(vector):
+                continue
+            score = sum(map(mul, entry.vector, vector))
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+        for entry_id in expired:
+            del self._entries[entry_id]
+
+        if best_id is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(best_id)
+        logger.debug("[SemanticCache] Hit (similarity=%.3f)", best_score)
+        return self._entries[best_id].content
+
+    def store(self, scope: Hashable, vector: array, content: Any) -> None:
+        self._entries[self._next_id] = _Entry(scope, vector, content, time.monotonic())
+        self._next_id += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,36 @@
+"""
+Canned replies for conversation openers that need no specialist or LLM.
+
+"hi" or "thanks" as the first message of a chat would otherwise cost a
+full synthesis call to produce a pleasantry. Only whole-message matches
+count -- "hi, why is my query slow?" goes through the normal path.
+
+Keep this file under 60 lines.
+"""
+
+import re
+
+_GREETING = re.compile(
+    r"(hi|hello|hey|hiya|good (morning|afternoon|evening))( there)?",
+    re.IGNORECASE,
+)
+_THANKS = re.compile(r"(thanks|thank you|thx|cheers)( a lot| so much)?", re.IGNORECASE)
+_TRAILING = " \t\r\n!.,:)"
+
+GREETING_REPLY = (
+    "Hello! Ask me anything -- I'll bring in the right specialists "
+    "when a question needs them."
+)
+THANKS_REPLY = "You're welcome! Let me know if there's anything else."
+
+
+def small_talk_reply(message: str) -> str | None:
+    """Canned reply if message is only a greeting or a thank-you, else None."""
+    text = message.strip().rstrip(_TRAILING)
+    if len(text) > 32:
+        return None
+    if _GREETING.fullmatch(text):
+        return GREETING_REPLY
+    if _THANKS.fullmatch(text):
+        return THANKS_REPLY
+    return None
@@ -9,14 +9,25 @@ Reference: docs/REFERENCES.md
 """
 
 import ipaddress
+import json
 import logging
 import re
+import socket
+from functools import lru_cache
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 ALLOWED_URL_SCHEMES = {"http", "https"}
 BLOCKED_HOSTNAMES = {"localhost", "metadata.google.internal"}
+BLOCKED_HOSTNAME_SUFFIXES = (".internal",)
+# fullmatch: "$" would also accept a trailing newline
+_IDENTIFIER_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_-]*")
 
 
 class ValidationError(ValueError):
@@ -48,7 +59,7 @@ def validate_length(
 
 def validate_identifier(value: str, field_name: str = "identifier") -> str:
     """Validate that a string is a safe identifier (alphanumeric + underscore)."""
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9_-]*$", value):
+    if not _IDENTIFIER_RE.fullmatch(value):
         raise ValidationError(
             f"{field_name} must start with a letter and contain only "
             f"letters, numbers, underscores, and hyphens"
@@ -70,18 +81,28 @@ def validate_positive_number(value: float | int, field_name: str = "number") ->
     return float(value)
 
 
-def _is_private_ip(hostname: str) -> bool:
-    """Check if a hostname or its resolved IP is private/loopback/link-local."""
-    import socket
-
-    # First check if the hostname itself is a literal IP
+@lru_cache(maxsize=1024)
+def _literal_ip_is_private(hostname: str) -> bool | None:
+    """True/False if hostname is a literal IP, None if it is a DNS name."""
+    # Literal IPv4 starts with a digit and IPv6 contains ':' -- skip the parse for DNS names
+    if not (hostname[:1].isdigit() or ":" in hostname):
+        return None
     try:
         addr = ipaddress.ip_address(hostname)
-        return addr.is_private or addr.is_loopback or addr.is_link_local
     except ValueError:
-        pass
+        return None
+    return addr.is_private or addr.is_loopback or addr.is_link_local
+
+
+def _is_private_ip(hostname: str) -> bool:
+    """Check if a hostname or its resolved IP is private/loopback/link-local."""
+    # First check if the hostname itself is a literal IP
+    is_private = _literal_ip_is_private(hostname)
+    if is_private is not None:
+        return is_private
 
-    # Resolve the hostname and check ALL resolved IPs (DNS rebinding defense)
+    # Resolve the hostname and check ALL resolved IPs (DNS rebinding defense).
+    # Never cached: a name may resolve differently on the next request.
     try:
         results = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
         for family, socktype, proto, canonname, sockaddr in results:
@@ -153,17 +174,18 @@ def validate_url(
             f"{field_name} cannot point to {hostname_lower}"
         )
 
-    if not allow_private and _is_private_ip(hostname):
+    # Suffix check first: it needs no DNS lookup
+    if not allow_private and hostname_lower.endswith(BLOCKED_HOSTNAME_SUFFIXES):
         raise ValidationError(
-            f"{field_name} cannot point to private/internal addresses"
+            f"{field_name} cannot point to internal hostnames"
         )
 
-    if not allow_private and hostname_lower.endswith(".internal"):
+    if not allow_private and _is_private_ip(hostname):
         raise ValidationError(
-            f"{field_name} cannot point to internal hostnames"
+            f"{field_name} cannot point to private/internal addresses"
         )
 
-    logger.debug(f"[Validators] URL validated: {parsed.scheme}://{hostname}")
+    logger.debug("[Validators] URL validated: %s://%s", parsed.scheme, hostname)
     return url.strip()
 
 
@@ -186,11 +208,19 @@ def validate_dict_size(
     max_size_bytes: int = 1_000_000,
 ) -> dict:
     """Validate that a serialized dict does not exceed a maximum byte size."""
-    import json
-
-    serialized = json.dumps(data, default=str)
-    if len(serialized) > max_size_bytes:
+    if _json_size(data) > max_size_bytes:
         raise ValidationError(
             f"{field_name} exceeds maximum size of {max_size_bytes} bytes"
         )
     return data
+
+
+def _json_size(data: dict) -> int:
+    """Serialized size in bytes; orjson measures its bytes without building a str."""
+    if orjson is not None:
+        try:
+            return len(orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS))
+        except orjson.JSONEncodeError:
+            pass  # e.g. an int beyond 64 bits -- measure with the stdlib encoder
+    # Count UTF-8 bytes like orjson does; ensure_ascii would inflate "é" to 6 bytes
+    return len(json.dumps(data, default=str, ensure_ascii=False).encode())